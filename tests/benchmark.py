@@ -0,0 +1,336 @@
+"""
+Benchmarks of the engine hot paths and full-game throughput.
+
+Run ``python -m tests.benchmark`` from the project root. The results are
+compared with the stored baseline and the run fails if any benchmark is
+slower than the baseline by more than the threshold, 50% by default since
+timings on a shared machine are noisy.
+
+Every search is seeded and bound by a number of playouts or samples rather
+than by time, so each round of a benchmark does the same work. The median
+of the rounds is kept, and the baseline is regenerated with
+``--update-baseline`` whenever the code it times changes.
+"""
+
+import argparse
+import gc
+import json
+import platform
+import random
+import statistics
+import sys
+from collections.abc import Callable
+from pathlib import Path
+from time import perf_counter_ns
+
+from tic_tac_toe import engine
+from tic_tac_toe.game_type.base import BaseTicTacToe
+from tic_tac_toe.game_type.blind import BlindBoard, BlindTicTacToe
+from tic_tac_toe.game_type.board import BitBoard
+from tic_tac_toe.game_type.classic import ClassicTicTacToe
+from tic_tac_toe.game_type.limited import LimitedMemoryTicTacToe
+from tic_tac_toe.player.base import PlayerSymbol
+from tic_tac_toe.player.ia import IA, IALevel
+
+SEED = 2024
+BASELINE = Path(__file__).with_name('benchmark_baseline.json')
+DEFAULT_THRESHOLD = 0.5
+
+type Benchmark = Callable[[], Callable[[], object]]
+
+
+def _random_boards(count: int) -> list[BitBoard]:
+    """
+    Build boards from random classic games stopped at a random move.
+
+    Args:
+        count (int): The number of boards.
+
+    Returns:
+        list[BitBoard]: The boards.
+    """
+    boards = []
+
+    for _ in range(count):
+        game = ClassicTicTacToe(
+            IA(PlayerSymbol.X, IALevel.EASY),
+            IA(PlayerSymbol.O, IALevel.EASY),
+        )
+        engine.run(game, max_turns=random.randint(0, 9))
+        boards.append(game.bitboard)
+
+    return boards
+
+
+def bench_check_win() -> Callable[[], object]:
+    """
+    Time BaseTicTacToe.check_win on random boards.
+    """
+    boards = _random_boards(100)
+    player = IA(PlayerSymbol.X, IALevel.EASY)
+
+    def run() -> None:
+        for board in boards:
+            BaseTicTacToe.check_win(player=player, board=board)
+
+    return run
+
+
+def bench_is_game_over() -> Callable[[], object]:
+    """
+    Time BaseTicTacToe.is_game_over on random boards.
+    """
+    boards = _random_boards(100)
+
+    def run() -> None:
+        for board in boards:
+            BaseTicTacToe.is_game_over(board=board)
+
+    return run
+
+
+def bench_check_tie() -> Callable[[], object]:
+    """
+    Time BaseTicTacToe.check_tie on random boards.
+    """
+    boards = _random_boards(100)
+
+    def run() -> None:
+        for board in boards:
+            BaseTicTacToe.check_tie(board=board)
+
+    return run
+
+
+def _bench_make_move(level: IALevel, **options) -> Benchmark:
+    """
+    Time IA.make_move of a level on random boards.
+    """
+
+    def setup() -> Callable[[], object]:
+        boards = [board for board in _random_boards(100) if not board.is_full()]
+        ia = IA(PlayerSymbol.X, level, **options)
+
+        def run() -> None:
+            for board in boards:
+                ia.make_move(board=board)
+
+        return run
+
+    return setup
+
+
+def bench_make_move_limited() -> Callable[[], object]:
+    """
+    Time the HARD IA in limited memory positions, once its table is built.
+    """
+    ia = IA(PlayerSymbol.X, IALevel.HARD)
+    memories = [(1, 5, 9, 3, 7, 2), (5,), (2, 4, 6, 8)]
+    ia.make_move(board=BitBoard(), memory=memories[0])
+
+    def run() -> None:
+        for memory in memories:
+            ia.make_move(board=BitBoard(), memory=memory)
+
+    return run
+
+
+def bench_make_move_blind() -> Callable[[], object]:
+    """
+    Time the HARD IA in a blind position, bound by its sample budget.
+    """
+    ia = IA(
+        PlayerSymbol.X,
+        IALevel.HARD,
+        node_budget=200,
+        time_budget=10.0,
+        workers=1,
+    )
+    board = BlindBoard(x=0b000_000_001, o=0b000_010_000, hidden=1)
+
+    def run() -> None:
+        ia.make_move(board=board, hide_move=True)
+
+    return run
+
+
+def _bench_games(game_class: type[BaseTicTacToe]) -> Benchmark:
+    """
+    Time full games of a variant between EASY IAs.
+    """
+
+    def setup() -> Callable[[], object]:
+        player = IA(PlayerSymbol.X, IALevel.EASY)
+        opponent = IA(PlayerSymbol.O, IALevel.EASY)
+
+        def run() -> None:
+            for _ in range(100):
+                engine.simulate(game_class, player, opponent)
+
+        return run
+
+    return setup
+
+
+BENCHMARKS: dict[str, Benchmark] = {
+    'check_win[100 boards]': bench_check_win,
+    'is_game_over[100 boards]': bench_is_game_over,
+    'check_tie[100 boards]': bench_check_tie,
+    'make_move[easy, 100 boards]': _bench_make_move(IALevel.EASY),
+    'make_move[hard, 100 boards]': _bench_make_move(IALevel.HARD),
+    'make_move[mcts 200 playouts, 100 boards]': _bench_make_move(
+        IALevel.MCTS, node_budget=200, time_budget=10.0, workers=1
+    ),
+    'make_move[hard limited, 3 positions]': bench_make_move_limited,
+    'make_move[hard blind 200 samples]': bench_make_move_blind,
+    'games[classic, 100]': _bench_games(ClassicTicTacToe),
+    'games[limited, 100]': _bench_games(LimitedMemoryTicTacToe),
+    'games[blind, 100]': _bench_games(BlindTicTacToe),
+}
+
+
+def measure(benchmark: Benchmark, number: int) -> float:
+    """
+    Time a round of a benchmark with a seeded random generator.
+
+    The benchmark is built again from the same seed and called once
+    untimed, so the searches, and the tables and trees they keep between
+    calls, are the same in every round. The garbage collector is disabled
+    while timing, as timeit does.
+
+    Args:
+        benchmark (Benchmark): Builds the function to time.
+        number (int): The calls in the round.
+
+    Returns:
+        float: The time per call, in nanoseconds.
+    """
+    random.seed(SEED)
+    run = benchmark()
+    run()
+    gc.collect()
+    gc.disable()
+
+    try:
+        start = perf_counter_ns()
+        for _ in range(number):
+            run()
+        return (perf_counter_ns() - start) / number
+    finally:
+        gc.enable()
+
+
+def measure_all(
+    benchmarks: dict[str, Benchmark],
+    repeat: int,
+    number: int,
+) -> dict[str, float]:
+    """
+    Time rounds of every benchmark, one round of each at a time.
+
+    The rounds of a benchmark are spread over the whole run, so a slow
+    spell of the machine only shifts a few of them, and the median drops
+    those.
+
+    Args:
+        benchmarks (dict[str, Benchmark]): The benchmarks, by name.
+        repeat (int): The number of timed rounds.
+        number (int): The calls per round.
+
+    Returns:
+        dict[str, float]: The median time per call of each benchmark, in
+        nanoseconds.
+    """
+    times: dict[str, list[float]] = {name: [] for name in benchmarks}
+
+    for _ in range(repeat):
+        for name, benchmark in benchmarks.items():
+            times[name].append(measure(benchmark, number))
+
+    return {name: statistics.median(rounds) for name, rounds in times.items()}
+
+
+def compare(
+    results: dict[str, float],
+    baseline: dict[str, float],
+    threshold: float,
+) -> list[str]:
+    """
+    Find the benchmarks slower than the baseline.
+
+    Args:
+        results (dict[str, float]): The nanoseconds per call of each
+            benchmark.
+        baseline (dict[str, float]): The stored nanoseconds per call.
+        threshold (float): The slowdown allowed, as a fraction.
+
+    Returns:
+        list[str]: A description of each regression.
+    """
+    regressions = []
+
+    for name, time in results.items():
+        if name not in baseline:
+            continue
+
+        ratio = time / baseline[name]
+        if ratio > 1 + threshold:
+            regressions.append(f'{name}: {ratio:.2f}x the baseline')
+
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument('--output', type=Path, default=None)
+    parser.add_argument('--baseline', type=Path, default=BASELINE)
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument('--repeat', type=int, default=7)
+    parser.add_argument('--number', type=int, default=10)
+    parser.add_argument('--filter', default='')
+    parser.add_argument(
+        '--update-baseline',
+        action='store_true',
+        help='store the results as the new baseline',
+    )
+    args = parser.parse_args()
+
+    benchmarks = {
+        name: benchmark
+        for name, benchmark in BENCHMARKS.items()
+        if args.filter in name
+    }
+    results = measure_all(benchmarks, args.repeat, args.number)
+
+    for name, time in results.items():
+        print(f'{name:<45} {time / 1_000:>12.1f} us')
+
+    report = {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'seed': SEED,
+        'results': results,
+    }
+
+    if args.output is not None:
+        args.output.write_text(json.dumps(report, indent=2) + '\n')
+
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(report, indent=2) + '\n')
+        return
+
+    if not args.baseline.exists():
+        return
+
+    baseline = json.loads(args.baseline.read_text())['results']
+    regressions = compare(results, baseline, args.threshold)
+
+    for regression in regressions:
+        print(f'Regression: {regression}')
+
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
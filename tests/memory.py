@@ -0,0 +1,188 @@
+"""
+Memory footprint of live games.
+
+Run ``python -m tests.memory`` from the project root. The bytes each game
+holds are traced for every variant, right after it starts and a few moves
+in, with players shared by all the games as a hosting process would. The
+resident memory of a process holding many games at once, 10^6 by default,
+is measured too, on Linux.
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import tracemalloc
+from pathlib import Path
+
+from tic_tac_toe.game_type.base import BaseTicTacToe
+from tic_tac_toe.game_type.blind import BlindTicTacToe
+from tic_tac_toe.game_type.classic import ClassicTicTacToe
+from tic_tac_toe.game_type.limited import LimitedMemoryTicTacToe
+from tic_tac_toe.player.base import PlayerSymbol
+from tic_tac_toe.player.human import human
+
+SEED = 2024
+VARIANTS: dict[str, type[BaseTicTacToe]] = {
+    'classic': ClassicTicTacToe,
+    'limited': LimitedMemoryTicTacToe,
+    'blind': BlindTicTacToe,
+}
+
+
+def _new_games(
+    game_class: type[BaseTicTacToe],
+    count: int,
+    moves: int,
+) -> list[BaseTicTacToe]:
+    """
+    Start games between shared players and make their first moves.
+
+    Args:
+        game_class (type[BaseTicTacToe]): The variant to play.
+        count (int): The number of games.
+        moves (int): The random moves made in each game.
+
+    Returns:
+        list[BaseTicTacToe]: The games.
+    """
+    player, opponent = human(PlayerSymbol.X), human(PlayerSymbol.O)
+    games = []
+
+    for _ in range(count):
+        game = game_class(player, opponent)
+        for _ in range(moves):
+            game.step(random.choice(game.legal_moves()))
+        games.append(game)
+
+    return games
+
+
+def bytes_per_game(
+    game_class: type[BaseTicTacToe],
+    moves: int,
+    count: int = 10_000,
+) -> float:
+    """
+    Trace the memory allocated by games.
+
+    Args:
+        game_class (type[BaseTicTacToe]): The variant to play.
+        moves (int): The random moves made in each game.
+        count (int): The number of games averaged.
+
+    Returns:
+        float: The bytes still allocated per game.
+    """
+    random.seed(SEED)
+    # Build the shared tables of the variant before tracing.
+    _new_games(game_class, 1, moves)
+    gc.collect()
+    tracemalloc.start()
+
+    try:
+        games = _new_games(game_class, count, moves)
+        allocated, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return (allocated - len(games) * 8) / count
+
+
+def resident_bytes() -> int:
+    """
+    Get the current resident memory of the process.
+
+    The peak isn't used, since allocations made before the games, e.g.
+    while tracing, would already have raised it.
+
+    Returns:
+        int: The bytes, or 0 where it can't be measured.
+    """
+    try:
+        with open('/proc/self/statm') as statm:
+            pages = int(statm.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return 0
+
+    return pages * os.sysconf('SC_PAGE_SIZE')
+
+
+def resident_per_games(
+    game_class: type[BaseTicTacToe],
+    count: int,
+    moves: int,
+) -> int:
+    """
+    Measure the resident memory taken by games held at once.
+
+    Args:
+        game_class (type[BaseTicTacToe]): The variant to play.
+        count (int): The number of games.
+        moves (int): The random moves made in each game.
+
+    Returns:
+        int: The bytes the process grew by, or 0 where it can't be measured.
+    """
+    random.seed(SEED)
+    # Build the shared tables of the variant before measuring.
+    _new_games(game_class, 1, moves)
+    gc.collect()
+    before = resident_bytes()
+    games = _new_games(game_class, count, moves)
+    after = resident_bytes()
+    del games
+
+    return after - before if after else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument(
+        '--games',
+        type=int,
+        default=1_000_000,
+        help='games held at once for the resident memory (default: 10^6)',
+    )
+    parser.add_argument('--variant', choices=VARIANTS, default='classic')
+    parser.add_argument(
+        '--moves',
+        type=int,
+        default=2,
+        help='random moves made in each held game (default: 2)',
+    )
+    parser.add_argument('--output', type=Path, default=None)
+    args = parser.parse_args()
+
+    # Measured first, so the games can't reuse memory freed by the traces.
+    resident = resident_per_games(
+        VARIANTS[args.variant], args.games, args.moves
+    )
+
+    results = {}
+    for name, game_class in VARIANTS.items():
+        for moves in (0, 4):
+            key = f'bytes_per_game[{name}, {moves} moves]'
+            results[key] = bytes_per_game(game_class, moves)
+            print(f'{key:<45} {results[key]:>12.0f} B')
+
+    if resident:
+        key = f'resident[{args.variant}, {args.games} games]'
+        results[key] = resident
+        print(f'{key:<45} {resident / 2**20:>12.1f} MiB')
+        print(f'{"resident per game":<45} {resident / args.games:>12.0f} B')
+
+    if args.output is not None:
+        report = {
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'seed': SEED,
+            'results': results,
+        }
+        args.output.write_text(json.dumps(report, indent=2) + '\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,157 @@
+"""
+The streaming analytics of recorded games and the merge of their shards.
+"""
+
+import itertools
+import random
+import unittest
+
+from tic_tac_toe.analytics import Analytics, Result, VariantSummary, _is_cycle
+from tic_tac_toe.game_type.blind import BlindTicTacToe
+from tic_tac_toe.game_type.classic import ClassicTicTacToe
+from tic_tac_toe.game_type.limited import LimitedMemoryTicTacToe
+from tic_tac_toe.player.base import PlayerSymbol
+from tic_tac_toe.player.ia import IA, IALevel
+from tic_tac_toe.record import PASS, GameRecord, Outcome, from_game
+from tic_tac_toe.setup.game import GameChoice
+
+SEED = 2024
+
+
+def played_records(games: int) -> list[GameRecord]:
+    """
+    Play random games of every variant.
+
+    Args:
+        games (int): The number of games of each variant.
+
+    Returns:
+        list[GameRecord]: The records of the games, variant after variant.
+    """
+    players = (
+        IA(PlayerSymbol.X, IALevel.EASY),
+        IA(PlayerSymbol.O, IALevel.EASY),
+    )
+    records = []
+
+    for game_class in (
+        ClassicTicTacToe,
+        LimitedMemoryTicTacToe,
+        BlindTicTacToe,
+    ):
+        for _ in range(games):
+            game = game_class(*players)
+            while not game.game_over:
+                game.step(game.request_move())
+            records.append(from_game(game))
+
+    return records
+
+
+class AnalyticsTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        random.seed(SEED)
+        cls.records = played_records(60)
+
+    def test_merge_order_does_not_change_the_report(self) -> None:
+        records = list(self.records)
+        random.Random(SEED).shuffle(records)
+        shards = [Analytics().update(records[start::3]) for start in range(3)]
+        expected = Analytics().update(self.records).report()
+
+        for order in itertools.permutations(shards):
+            with self.subTest(order=[shards.index(s) for s in order]):
+                merged = Analytics()
+                for shard in order:
+                    merged.merge(shard)
+
+                self.assertEqual(merged.report(), expected)
+
+    def test_summaries_merge_in_any_order(self) -> None:
+        records = [
+            record
+            for record in self.records
+            if record.variant is GameChoice.LIMITED
+        ]
+        first, second = (
+            VariantSummary(GameChoice.LIMITED),
+            VariantSummary(GameChoice.LIMITED),
+        )
+        for index, record in enumerate(records):
+            (first if index % 2 else second).add(record)
+
+        forward = VariantSummary(GameChoice.LIMITED)
+        forward.merge(first)
+        forward.merge(second)
+        backward = VariantSummary(GameChoice.LIMITED)
+        backward.merge(second)
+        backward.merge(first)
+
+        self.assertEqual(forward.report(), backward.report())
+        self.assertEqual(forward.games, len(records))
+
+    def test_merging_another_variant_raises(self) -> None:
+        summary = VariantSummary(GameChoice.CLASSIC)
+
+        with self.assertRaises(ValueError):
+            summary.merge(VariantSummary(GameChoice.BLIND))
+
+    def test_results_are_for_the_first_player(self) -> None:
+        summary = VariantSummary(GameChoice.BLIND)
+        summary.add(
+            GameRecord(
+                GameChoice.BLIND,
+                Outcome.O_WINS,
+                PlayerSymbol.O,
+                (5, PASS, 1, 3, 9),
+            )
+        )
+        summary.add(
+            GameRecord(
+                GameChoice.BLIND,
+                Outcome.UNFINISHED,
+                PlayerSymbol.X,
+                (PASS, 2),
+            )
+        )
+
+        self.assertEqual(summary.results, {Result.WIN: 1})
+        self.assertEqual(summary.openings, {(5, Result.WIN): 1})
+        self.assertEqual((summary.moves, summary.turns), (5, 7))
+        self.assertEqual(summary.first_player_advantage, 1.0)
+
+
+class CycleTest(unittest.TestCase):
+    def record(self, cells: tuple[int, ...]) -> GameRecord:
+        """
+        Get the record of a drawn game of the limited variant.
+
+        Args:
+            cells (tuple[int, ...]): The cells played, X first.
+
+        Returns:
+            GameRecord: The record of the game.
+        """
+        return GameRecord(
+            GameChoice.LIMITED, Outcome.DRAW, PlayerSymbol.X, cells
+        )
+
+    def test_position_repeated_three_times_is_a_cycle(self) -> None:
+        # The marks on 1 to 6 come back in the same order every six moves.
+        self.assertTrue(_is_cycle(self.record((1, 2, 3, 4, 5, 6) * 3)))
+
+    def test_position_repeated_twice_is_not_a_cycle(self) -> None:
+        self.assertFalse(_is_cycle(self.record((1, 2, 3, 4, 5, 6) * 2)))
+
+    def test_summary_counts_the_cycles(self) -> None:
+        summary = VariantSummary(GameChoice.LIMITED)
+        summary.add(self.record((1, 2, 3, 4, 5, 6) * 3))
+        summary.add(self.record((1, 2, 3, 4, 5, 6) * 2))
+
+        self.assertEqual((summary.cycles, summary.cycle_moves), (1, 18))
+        self.assertEqual(summary.report()['cycles']['rate'], 0.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+"""
+The determinized Monte Carlo search of the blind variant.
+"""
+
+import math
+import random
+import unittest
+
+from tic_tac_toe.game_type.blind import BlindBoard
+from tic_tac_toe.game_type.board import cell_bit
+from tic_tac_toe.player import determinized
+from tic_tac_toe.player.base import PlayerSymbol
+from tic_tac_toe.player.stats import SearchStats
+
+SEED = 2024
+SAMPLES = 200
+
+
+def mask(*cells: int) -> int:
+    """
+    Get the mask of some cells.
+
+    Args:
+        *cells (int): The cell numbers.
+
+    Returns:
+        int: The mask with the bit of each cell set.
+    """
+    return sum(cell_bit(cell) for cell in cells)
+
+
+class SearchTest(unittest.TestCase):
+    def test_sample_budget_bounds_the_search(self) -> None:
+        _, samples = determinized.search(
+            mask(1), mask(5), 1, math.inf, SAMPLES, SEED
+        )
+
+        self.assertEqual(samples, SAMPLES)
+
+    def test_same_seed_gives_the_same_scores(self) -> None:
+        task = (mask(1, 9), mask(5), 2, math.inf, SAMPLES)
+
+        self.assertEqual(
+            determinized.search(*task, seed=SEED),
+            determinized.search(*task, seed=SEED),
+        )
+
+    def test_playout_scores_the_end_of_the_game(self) -> None:
+        rng = random.Random(SEED)
+
+        self.assertEqual(
+            determinized.playout(mask(1, 2), mask(4, 5), 3, rng), 1.0
+        )
+        # X fills the last cell and the board is full without a line.
+        self.assertEqual(
+            determinized.playout(mask(1, 2, 6, 7), mask(3, 4, 5, 8), 9, rng),
+            0.5,
+        )
+
+
+class BestMoveTest(unittest.TestCase):
+    def setUp(self) -> None:
+        random.seed(SEED)
+
+    def best_move(self, board: BlindBoard, **kwargs) -> int:
+        """
+        Search a move for X on one process with a fixed number of samples.
+
+        Args:
+            board (BlindBoard): The board as known by X.
+            **kwargs: The other arguments of the search.
+
+        Returns:
+            int: The cell chosen.
+        """
+        return determinized.best_move(
+            board,
+            PlayerSymbol.X,
+            time_budget=math.inf,
+            workers=1,
+            sample_budget=SAMPLES,
+            **kwargs,
+        )
+
+    def test_takes_a_winning_cell(self) -> None:
+        board = BlindBoard(x=mask(1, 2), o=mask(4, 5))
+
+        self.assertEqual(self.best_move(board), 3)
+
+    def test_blocks_a_known_line(self) -> None:
+        board = BlindBoard(x=mask(1, 9), o=mask(4, 5))
+
+        self.assertEqual(self.best_move(board), 6)
+
+    def test_plays_the_only_free_cell(self) -> None:
+        board = BlindBoard(x=mask(1, 2, 6, 7), o=mask(3, 4, 5, 8))
+
+        self.assertEqual(self.best_move(board), 9)
+
+    def test_seeded_searches_choose_the_same_move(self) -> None:
+        board = BlindBoard(x=mask(5), hidden=1)
+        moves = set()
+
+        for _ in range(3):
+            random.seed(SEED)
+            moves.add(self.best_move(board))
+
+        self.assertEqual(len(moves), 1)
+
+    def test_counts_the_playouts(self) -> None:
+        board = BlindBoard(x=mask(5), o=mask(1))
+        stats = SearchStats()
+
+        self.best_move(board, stats=stats)
+
+        self.assertEqual(stats.nodes, SAMPLES * 7)
+        self.assertEqual(stats.misses, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,210 @@
+"""
+The ring buffer of moves and the undo, redo and replay of games.
+"""
+
+import random
+import unittest
+
+from tic_tac_toe import metrics
+from tic_tac_toe.game_type.blind import BlindTicTacToe
+from tic_tac_toe.game_type.classic import ClassicTicTacToe
+from tic_tac_toe.game_type.limited import LimitedMemoryTicTacToe
+from tic_tac_toe.game_type.move_log import MoveLog
+from tic_tac_toe.player.base import PlayerSymbol
+from tic_tac_toe.player.ia import IA, IALevel
+
+SEED = 2024
+
+
+def wrapped_log() -> MoveLog:
+    """
+    Build a log whose moves run past the end of its buffer.
+
+    Returns:
+        MoveLog: The log of the moves 3 to 6, in a buffer of 4 slots that
+        starts at the third one.
+    """
+    log = MoveLog(4)
+    for move in range(1, 5):
+        log.append(move)
+    log.popleft()
+    log.popleft()
+    log.append(5)
+    log.append(6)
+
+    return log
+
+
+class MoveLogTest(unittest.TestCase):
+    def test_keeps_the_moves_in_order(self) -> None:
+        log = MoveLog(3)
+        for move in range(1, 4):
+            log.append(move)
+
+        self.assertEqual(list(log), [1, 2, 3])
+        self.assertEqual(len(log), 3)
+        self.assertEqual((log[0], log[-1]), (1, 3))
+
+    def test_pops_at_both_ends(self) -> None:
+        log = MoveLog(3)
+        for move in range(1, 4):
+            log.append(move)
+
+        self.assertEqual(log.popleft(), 1)
+        self.assertEqual(log.pop(), 3)
+        self.assertEqual(list(log), [2])
+
+    def test_grows_when_full(self) -> None:
+        log = wrapped_log()
+        log.append(7)
+        log.appendleft(2)
+
+        self.assertEqual(list(log), [2, 3, 4, 5, 6, 7])
+
+    def test_empty_log_raises(self) -> None:
+        log = MoveLog(2)
+
+        with self.assertRaises(IndexError):
+            log.pop()
+        with self.assertRaises(IndexError):
+            log.popleft()
+        with self.assertRaises(IndexError):
+            log.redo()
+        with self.assertRaises(IndexError):
+            log[0]
+
+    def test_undo_and_redo_across_the_end_of_the_buffer(self) -> None:
+        log = wrapped_log()
+
+        self.assertEqual([log.pop() for _ in range(4)], [6, 5, 4, 3])
+        self.assertEqual(len(log), 0)
+        self.assertTrue(log.can_redo)
+
+        self.assertEqual([log.redo() for _ in range(4)], [3, 4, 5, 6])
+        self.assertEqual(list(log), [3, 4, 5, 6])
+        self.assertFalse(log.can_redo)
+
+    def test_appending_the_move_to_redo_keeps_the_others(self) -> None:
+        log = wrapped_log()
+        log.pop()
+        log.pop()
+
+        log.append(5)
+
+        self.assertEqual(log.peek_redo(), 6)
+        self.assertEqual(log.redo(), 6)
+
+    def test_appending_another_move_drops_the_moves_to_redo(self) -> None:
+        log = wrapped_log()
+        log.pop()
+        log.pop()
+
+        log.append(9)
+
+        self.assertFalse(log.can_redo)
+        self.assertEqual(list(log), [3, 4, 9])
+
+    def test_appendleft_drops_the_moves_to_redo(self) -> None:
+        log = wrapped_log()
+        log.pop()
+
+        log.appendleft(2)
+
+        self.assertFalse(log.can_redo)
+        self.assertEqual(list(log), [2, 3, 4, 5])
+
+    def test_clear(self) -> None:
+        log = wrapped_log()
+        log.pop()
+
+        log.clear()
+
+        self.assertEqual(list(log), [])
+        self.assertFalse(log.can_redo)
+
+
+class ReplayTest(unittest.TestCase):
+    def setUp(self) -> None:
+        random.seed(SEED)
+        self.players = (
+            IA(PlayerSymbol.X, IALevel.EASY),
+            IA(PlayerSymbol.O, IALevel.EASY),
+        )
+
+    def test_replay_returns_to_every_position(self) -> None:
+        for game_class in (ClassicTicTacToe, LimitedMemoryTicTacToe):
+            with self.subTest(game_class.__name__):
+                for _ in range(50):
+                    self.assert_replays(game_class(*self.players))
+
+    def test_replay_is_not_counted_again(self) -> None:
+        registry = metrics.Registry()
+        metrics.enable(registry)
+        self.addCleanup(metrics.disable)
+
+        for game_class in (
+            ClassicTicTacToe,
+            LimitedMemoryTicTacToe,
+            BlindTicTacToe,
+        ):
+            game = game_class(*self.players)
+            while not game.game_over:
+                game.step(game.request_move())
+            counted = registry.snapshot()
+            plies = len(game.turns)
+
+            game.replay(0)
+            game.replay(plies)
+
+            with self.subTest(game_class.__name__):
+                self.assertTrue(game.game_over)
+                self.assertEqual(registry.snapshot(), counted)
+
+    def assert_replays(self, game: ClassicTicTacToe) -> None:
+        """
+        Play a game to the end, then take every move back and make it again.
+
+        Args:
+            game (ClassicTicTacToe): The new game to play.
+        """
+        positions = [self.position(game)]
+        while not game.game_over:
+            game.step(game.request_move())
+            positions.append(self.position(game))
+
+        for ply in reversed(range(len(positions))):
+            game.replay(ply)
+            self.assertEqual(self.position(game), positions[ply])
+
+        game.replay(len(positions) - 1)
+        self.assertEqual(self.position(game), positions[-1])
+
+        with self.assertRaises(IndexError):
+            game.redo()
+
+    @staticmethod
+    def position(game: ClassicTicTacToe) -> tuple:
+        """
+        Get what a game shows of its state.
+
+        Args:
+            game (ClassicTicTacToe): The game.
+
+        Returns:
+            tuple: The marks, the winner, the player to move and the moves.
+        """
+        position = (
+            game.bitboard.x,
+            game.bitboard.o,
+            game.winner,
+            game.current_player,
+            game.history,
+        )
+        if isinstance(game, LimitedMemoryTicTacToe):
+            position += (game.memory, game.game_over)
+
+        return position
+
+
+if __name__ == '__main__':
+    unittest.main()
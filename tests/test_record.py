@@ -0,0 +1,152 @@
+"""
+The binary game records and their files.
+"""
+
+import random
+import tempfile
+import unittest
+from pathlib import Path
+
+from tic_tac_toe.game_type.blind import BlindTicTacToe
+from tic_tac_toe.game_type.classic import ClassicTicTacToe
+from tic_tac_toe.game_type.limited import LimitedMemoryTicTacToe
+from tic_tac_toe.player.base import PlayerSymbol
+from tic_tac_toe.player.ia import IA, IALevel
+from tic_tac_toe.record import (
+    PASS,
+    GameRecord,
+    Outcome,
+    RecordWriter,
+    decode,
+    encode,
+    from_game,
+    read,
+    write,
+)
+from tic_tac_toe.setup.game import GameChoice
+
+SEED = 2024
+
+RECORDS = (
+    GameRecord(
+        GameChoice.CLASSIC, Outcome.X_WINS, PlayerSymbol.X, (1, 4, 2, 5, 3)
+    ),
+    GameRecord(
+        GameChoice.CLASSIC,
+        Outcome.DRAW,
+        PlayerSymbol.O,
+        (5, 1, 9, 3, 2, 8, 7, 4, 6),
+    ),
+    GameRecord(
+        GameChoice.BLIND,
+        Outcome.O_WINS,
+        PlayerSymbol.X,
+        (PASS, 5, PASS, PASS, 1, 3, 9),
+    ),
+    GameRecord(GameChoice.LIMITED, Outcome.UNFINISHED, PlayerSymbol.O, ()),
+)
+
+
+class RecordTest(unittest.TestCase):
+    def setUp(self) -> None:
+        random.seed(SEED)
+        self.players = (
+            IA(PlayerSymbol.X, IALevel.EASY),
+            IA(PlayerSymbol.O, IALevel.EASY),
+        )
+
+    def test_encode_and_decode(self) -> None:
+        for record in RECORDS:
+            with self.subTest(record=record):
+                data = encode(record)
+
+                self.assertEqual(decode(data), (record, len(data)))
+
+    def test_classic_game_fits_in_six_bytes(self) -> None:
+        self.assertEqual(len(encode(RECORDS[1])), 6)
+
+    def test_truncated_record_raises(self) -> None:
+        with self.assertRaises(ValueError):
+            decode(encode(RECORDS[1])[:-1])
+
+    def test_write_and_read_a_file(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / 'games.rec'
+
+            with RecordWriter(path) as writer:
+                for record in RECORDS:
+                    writer.write_record(record)
+
+            self.assertEqual(writer.games, len(RECORDS))
+            self.assertEqual(tuple(read(path)), RECORDS)
+
+    def test_read_an_empty_file(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / 'games.rec'
+            path.touch()
+
+            self.assertEqual(list(read(path)), [])
+
+    def test_moves_skip_the_turns_lost(self) -> None:
+        self.assertEqual(
+            list(RECORDS[2].moves()),
+            [
+                (PlayerSymbol.O, 5),
+                (PlayerSymbol.X, 1),
+                (PlayerSymbol.O, 3),
+                (PlayerSymbol.X, 9),
+            ],
+        )
+
+    def test_games_round_trip_through_a_file(self) -> None:
+        games = []
+        for game_class in (
+            ClassicTicTacToe,
+            LimitedMemoryTicTacToe,
+            BlindTicTacToe,
+        ):
+            for _ in range(30):
+                game = game_class(*self.players)
+                while not game.game_over:
+                    game.step(game.request_move())
+                games.append(game)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / 'games.rec'
+
+            self.assertEqual(write(path, games), len(games))
+            records = list(read(path))
+
+        self.assertEqual(records, [from_game(game) for game in games])
+        for game, record in zip(games, records, strict=True):
+            self.assertEqual(
+                list(record.moves()),
+                [(move.player.symbol, move.cell) for move in game.history],
+            )
+
+    def test_lost_turns_are_recorded(self) -> None:
+        x, o = self.players
+        game = BlindTicTacToe(x, o)
+        game._current_player = x
+
+        # X loses its first turn, and both players lose one in a row at the
+        # end, which left no trace when the turns lost were inferred.
+        for move in (10, 5, 5, 1, 1, 5):
+            game.step(move)
+
+        record = from_game(game)
+
+        self.assertEqual(record.starter, PlayerSymbol.X)
+        self.assertEqual(record.cells, (PASS, 5, PASS, 1, PASS, PASS))
+        self.assertEqual(decode(encode(record))[0], record)
+
+    def test_canonical_records_of_symmetric_games_are_equal(self) -> None:
+        record = RECORDS[0]
+        # The same game mirrored left to right.
+        mirrored = record._replace(cells=(3, 6, 2, 5, 1))
+
+        self.assertEqual(record.canonical(), mirrored.canonical())
+
+
+if __name__ == '__main__':
+    unittest.main()
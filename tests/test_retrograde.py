@@ -0,0 +1,124 @@
+"""
+The retrograde solution of the limited memory variant.
+"""
+
+import random
+import unittest
+
+from tic_tac_toe.game_type.board import CELLS, BitBoard
+from tic_tac_toe.game_type.limited import LimitedMemoryTicTacToe
+from tic_tac_toe.game_type.symmetry import transforms
+from tic_tac_toe.player import retrograde
+from tic_tac_toe.player.base import PlayerSymbol
+from tic_tac_toe.player.ia import IA, IALevel
+from tic_tac_toe.player.solved import Outcome
+
+SEED = 2024
+
+
+def after(state: retrograde.State, cell: int) -> retrograde.State:
+    """
+    Get the state reached by a move.
+
+    Args:
+        state (retrograde.State): The cells in memory, oldest first.
+        cell (int): The cell of the move.
+
+    Returns:
+        retrograde.State: The cells in memory after the move.
+    """
+    if len(state) == retrograde.KEPT_MARKS:
+        state = state[1:]
+
+    return (*state, cell)
+
+
+def legal_moves(state: retrograde.State) -> list[int]:
+    """
+    Get the free cells of a state.
+
+    Args:
+        state (retrograde.State): The cells in memory, oldest first.
+
+    Returns:
+        list[int]: The cells not in memory.
+    """
+    return [cell for cell in range(1, CELLS + 1) if cell not in state]
+
+
+class RetrogradeTest(unittest.TestCase):
+    def test_start_is_won_in_13_plies(self) -> None:
+        solution = retrograde.lookup(())
+
+        self.assertEqual(solution.outcome, Outcome.WIN)
+        self.assertEqual(solution.plies, 13)
+
+    def test_moves_keep_the_outcome(self) -> None:
+        random.seed(SEED)
+        states = random.sample(sorted(retrograde.solutions()), 2_000)
+
+        for state in states:
+            solution = retrograde.lookup(state)
+            if not solution.move:
+                # The opponent just won.
+                self.assertEqual(solution.outcome, Outcome.LOSS)
+                continue
+
+            outcomes = {
+                cell: retrograde.adjudicate(after(state, cell))
+                for cell in legal_moves(state)
+            }
+            best = outcomes[solution.move]
+
+            with self.subTest(state=state):
+                match solution.outcome:
+                    case Outcome.WIN:
+                        child = retrograde.lookup(after(state, solution.move))
+
+                        self.assertEqual(best, Outcome.LOSS)
+                        self.assertEqual(child.plies, solution.plies - 1)
+                    case Outcome.LOSS:
+                        self.assertEqual(set(outcomes.values()), {Outcome.WIN})
+                    case _:
+                        self.assertEqual(best, Outcome.DRAW)
+                        self.assertNotIn(Outcome.LOSS, outcomes.values())
+
+    def test_symmetric_states_have_symmetric_solutions(self) -> None:
+        state = (1, 5, 2, 9)
+        solution = retrograde.lookup(state)
+
+        for mapping in transforms():
+            with self.subTest(mapping=mapping):
+                turned = retrograde.lookup(
+                    tuple(mapping[cell - 1] for cell in state)
+                )
+
+                self.assertEqual(
+                    turned,
+                    solution._replace(move=mapping[solution.move - 1]),
+                )
+
+    def test_perfect_players_finish_as_solved(self) -> None:
+        x = IA(PlayerSymbol.X, IALevel.HARD)
+        o = IA(PlayerSymbol.O, IALevel.HARD)
+        game = LimitedMemoryTicTacToe(x, o)
+        game._current_player = x
+
+        while not game.game_over:
+            game.step(game.request_move())
+
+        self.assertIs(game.winner, x)
+        self.assertEqual(len(game.history), 13)
+
+    def test_ia_plays_the_solution(self) -> None:
+        ia = IA(PlayerSymbol.X, IALevel.HARD)
+        memory = (1, 5, 9, 3, 7, 2)
+
+        self.assertEqual(
+            ia.make_move(board=BitBoard(), memory=memory),
+            retrograde.lookup(memory).move,
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
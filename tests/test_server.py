@@ -0,0 +1,208 @@
+"""
+Games hosted by the server between local clients.
+"""
+
+import asyncio
+import unittest
+from unittest import mock
+
+from tic_tac_toe.server import GameServer, RemotePlayer
+
+HOST = '127.0.0.1'
+# The seconds a client waits for a line before the test fails.
+TIMEOUT = 5.0
+
+
+class Client:
+    """
+    A client talking to the server over a local connection.
+    """
+
+    def __init__(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        """
+        Initializes a new instance of the Client class.
+
+        Args:
+            reader (asyncio.StreamReader): The stream of the server lines.
+            writer (asyncio.StreamWriter): The stream to the server.
+        """
+        self.reader = reader
+        self.writer = writer
+
+    async def send(self, line: str) -> None:
+        """
+        Send a line to the server.
+
+        Args:
+            line (str): The line, without the line break.
+        """
+        self.writer.write(f'{line}\n'.encode())
+        await self.writer.drain()
+
+    async def receive(self) -> str:
+        """
+        Wait for the next line of the server.
+
+        Returns:
+            str: The line, or an empty string once the server closed.
+        """
+        line = await asyncio.wait_for(self.reader.readline(), TIMEOUT)
+
+        return line.decode().strip()
+
+    async def play(self, moves: list[int]) -> list[str]:
+        """
+        Answer each turn with the next move until the game is over.
+
+        Args:
+            moves (list[int]): The cells to play, in order.
+
+        Returns:
+            list[str]: The lines received, the END line last.
+        """
+        moves = list(moves)
+        lines = []
+
+        while True:
+            line = await self.receive()
+            lines.append(line)
+
+            if line.startswith('TURN'):
+                await self.send(f'MOVE {moves.pop(0)}')
+            elif line.startswith('END') or not line:
+                return lines
+
+    async def close(self) -> None:
+        """
+        Close the connection.
+        """
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+class ServerTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.game_server = GameServer(move_timeout=TIMEOUT)
+        self.server = await self.game_server.start(HOST, 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self) -> None:
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def connect(self) -> Client:
+        """
+        Open a connection to the server.
+
+        Returns:
+            Client: The new client.
+        """
+        return Client(*await asyncio.open_connection(HOST, self.port))
+
+    async def join(self, variant: str = 'classic') -> tuple[Client, Client]:
+        """
+        Connect two clients to the same variant.
+
+        Args:
+            variant (str): The variant to join.
+
+        Returns:
+            tuple[Client, Client]: The clients playing X and O.
+        """
+        first = await self.connect()
+        await first.send(f'JOIN {variant}')
+        self.assertEqual(await first.receive(), 'WAIT')
+
+        second = await self.connect()
+        await second.send(f'JOIN {variant}')
+
+        self.assertEqual(await first.receive(), f'START X {variant}')
+        self.assertEqual(await second.receive(), f'START O {variant}')
+
+        return first, second
+
+    async def test_game_is_won_by_a_line(self) -> None:
+        x, o = await self.join()
+
+        # X takes the top row whichever player moves first.
+        x_lines, o_lines = await asyncio.gather(
+            x.play([1, 2, 3]), o.play([4, 5, 9])
+        )
+
+        self.assertEqual(x_lines[-1], 'END WIN')
+        self.assertEqual(o_lines[-1], 'END LOSS')
+        self.assertEqual(self.game_server.games_played, 1)
+
+    async def test_invalid_move_gets_another_turn(self) -> None:
+        x, o = await self.join()
+
+        # Whoever moves second first tries the cell just taken.
+        x_lines, o_lines = await asyncio.gather(
+            x.play([5, 5, 1, 2, 3]), o.play([5, 4, 9, 8])
+        )
+
+        self.assertIn('INVALID', x_lines + o_lines)
+        self.assertEqual(x_lines[-1], 'END WIN')
+        self.assertEqual(o_lines[-1], 'END LOSS')
+
+    async def test_disconnect_loses_the_game(self) -> None:
+        x, o = await self.join('limited')
+
+        await x.close()
+
+        self.assertEqual((await o.play([1, 2, 3]))[-1], 'END WIN')
+        self.assertEqual(self.game_server.games_played, 1)
+
+    async def test_disconnect_on_invalid_move_loses_the_game(self) -> None:
+        x, o = await self.join()
+        send = RemotePlayer.send
+
+        async def drop_on_invalid(player: RemotePlayer, line: str) -> None:
+            # The client is gone just as its move is rejected.
+            if line == 'INVALID':
+                player.writer.close()
+                raise ConnectionResetError('The client disconnected')
+            await send(player, line)
+
+        async def invalid_move() -> None:
+            while not (await x.receive()).startswith('TURN'):
+                pass
+            await x.send('MOVE 10')
+
+        with mock.patch.object(RemotePlayer, 'send', drop_on_invalid):
+            _, o_lines = await asyncio.gather(invalid_move(), o.play([1, 2, 3]))
+
+        self.assertEqual(o_lines[-1], 'END WIN')
+        self.assertEqual(self.game_server.games_played, 1)
+
+    async def test_waiting_client_that_left_is_not_paired(self) -> None:
+        gone = await self.connect()
+        await gone.send('JOIN blind')
+        self.assertEqual(await gone.receive(), 'WAIT')
+        await gone.close()
+        await asyncio.sleep(0.1)
+
+        x, o = await self.join('blind')
+        await asyncio.gather(x.close(), o.close())
+
+    async def test_unknown_lines_get_an_error(self) -> None:
+        client = await self.connect()
+
+        await client.send('JOIN chess')
+        self.assertTrue((await client.receive()).startswith('ERROR'))
+
+        await client.send('JOIN classic')
+        self.assertEqual(await client.receive(), 'WAIT')
+        await client.send('MOVE 1')
+        self.assertEqual(
+            await client.receive(), 'ERROR waiting for an opponent'
+        )
+        await client.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
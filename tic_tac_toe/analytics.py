@@ -0,0 +1,491 @@
+"""
+Streaming analytics over recorded games.
+
+The games are read one at a time, e.g. from record.read(), and added to
+running totals whose size doesn't depend on the number of games, so any
+number of them can be summarized. The totals of shards of the games, e.g.
+computed by worker processes, can be merged in any order.
+
+For each variant, the totals give:
+
+- the average length, in moves and in turns including the lost ones;
+- the results of the first player, who's chosen at random, so its
+  advantage over the second one;
+- the results by opening move, counted up to the symmetries of the board
+  like GameRecord.canonical();
+- in the limited variant, how often games end in a cycle, a draw by
+  repetition, found by replaying the moves.
+
+Run ``python -m tic_tac_toe.analytics games.rec [more.rec ...]`` to
+summarize record files, one worker process per file.
+"""
+
+import argparse
+from collections import Counter, deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from enum import IntEnum
+from pathlib import Path
+
+from tic_tac_toe.game_type.base import BaseTicTacToe
+from tic_tac_toe.game_type.board import CELLS
+from tic_tac_toe.game_type.limited import LimitedMemoryTicTacToe
+from tic_tac_toe.game_type.symmetry import canonical_cells
+from tic_tac_toe.player.base import PlayerSymbol
+from tic_tac_toe.record import PASS, GameRecord, Outcome, from_game, read
+from tic_tac_toe.setup.game import GameChoice
+
+# The name of each opening, by the cell its symmetries map it to.
+OPENINGS = {1: 'corner', 2: 'edge', 5: 'center'}
+
+# The canonical cell of each opening move, by cell number.
+_CANONICAL_OPENING: tuple[int, ...] = (
+    0,
+    *(canonical_cells((cell,))[0][0] for cell in range(1, CELLS + 1)),
+)
+
+
+class Result(IntEnum):
+    # The result of a finished game for the player who moved first.
+    WIN = 0
+    DRAW = 1
+    LOSS = 2
+
+
+class VariantSummary:
+    """
+    Running totals of the games of a variant.
+
+    The summaries of different shards of games can be merged in any order.
+    """
+
+    __slots__ = (
+        'variant',
+        'games',
+        'unfinished',
+        'moves',
+        'turns',
+        'results',
+        'openings',
+        'cycles',
+        'cycle_moves',
+    )
+
+    def __init__(self, variant: GameChoice) -> None:
+        """
+        Initializes a new instance of the VariantSummary class.
+
+        Args:
+            variant (GameChoice): The variant of the games.
+        """
+        self.variant = variant
+        self.games: int = 0
+        # The games stopped before the end, only counted in the lengths.
+        self.unfinished: int = 0
+        self.moves: int = 0
+        self.turns: int = 0
+        # The results of the first player, overall and by canonical opening.
+        self.results: Counter[Result] = Counter()
+        self.openings: Counter[tuple[int, Result]] = Counter()
+        # The draws by repetition of the limited variant, and their moves.
+        self.cycles: int = 0
+        self.cycle_moves: int = 0
+
+    def add(self, record: GameRecord) -> None:
+        """
+        Count a game.
+
+        Args:
+            record (GameRecord): The record of the game.
+        """
+        cells = record.cells
+        moves = len(cells) - cells.count(PASS)
+
+        self.games += 1
+        self.moves += moves
+        self.turns += len(cells)
+
+        result = _result(record)
+        if result is None:
+            self.unfinished += 1
+            return
+
+        self.results[result] += 1
+        # A game opened with a lost turn has no opening of the first player.
+        if cells and cells[0] != PASS:
+            self.openings[_CANONICAL_OPENING[cells[0]], result] += 1
+
+        if (
+            result is Result.DRAW
+            and self.variant is GameChoice.LIMITED
+            and _is_cycle(record)
+        ):
+            self.cycles += 1
+            self.cycle_moves += moves
+
+    def merge(self, other: 'VariantSummary') -> None:
+        """
+        Add the totals of other games to these.
+
+        Args:
+            other (VariantSummary): The totals to add, of the same variant.
+
+        Raises:
+            ValueError: If the totals are of another variant.
+        """
+        if other.variant is not self.variant:
+            raise ValueError(
+                f'Cannot merge {other.variant.name} games into '
+                f'{self.variant.name} ones'
+            )
+
+        self.games += other.games
+        self.unfinished += other.unfinished
+        self.moves += other.moves
+        self.turns += other.turns
+        self.results.update(other.results)
+        self.openings.update(other.openings)
+        self.cycles += other.cycles
+        self.cycle_moves += other.cycle_moves
+
+    @property
+    def finished(self) -> int:
+        """
+        Get the number of games played to the end.
+
+        Returns:
+            int: The number of games with a result.
+        """
+        return self.games - self.unfinished
+
+    @property
+    def first_player_advantage(self) -> float:
+        """
+        Get how much more often the first player wins than the second one.
+
+        Returns:
+            float: The difference of their win rates, from -1 to 1, or 0 if
+            no game was finished.
+        """
+        if not self.finished:
+            return 0.0
+
+        wins, losses = self.results[Result.WIN], self.results[Result.LOSS]
+
+        return (wins - losses) / self.finished
+
+    def report(self) -> dict:
+        """
+        Get the rates and averages of the totals.
+
+        Returns:
+            dict: The report, ready to be written as JSON.
+        """
+        games, finished = self.games, self.finished
+
+        report = {
+            'games': games,
+            'unfinished': self.unfinished,
+            'mean_moves': self.moves / games if games else 0.0,
+            'mean_turns': self.turns / games if games else 0.0,
+            'first_player': {
+                **_rates(self.results, finished),
+                'advantage': self.first_player_advantage,
+            },
+            'openings': {},
+        }
+
+        for cell, name in OPENINGS.items():
+            results = Counter(
+                {result: self.openings[cell, result] for result in Result}
+            )
+            total = results.total()
+            if total:
+                report['openings'][name] = {
+                    'games': total,
+                    **_rates(results, total),
+                }
+
+        if self.variant is GameChoice.LIMITED:
+            cycles = self.cycles
+            report['cycles'] = {
+                'games': cycles,
+                'rate': cycles / finished if finished else 0.0,
+                'mean_moves': self.cycle_moves / cycles if cycles else 0.0,
+            }
+
+        return report
+
+
+class Analytics:
+    """
+    Running totals of games of every variant.
+    """
+
+    __slots__ = ('variants',)
+
+    def __init__(self) -> None:
+        """
+        Initializes a new instance of the Analytics class.
+        """
+        self.variants: dict[GameChoice, VariantSummary] = {}
+
+    def add(self, record: GameRecord) -> None:
+        """
+        Count a game.
+
+        Args:
+            record (GameRecord): The record of the game.
+        """
+        self._summary(record.variant).add(record)
+
+    def update(self, records: Iterable[GameRecord]) -> 'Analytics':
+        """
+        Count every game of a stream, one at a time.
+
+        Args:
+            records (Iterable[GameRecord]): The records of the games.
+
+        Returns:
+            Analytics: These totals, updated.
+        """
+        for record in records:
+            self.add(record)
+
+        return self
+
+    def merge(self, other: 'Analytics') -> None:
+        """
+        Add the totals of other games to these.
+
+        Args:
+            other (Analytics): The totals to add.
+        """
+        for variant, summary in other.variants.items():
+            self._summary(variant).merge(summary)
+
+    def _summary(self, variant: GameChoice) -> VariantSummary:
+        """
+        Get the totals of a variant, starting them if needed.
+
+        Args:
+            variant (GameChoice): The variant.
+
+        Returns:
+            VariantSummary: The totals of its games.
+        """
+        summary = self.variants.get(variant)
+        if summary is None:
+            summary = self.variants[variant] = VariantSummary(variant)
+
+        return summary
+
+    @property
+    def games(self) -> int:
+        """
+        Get the number of games counted.
+
+        Returns:
+            int: The number of games of every variant.
+        """
+        return sum(summary.games for summary in self.variants.values())
+
+    def report(self) -> dict:
+        """
+        Get the rates and averages of every variant.
+
+        Returns:
+            dict: The report of each variant, by name.
+        """
+        return {
+            variant.name.lower(): self.variants[variant].report()
+            for variant in sorted(self.variants, key=lambda v: v.value)
+        }
+
+
+def records_of(games: Iterable[BaseTicTacToe]) -> Iterator[GameRecord]:
+    """
+    Get the records of finished games as they come.
+
+    Args:
+        games (Iterable[BaseTicTacToe]): The games, on the classic board.
+
+    Yields:
+        GameRecord: The record of each game.
+    """
+    for game in games:
+        yield from_game(game)
+
+
+def summarize_file(path: str | Path) -> Analytics:
+    """
+    Count the games of a record file, reading one at a time.
+
+    Args:
+        path (str | Path): The record file.
+
+    Returns:
+        Analytics: The totals of the file.
+    """
+    return Analytics().update(read(path))
+
+
+def summarize_files(
+    paths: Iterable[str | Path],
+    workers: int | None = None,
+) -> Analytics:
+    """
+    Count the games of record files, one worker process per file.
+
+    Args:
+        paths (Iterable[str | Path]): The record files.
+        workers (int | None): The number of worker processes. Defaults to
+            the number of CPUs.
+
+    Returns:
+        Analytics: The merged totals of every file.
+    """
+    analytics = Analytics()
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for shard in executor.map(summarize_file, paths):
+            analytics.merge(shard)
+
+    return analytics
+
+
+def _result(record: GameRecord) -> Result | None:
+    """
+    Get the result of a game for the player who moved first.
+
+    Args:
+        record (GameRecord): The record of the game.
+
+    Returns:
+        Result | None: The result, or None if the game was stopped.
+    """
+    match record.outcome:
+        case Outcome.DRAW:
+            return Result.DRAW
+        case Outcome.UNFINISHED:
+            return None
+        case Outcome.X_WINS:
+            won = record.starter is PlayerSymbol.X
+        case _:
+            won = record.starter is PlayerSymbol.O
+
+    return Result.WIN if won else Result.LOSS
+
+
+def _is_cycle(record: GameRecord) -> bool:
+    """
+    Check if a game of the limited variant ended in a draw by repetition.
+
+    The moves are replayed through the memory queue of the variant, and the
+    last position must have happened as often as the repetition rule needs.
+
+    Args:
+        record (GameRecord): The record of the game.
+
+    Returns:
+        bool: True if the last position repeated enough to draw.
+    """
+    memory: deque[tuple[PlayerSymbol, int]] = deque(
+        maxlen=LimitedMemoryTicTacToe.MEMORY_LIMIT - 1
+    )
+    # The marks in memory, in order, tell the position and the player to move.
+    positions: Counter[tuple[tuple[PlayerSymbol, int], ...]] = Counter()
+    position = ()
+
+    for move in record.moves():
+        memory.append(move)
+        position = tuple(memory)
+        positions[position] += 1
+
+    return positions[position] >= LimitedMemoryTicTacToe.REPETITION_LIMIT
+
+
+def _rates(results: Counter[Result], games: int) -> dict[str, float]:
+    """
+    Get the share of games of each result.
+
+    Args:
+        results (Counter[Result]): The games of each result.
+        games (int): The number of games.
+
+    Returns:
+        dict[str, float]: The win, draw and loss rates, or 0 without games.
+    """
+    return {
+        f'{result.name.lower()}_rate': results[result] / games if games else 0.0
+        for result in Result
+    }
+
+
+def print_report(report: dict) -> None:
+    """
+    Print the report of every variant.
+
+    Args:
+        report (dict): The report made by Analytics.report().
+    """
+    for variant, summary in report.items():
+        first = summary['first_player']
+        print(
+            f'{variant}: {summary["games"]} games '
+            f'({summary["unfinished"]} unfinished), '
+            f'{summary["mean_moves"]:.2f} moves and '
+            f'{summary["mean_turns"]:.2f} turns on average'
+        )
+        print(
+            f'  first player: {first["win_rate"]:.1%} wins, '
+            f'{first["draw_rate"]:.1%} draws, {first["loss_rate"]:.1%} '
+            f'losses, advantage {first["advantage"]:+.3f}'
+        )
+        for name, opening in summary['openings'].items():
+            print(
+                f'  {name:<6} opening: {opening["games"]} games, '
+                f'{opening["win_rate"]:.1%} wins, '
+                f'{opening["draw_rate"]:.1%} draws, '
+                f'{opening["loss_rate"]:.1%} losses'
+            )
+        if 'cycles' in summary:
+            cycles = summary['cycles']
+            print(
+                f'  cycles: {cycles["games"]} games, {cycles["rate"]:.1%} '
+                f'of the finished ones, after {cycles["mean_moves"]:.2f} '
+                'moves on average'
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description='Summarize recorded games, one record file at a time.'
+    )
+    parser.add_argument('records', nargs='+', type=Path)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument(
+        '--format',
+        choices=('text', 'json'),
+        default='text',
+        help='format of the report (default: text)',
+    )
+    args = parser.parse_args()
+
+    if len(args.records) == 1:
+        analytics = summarize_file(args.records[0])
+    else:
+        analytics = summarize_files(args.records, args.workers)
+
+    report = analytics.report()
+
+    if args.format == 'json':
+        import json
+
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+
+if __name__ == '__main__':
+    main()
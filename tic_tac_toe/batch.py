@@ -0,0 +1,187 @@
+"""
+Vectorized simulation of many random games at once.
+
+Requires NumPy, installed with the ``batch`` extra.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+
+from tic_tac_toe.game_type.limited import LimitedMemoryTicTacToe
+from tic_tac_toe.setup.game import GameChoice
+
+X_MARK = 1
+O_MARK = -1
+
+# The cell indices of every winning line.
+LINES = np.array(
+    [
+        [0, 1, 2],
+        [3, 4, 5],
+        [6, 7, 8],
+        [0, 3, 6],
+        [1, 4, 7],
+        [2, 5, 8],
+        [0, 4, 8],
+        [2, 4, 6],
+    ],
+    dtype=np.intp,
+)
+
+DEFAULT_BLOCK_SIZE = 65_536
+DEFAULT_MAX_TURNS = 256
+
+_KEPT_MARKS = LimitedMemoryTicTacToe.MEMORY_LIMIT - 1
+
+
+class BatchResult(NamedTuple):
+    # X_MARK or O_MARK for the winner, and 0 for a tie, a draw by repetition
+    # or a game stopped after the maximum number of turns.
+    winners: np.ndarray
+    # The number of moves of each game.
+    lengths: np.ndarray
+    # The symbol that moved first in each game.
+    starters: np.ndarray
+
+
+def simulate(
+    games: int,
+    variant: GameChoice = GameChoice.CLASSIC,
+    seed: int | None = None,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    max_turns: int = DEFAULT_MAX_TURNS,
+) -> BatchResult:
+    """
+    Play games between two EASY IAs, all at once.
+
+    Every game follows the rules of the object version: the first player is
+    random, each move is a random empty cell and, in the limited memory
+    variant, the oldest mark is removed once seven moves are in memory and a
+    position seen three times is a draw.
+
+    Args:
+        games (int): The number of games to play.
+        variant (GameChoice): The variant to play, classic or limited.
+        seed (int | None): The seed of the random generator.
+        block_size (int): The number of games advanced together, which bounds
+            the memory used.
+        max_turns (int): The number of moves after which a game is stopped.
+
+    Returns:
+        BatchResult: The winner, length and first player of each game.
+
+    Raises:
+        ValueError: If the variant can't be simulated in batch.
+    """
+    if variant not in (GameChoice.CLASSIC, GameChoice.LIMITED):
+        raise ValueError(f'Batch simulation does not support {variant.name}')
+
+    rng = np.random.default_rng(seed)
+    blocks = [
+        _simulate_block(
+            min(block_size, games - start),
+            variant is GameChoice.LIMITED,
+            rng,
+            max_turns,
+        )
+        for start in range(0, games, block_size)
+    ]
+
+    return BatchResult(
+        *(np.concatenate(arrays) for arrays in zip(*blocks, strict=True))
+    )
+
+
+def _simulate_block(
+    games: int,
+    limited: bool,
+    rng: np.random.Generator,
+    max_turns: int,
+) -> BatchResult:
+    """
+    Play a block of games to the end.
+
+    Args:
+        games (int): The number of games to play.
+        limited (bool): Whether to follow the limited memory rules.
+        rng (np.random.Generator): The random generator.
+        max_turns (int): The number of moves after which a game is stopped.
+
+    Returns:
+        BatchResult: The winner, length and first player of each game.
+    """
+    boards = np.zeros((games, 9), dtype=np.int8)
+    history = np.zeros((games, max_turns), dtype=np.int8)
+    starters = rng.choice(np.array([X_MARK, O_MARK], dtype=np.int8), size=games)
+    movers = starters.copy()
+    winners = np.zeros(games, dtype=np.int8)
+    lengths = np.zeros(games, dtype=np.int16)
+    # Limited memory positions seen so far, for the repetition rule.
+    positions = np.zeros((games, max_turns if limited else 0), dtype=np.int32)
+
+    active = np.arange(games)
+
+    for turn in range(max_turns):
+        if not active.size:
+            break
+
+        board = boards[active]
+        mover = movers[active]
+        rows = np.arange(active.size)
+
+        # A random empty cell: pick a rank among the empty cells of each game
+        # and find the first cell where the running count of empty cells
+        # goes past it.
+        empty = (board == 0).cumsum(axis=1, dtype=np.int8)
+        ranks = (rng.random(active.size) * empty[:, -1]).astype(np.int8)
+        cells = (empty > ranks[:, None]).argmax(axis=1).astype(np.int8)
+
+        if limited and turn >= _KEPT_MARKS:
+            board[rows, history[active, turn - _KEPT_MARKS]] = 0
+
+        board[rows, cells] = mover
+        boards[active] = board
+        history[active, turn] = cells
+        lengths[active] += 1
+
+        won = (board[:, LINES] == mover[:, None, None]).all(axis=2).any(axis=1)
+        winners[active[won]] = mover[won]
+        finished = won
+
+        if limited:
+            memory = history[:, max(0, turn - _KEPT_MARKS + 1) : turn + 1]
+            position = _positions(memory[active], -mover)
+            seen = positions[:, :turn][active]
+            repeated = (seen == position[:, None]).sum(axis=1)
+            positions[active, turn] = position
+            finished = finished | (repeated >= 2)
+        else:
+            finished = finished | (board != 0).all(axis=1)
+
+        movers[active] = -mover
+        active = active[~finished]
+
+    return BatchResult(winners=winners, lengths=lengths, starters=starters)
+
+
+def _positions(memory: np.ndarray, movers: np.ndarray) -> np.ndarray:
+    """
+    Encode the limited memory positions after a move.
+
+    The position is the order of the cells in memory and the player to move,
+    which is what the object version counts for the repetition rule.
+
+    Args:
+        memory (np.ndarray): The cells in memory of each game, oldest first.
+        movers (np.ndarray): The symbol to move in each game.
+
+    Returns:
+        np.ndarray: A key per game, equal only for equal positions.
+    """
+    keys = np.zeros(memory.shape[0], dtype=np.int32)
+
+    for index in range(memory.shape[1]):
+        keys = keys * 10 + memory[:, index] + 1
+
+    return keys * 2 + (movers == X_MARK)
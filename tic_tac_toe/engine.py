@@ -0,0 +1,86 @@
+from typing import NamedTuple
+
+from tic_tac_toe.game_type.base import BaseTicTacToe, Move
+from tic_tac_toe.player.base import Player, PlayerOrNone
+
+
+class GameResult(NamedTuple):
+    winner: PlayerOrNone
+    history: tuple[Move, ...]
+    turns: int
+
+
+def run(game: BaseTicTacToe, max_turns: int | None = None) -> GameResult:
+    """
+    Play a game to the end without any input or output.
+
+    Every move asked for counts as a turn, including invalid ones. In the
+    blind variant an invalid move loses the turn, in the others the same
+    player is asked again.
+
+    Args:
+        game (BaseTicTacToe): The game to play.
+        max_turns (int | None): The number of turns after which the game is
+            stopped, or None to play until it's over.
+
+    Returns:
+        GameResult: The winner, or None for a tie, and the moves made.
+    """
+    turns = 0
+
+    while not game.game_over and (max_turns is None or turns < max_turns):
+        game.step(game.request_move())
+        turns += 1
+
+    return GameResult(winner=game.winner, history=game.history, turns=turns)
+
+
+async def run_async(
+    game: BaseTicTacToe,
+    max_turns: int | None = None,
+) -> GameResult:
+    """
+    Play a game to the end like run(), awaiting the move of each player.
+
+    Many games can share an event loop this way, as long as the players
+    that think for long run their moves in an executor.
+
+    Args:
+        game (BaseTicTacToe): The game to play.
+        max_turns (int | None): The number of turns after which the game is
+            stopped, or None to play until it's over.
+
+    Returns:
+        GameResult: The winner, or None for a tie, and the moves made.
+    """
+    turns = 0
+
+    while not game.game_over and (max_turns is None or turns < max_turns):
+        game.step(await game.request_move_async())
+        turns += 1
+
+    return GameResult(winner=game.winner, history=game.history, turns=turns)
+
+
+def simulate(
+    game_class: type[BaseTicTacToe],
+    player: Player,
+    opponent: Player,
+    max_turns: int | None = None,
+) -> GameResult:
+    """
+    Play a new game between two players without any input or output.
+
+    Args:
+        game_class (type[BaseTicTacToe]): The variant to play.
+        player (Player): The main player.
+        opponent (Player): The opponent.
+        max_turns (int | None): The number of turns after which the game is
+            stopped, or None to play until it's over.
+
+    Returns:
+        GameResult: The winner, or None for a tie, and the moves made.
+    """
+    game = game_class(player=player, opponent=opponent)
+
+    return run(game, max_turns=max_turns)
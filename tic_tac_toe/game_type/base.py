@@ -1,9 +1,21 @@
 from abc import abstractmethod
-from queue import Queue
+from collections.abc import Iterator
+from contextlib import contextmanager
 from random import choice
 from typing import NamedTuple
 
-from tic_tac_toe.player.base import Player
+from tic_tac_toe import metrics
+from tic_tac_toe.game_type.board import (
+    CLASSIC,
+    BitBoard,
+    Geometry,
+    LineCounts,
+)
+from tic_tac_toe.game_type.move_log import MoveLog
+from tic_tac_toe.player.base import Player, PlayerSymbol
+
+# The cell of a turn lost by an invalid move, as kept in the logs.
+LOST_TURN = 0
 
 
 class Move(NamedTuple):
@@ -11,29 +23,62 @@ class Move(NamedTuple):
     cell: int
 
 
+class MoveRequest(NamedTuple):
+    # What the player to move is shown, passed to Player.make_move().
+    board: BitBoard
+    hide_move: bool = False
+    memory: tuple[int, ...] | None = None
+
+
 type PlayerOrNone = Player | None
 type Board = list[list[PlayerOrNone]]
 
 
 class BaseTicTacToe:
-    """Base class for a Tic Tac Toe game."""
-
-    def __init__(self, player: Player, opponent: Player) -> None:
+    """
+    Base class for a Tic Tac Toe game.
+
+    A game holds its board as bit masks, its lines as byte counts and its
+    moves as integer codes, in slots, so many games fit in a process. The
+    players are only referenced, and may be shared by any number of games.
+    """
+
+    __slots__ = (
+        'player',
+        'opponent',
+        'geometry',
+        'bitboard',
+        'lines',
+        '_current_player',
+        '_winner',
+        '_move_history',
+    )
+
+    def __init__(
+        self,
+        player: Player,
+        opponent: Player,
+        geometry: Geometry = CLASSIC,
+    ) -> None:
         """
         Initializes a new instance of the BaseTicTacToeGame class.
 
         Args:
             player (Player): The main player.
             opponent (Player): The opponent.
+            geometry (Geometry): The size of the board and the marks in a row
+                needed to win.
         """
 
         self.player: Player = player
         self.opponent: Player = opponent
 
-        self.board: Board = [[None] * 3 for _ in range(3)]
+        self.geometry: Geometry = geometry
+        self.bitboard: BitBoard = BitBoard(geometry=geometry)
+        self.lines: LineCounts = LineCounts(geometry)
         self._current_player: Player = choice([self.player, self.opponent])
         self._winner: PlayerOrNone = None
-        self._move_history: Queue[Move] = Queue()
+        self._move_history: MoveLog = MoveLog(geometry.cells)
 
     @property
     def winner(self) -> PlayerOrNone:
@@ -45,6 +90,29 @@ class BaseTicTacToe:
         """
         return self._winner
 
+    @property
+    def board(self) -> Board:
+        """
+        Get a view of the board with the players in each cell.
+
+        Returns:
+            Board: A grid of rows built from the bitboard.
+        """
+        players = {
+            self.player.symbol: self.player,
+            self.opponent.symbol: self.opponent,
+        }
+        columns = self.geometry.columns
+        cells = [
+            players.get(self.bitboard.owner(cell))
+            for cell in range(1, self.geometry.cells + 1)
+        ]
+
+        return [
+            cells[row : row + columns]
+            for row in range(0, self.geometry.cells, columns)
+        ]
+
     @property
     def game_over(self) -> bool:
         """
@@ -54,9 +122,29 @@ class BaseTicTacToe:
             bool: True if the game is over
                   (either there is a winner or it's a tie), False otherwise.
         """
-        return self.winner is not None or BaseTicTacToe.check_tie(
-            board=self.board
-        )
+        return self.winner is not None or self.lines.is_full()
+
+    @property
+    def history(self) -> tuple[Move, ...]:
+        """
+        Get the moves made so far.
+
+        Returns:
+            tuple[Move, ...]: The moves, oldest first, without the turns
+            lost.
+        """
+        return tuple(move for move in self.turns if move.cell != LOST_TURN)
+
+    @property
+    def turns(self) -> tuple[Move, ...]:
+        """
+        Get the turns played so far, including the ones lost.
+
+        Returns:
+            tuple[Move, ...]: The moves, oldest first, with the cell
+            LOST_TURN for each turn lost.
+        """
+        return tuple(map(self._decode, self._move_history))
 
     @property
     def current_player(self) -> Player:
@@ -69,38 +157,17 @@ class BaseTicTacToe:
         return self._current_player
 
     @staticmethod
-    def check_win(player: Player, board: Board) -> bool:
+    def check_win(player: Player, board: BitBoard) -> bool:
         """
         Check if there's a winner in the current game state.
 
         Returns:
             bool: True if there's a winner, False otherwise.
         """
-        # Check rows and columns
-        for row_index in range(3):
-            if (
-                board[row_index][0]
-                == board[row_index][1]
-                == board[row_index][2]
-                is player
-                or board[0][row_index]
-                == board[1][row_index]
-                == board[2][row_index]
-                is player
-            ):
-                return True
-
-        # Check diagonals
-        if (
-            board[0][0] == board[1][1] == board[2][2] is not None
-            or board[0][2] == board[1][1] == board[2][0] is player
-        ):
-            return True
-
-        return False
+        return board.is_win(player.symbol)
 
     @staticmethod
-    def is_game_over(board: Board) -> bool:
+    def is_game_over(board: BitBoard) -> bool:
         """
         Check if the game is over.
 
@@ -109,43 +176,39 @@ class BaseTicTacToe:
                   (either there is a winner or it's a tie), False otherwise.
         """
         return (
-            BaseTicTacToe.check_win(player=Player.X, board=board)
-            or BaseTicTacToe.check_win(player=Player.O, board=board)
-            or BaseTicTacToe.check_tie(board=board)
+            board.is_win(PlayerSymbol.X)
+            or board.is_win(PlayerSymbol.O)
+            or board.is_full()
         )
 
     @staticmethod
-    def check_tie(board: Board) -> bool:
+    def check_tie(board: BitBoard) -> bool:
         """
         Check if the game is a tie.
 
         Returns:
             bool: True if the game is a tie, False otherwise.
         """
-        return all(
-            board[row][col] is not None for row in range(3) for col in range(3)
-        )
+        return board.is_full()
 
     @staticmethod
-    def has_moves(board: Board) -> bool:
+    def has_moves(board: BitBoard) -> bool:
         """
         Check if there are any moves left in the game.
 
         Returns:
             bool: True if there are any moves left, False otherwise.
         """
-        return any(
-            board[row][col] is None for row in range(3) for col in range(3)
-        )
+        return not board.is_full()
 
     @abstractmethod
     def display_board(self) -> None:
         """
         Display the current state of the game board.
         """
-        for row in range(3):
-            for col in range(3):
-                print(f'{self.board[row][col] or "-"}', end=' ')
+        for row in self.board:
+            for cell in row:
+                print(f'{cell or "-"}', end=' ')
 
             print()
 
@@ -153,7 +216,7 @@ class BaseTicTacToe:
         """
         Print the results of the game.
         """
-        if BaseTicTacToe.check_tie(board=self.board):
+        if BaseTicTacToe.check_tie(board=self.bitboard):
             print("It's a tie!")
 
         if self.winner is not None:
@@ -169,15 +232,144 @@ class BaseTicTacToe:
         Returns:
             bool: True if the move is valid, False otherwise.
         """
-        if cell < 1 or cell > 9:
+        return self.bitboard.is_empty(cell)
+
+    def legal_moves(self) -> tuple[int, ...]:
+        """
+        Get the moves the current player can make.
+
+        Returns:
+            tuple[int, ...]: The empty cell numbers, in ascending order.
+        """
+        return self.bitboard.empty_cells()
+
+    def move_request(self) -> MoveRequest:
+        """
+        Get what the current player is shown to choose a move.
+
+        Returns:
+            MoveRequest: The board as seen by the player.
+        """
+        return MoveRequest(board=self.bitboard)
+
+    def request_move(self) -> int:
+        """
+        Asks the current player for a move.
+
+        Returns:
+            int: The cell number chosen by the player.
+        """
+        if metrics.hooks is not None:
+            return metrics.hooks.request(self, self.move_request())
+
+        return self._current_player.make_move(**self.move_request()._asdict())
+
+    async def request_move_async(self) -> int:
+        """
+        Asks the current player for a move without blocking the event loop.
+
+        Returns:
+            int: The cell number chosen by the player.
+        """
+        if metrics.hooks is not None:
+            return await metrics.hooks.request_async(self, self.move_request())
+
+        return await self._current_player.make_move_async(
+            **self.move_request()._asdict()
+        )
+
+    def step(self, move: int) -> bool:
+        """
+        Make a move for the current player, without any output.
+
+        Args:
+            move (int): The cell number where the move is to be made.
+
+        Returns:
+            bool: True if the move was made, False if it was invalid.
+        """
+        return self._step(move, record=True)
+
+    def _step(self, move: int, record: bool) -> bool:
+        """
+        Make a move for the current player.
+
+        Args:
+            move (int): The cell number where the move is to be made.
+            record (bool): Whether the metrics count the move, which they
+                don't when a move taken back is made again.
+
+        Returns:
+            bool: True if the move was made, False if it was invalid.
+        """
+        if not self.is_valid_move(move):
             return False
 
-        cell -= 1
+        hooks = metrics.hooks if record else None
+        start = 0 if hooks is None else hooks.clock()
 
-        row = cell // 3
-        col = cell % 3
+        self._before_move(move)
+        self._set_move(move)
+        self._after_move(move)
+
+        if hooks is not None:
+            hooks.step(self, start)
+
+        return True
+
+    def undo(self) -> Move:
+        """
+        Take back the last move, which can be made again with redo().
+
+        A turn lost is taken back like a move.
 
-        return self.board[row][col] is None
+        Returns:
+            Move: The move taken back, with the cell LOST_TURN for a turn.
+
+        Raises:
+            IndexError: If no move was made.
+        """
+        move = self._decode(self._move_history.pop())
+        self._undo_move(move)
+
+        return move
+
+    def redo(self) -> Move:
+        """
+        Make again the last move taken back.
+
+        Returns:
+            Move: The move made again.
+
+        Raises:
+            IndexError: If there are no moves to redo.
+        """
+        move = self._decode(self._move_history.peek_redo())
+        self._current_player = move.player
+        # The game was already counted when the move was first made.
+        self._step(move.cell, record=False)
+
+        return move
+
+    def replay(self, ply: int) -> None:
+        """
+        Take back or make again moves until a number of moves is made.
+
+        Args:
+            ply (int): The number of moves made after the replay, counting
+                the turns lost.
+
+        Raises:
+            IndexError: If the game never reached that many moves.
+        """
+        if ply < 0:
+            raise IndexError(f'No position before the first move: {ply}')
+
+        while len(self._move_history) > ply:
+            self.undo()
+
+        while len(self._move_history) < ply:
+            self.redo()
 
     @abstractmethod
     def play(self) -> None:
@@ -186,41 +378,131 @@ class BaseTicTacToe:
         """
         print(f'Current player: {self._current_player}')
 
-        move = -1
+        with self._pondering():
+            while not self.step(self.request_move()):
+                print('Invalid move')
 
-        while True:
-            move = self._current_player.make_move(board=self.board)
-            if self.is_valid_move(move):
-                break
+        self._render()
 
-            print('Invalid move')
+    async def play_async(self) -> None:
+        """
+        Play a turn like play(), awaiting the move of the current player.
+        """
+        print(f'Current player: {self._current_player}')
 
-        self._before_move(move)
-        self._set_move(move)
+        with self._pondering():
+            while not self.step(await self.request_move_async()):
+                print('Invalid move')
+
+        self._render()
+
+    @contextmanager
+    def _pondering(self) -> Iterator[None]:
+        """
+        Let the waiting player think while the current one chooses a move.
+
+        Nothing is shared when the moves are hidden, since the board of the
+        current player isn't the waiting player's to see.
+
+        Yields:
+            None: While the current player chooses its move.
+        """
+        request = self.move_request()
+        if request.hide_move:
+            yield
+            return
+
+        waiting = (
+            self.player
+            if self._current_player == self.opponent
+            else self.opponent
+        )
+        waiting.start_pondering(request.board)
+        try:
+            yield
+        finally:
+            waiting.stop_pondering()
+
+    def _render(self) -> None:
+        """
+        Display the board, timing it when metrics are enabled.
+        """
+        hooks = metrics.hooks
+        if hooks is None:
+            self.display_board()
+            return
+
+        start = hooks.clock()
         self.display_board()
-        self._after_move(move)
+        hooks.render(self, start)
 
     @abstractmethod
     def _before_move(self, move: int) -> None:
         """
         Perform any necessary operations before a move is made.
         """
-        self._move_history.put((self._current_player, move))
+        self._move_history.append(self._encode(move))
 
     @abstractmethod
-    def _after_move(self, _move: int) -> None:
+    def _after_move(self, move: int) -> None:
         """
         Perform any necessary operations after a move is made.
 
+        The line counts were updated with the move, so the checks take
+        constant time.
+
         Parameters:
-            _move (int): The move that was made.
+            move (int): The move that was made.
         """
-        if self.check_win(board=self.board, player=self._current_player):
+        if self.lines.is_win(self._current_player.symbol):
             self._winner = self._current_player
 
-        elif self.check_tie(board=self.board):
+        elif self.lines.is_full():
             self._winner = None
 
+        self._switch_player()
+
+    def _encode(self, cell: int) -> int:
+        """
+        Get the code of a move of the current player, as kept in the logs.
+
+        Args:
+            cell (int): The cell number of the move.
+
+        Returns:
+            int: The cell shifted left, with the lowest bit set for the
+            opponent.
+        """
+        return cell << 1 | (self._current_player is self.opponent)
+
+    def _decode(self, code: int) -> Move:
+        """
+        Get the move of a code kept in the logs.
+
+        Args:
+            code (int): The code made by _encode().
+
+        Returns:
+            Move: The player and the cell of the move.
+        """
+        return Move(self.opponent if code & 1 else self.player, code >> 1)
+
+    def _undo_move(self, move: Move) -> None:
+        """
+        Revert the board and the turn to the state before a move.
+
+        Parameters:
+            move (Move): The move taken back, already out of the history.
+        """
+        if move.cell != LOST_TURN:
+            self._remove_mark(move.player.symbol, move.cell)
+        self._winner = None
+        self._current_player = move.player
+
+    def _switch_player(self) -> None:
+        """
+        Give the turn to the other player.
+        """
         self._current_player = (
             self.player
             if self._current_player == self.opponent
@@ -229,17 +511,36 @@ class BaseTicTacToe:
 
     def _set_move(self, cell: int) -> None:
         """
-        Set the move made by a player on the board.
+        Set the move made by a player on the board and count it in its
+        lines.
 
         Args:
             cell (int): The cell number where the move is made.
             player (Player): The player making the move.
         """
-        cell -= 1
+        self._place_mark(self._current_player.symbol, cell)
 
-        row = cell // 3
-        col = cell % 3
-        self.board[row][col] = self._current_player
+    def _place_mark(self, symbol: PlayerSymbol, cell: int) -> None:
+        """
+        Put a mark on the board and its line counts.
+
+        Args:
+            symbol (PlayerSymbol): The symbol of the mark.
+            cell (int): The cell number.
+        """
+        self.bitboard.place(symbol, cell)
+        self.lines.place(symbol, cell)
+
+    def _remove_mark(self, symbol: PlayerSymbol, cell: int) -> None:
+        """
+        Take a mark off the board and its line counts.
+
+        Args:
+            symbol (PlayerSymbol): The symbol of the mark.
+            cell (int): The cell number.
+        """
+        self.bitboard.remove(cell)
+        self.lines.remove(symbol, cell)
 
     def __repr__(self) -> str:
         """
@@ -248,7 +549,13 @@ class BaseTicTacToe:
         Returns:
             str: String representation of the game object.
         """
+        names = [
+            name
+            for cls in reversed(type(self).__mro__)
+            for name in getattr(cls, '__slots__', ())
+        ]
+        names.extend(getattr(self, '__dict__', ()))
         attributes = ',\n\t'.join(
-            f'{attr}={getattr(self, attr)!s}' for attr in self.__dict__
+            f'{name}={getattr(self, name)!s}' for name in names
         )
         return f'TicTacToe(\n\t{attributes}\n)'
@@ -1,12 +1,69 @@
-from tic_tac_toe.game_type.base import BaseTicTacToe, Move
-from tic_tac_toe.player.base import Player
+from tic_tac_toe.game_type.base import (
+    LOST_TURN,
+    BaseTicTacToe,
+    Move,
+    MoveRequest,
+)
+from tic_tac_toe.game_type.board import (
+    CLASSIC,
+    BitBoard,
+    Geometry,
+    cell_bit,
+    mask_cells,
+)
+from tic_tac_toe.player.base import Player, PlayerSymbol
+
+
+class BlindBoard(BitBoard):
+    """
+    Board as known by a player of the blind variant.
+
+    It holds the player's own marks and the opponent marks it has seen, plus
+    the number of opponent marks that are still hidden.
+    """
+
+    __slots__ = ('hidden',)
+
+    def __init__(
+        self,
+        x: int = 0,
+        o: int = 0,
+        hidden: int = 0,
+        geometry: Geometry = CLASSIC,
+    ) -> None:
+        """
+        Initializes a new instance of the BlindBoard class.
+
+        Args:
+            x (int): The mask of the known cells taken by X.
+            o (int): The mask of the known cells taken by O.
+            hidden (int): The number of opponent marks not shown.
+            geometry (Geometry): The size of the board.
+        """
+        super().__init__(x, o, geometry)
+        self.hidden = hidden
+
+    def copy(self) -> 'BlindBoard':
+        """
+        Get a copy of the board.
+
+        Returns:
+            BlindBoard: A new board with the same cells and hidden marks.
+        """
+        return BlindBoard(self.x, self.o, self.hidden, self.geometry)
 
 
 class BlindTicTacToe(BaseTicTacToe):
+    # The first moves of the game, which both players see.
+    SHOWN_MOVES = 2
+
+    __slots__ = ('_shown', '_learned_x', '_learned_o')
+
     def __init__(
         self,
         player: Player,
         opponent: Player,
+        geometry: Geometry = CLASSIC,
     ) -> None:
         """
         Initializes a new instance of the BlindTicTacToe class.
@@ -14,50 +71,127 @@ class BlindTicTacToe(BaseTicTacToe):
         Args:
             player (Player): The player.
             opponent (Player): The opponent.
+            geometry (Geometry): The size of the board and the marks in a row
+                needed to win.
         """
-        super().__init__(player, opponent)
-        self._firsts_moves: list[Move] = []
+        super().__init__(player, opponent, geometry)
+        # The cells of the first moves, and the cells each player learned
+        # are taken from its lost turns.
+        self._shown: int = 0
+        self._learned_x: int = 0
+        self._learned_o: int = 0
 
     def display_board(self) -> None:
         """
         Display the board but only the first two moves.
         """
-        board = [['-' for _ in range(3)] for _ in range(3)]
+        rows, columns = self.geometry.rows, self.geometry.columns
+        board = [['-' for _ in range(columns)] for _ in range(rows)]
 
-        for move in self._firsts_moves:
-            row, col = divmod(move.cell - 1, 3)
-            board[row][col] = move.player
+        for cell in mask_cells(self._shown):
+            row, col = divmod(cell - 1, columns)
+            board[row][col] = self.bitboard.owner(cell)
 
-        for row in range(3):
-            for col in range(3):
+        for row in range(rows):
+            for col in range(columns):
                 print(f'{board[row][col] or "-"}', end=' ')
 
             print()
 
+    def known_board(self) -> BlindBoard:
+        """
+        Get the board as known by the current player.
+
+        The player knows its own marks, the first two moves and the cells
+        where its moves were rejected for being taken.
+
+        Returns:
+            BlindBoard: The known board of the current player.
+        """
+        symbol = self._current_player.symbol
+        other = PlayerSymbol.O if symbol is PlayerSymbol.X else PlayerSymbol.X
+
+        revealed = self._shown | (
+            self._learned_x if symbol is PlayerSymbol.X else self._learned_o
+        )
+
+        own = self.bitboard.mask(symbol)
+        opponent = self.bitboard.mask(other)
+        known = opponent & revealed
+        hidden = opponent.bit_count() - known.bit_count()
+
+        if symbol is PlayerSymbol.X:
+            return BlindBoard(own, known, hidden, self.geometry)
+
+        return BlindBoard(known, own, hidden, self.geometry)
+
+    def move_request(self) -> MoveRequest:
+        """
+        Get what the current player is shown, which is only what it knows.
+
+        Returns:
+            MoveRequest: The known board, with the move to be hidden.
+        """
+        return MoveRequest(board=self.known_board(), hide_move=True)
+
+    def _step(self, move: int, record: bool) -> bool:
+        """
+        Make a move for the current player.
+
+        An invalid move loses the turn, which is logged with the cell
+        LOST_TURN, and the player learns that the cell is taken.
+
+        Args:
+            move (int): The cell number where the move is to be made.
+            record (bool): Whether the metrics count the move.
+
+        Returns:
+            bool: True if the move was made, False if the turn was lost.
+        """
+        if super()._step(move, record):
+            return True
+
+        if self.geometry.contains(move):
+            if self._current_player.symbol is PlayerSymbol.X:
+                self._learned_x |= cell_bit(move)
+            else:
+                self._learned_o |= cell_bit(move)
+
+        self._move_history.append(self._encode(LOST_TURN))
+        self._switch_player()
+
+        return False
+
     def play(self) -> None:
         print(f'Current player: {self._current_player}')
 
-        move = -1
+        player = self._current_player
 
-        while True:
-            move = self._current_player.make_move(
-                board=self.board,
-                hide_move=True,
+        if not self.step(self.request_move()):
+            print(
+                'Invalid move',
+                f'{player} has lost the turn.',
             )
-            if not self.is_valid_move(move):
-                print(
-                    'Invalid move',
-                    f'{self._current_player} has lost the turn.',
-                )
-            break
-
-        self._before_move(move)
-        self._set_move(move)
-        self.display_board()
-        self._after_move(move)
+            return
+
+        self._render()
+
+    async def play_async(self) -> None:
+        print(f'Current player: {self._current_player}')
+
+        player = self._current_player
+
+        if not self.step(await self.request_move_async()):
+            print(
+                'Invalid move',
+                f'{player} has lost the turn.',
+            )
+            return
+
+        self._render()
 
     def print_results(self) -> None:
-        if BaseTicTacToe.check_tie(board=self.board):
+        if BaseTicTacToe.check_tie(board=self.bitboard):
             print("It's a tie!")
 
         if self.winner is not None:
@@ -65,19 +199,30 @@ class BlindTicTacToe(BaseTicTacToe):
 
         super().display_board()
 
+    def _undo_move(self, move: Move) -> None:
+        """
+        Hides the move again if it was one of the first ones.
+
+        The cells learned from lost turns stay known.
+
+        Parameters:
+            move (Move): The move taken back, already out of the history.
+        """
+        super()._undo_move(move)
+
+        # Only the move of one of the first turns can be on a shown cell.
+        if move.cell != LOST_TURN:
+            self._shown &= ~cell_bit(move.cell)
+
     def _before_move(self, move: int) -> None:
         """
-        Saves the first move of each player.
+        Shows the move to both players if it's one of the first ones.
 
         Parameters:
             move (int): The cell number where the move is made.
         """
-        super()._before_move(move)
+        # Counted from the cells shown, since the log holds the lost turns.
+        if self._shown.bit_count() < self.SHOWN_MOVES:
+            self._shown |= cell_bit(move)
 
-        if len(self._firsts_moves) < 2:
-            self._firsts_moves.append(
-                Move(
-                    player=self._current_player,
-                    cell=move,
-                )
-            )
+        super()._before_move(move)
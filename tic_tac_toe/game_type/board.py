@@ -0,0 +1,525 @@
+from functools import cache
+
+from tic_tac_toe.player.base import PlayerSymbol
+
+# Constants of the classic 3x3 board, used by the solvers and lookup tables.
+CELLS = 9
+FULL_MASK = (1 << CELLS) - 1
+
+WIN_MASKS: tuple[int, ...] = (
+    # Rows
+    0b000_000_111,
+    0b000_111_000,
+    0b111_000_000,
+    # Columns
+    0b001_001_001,
+    0b010_010_010,
+    0b100_100_100,
+    # Diagonals
+    0b100_010_001,
+    0b001_010_100,
+)
+
+# Lookup tables indexed by a 9-bit mask, built once at import time.
+_WINNING: tuple[bool, ...] = tuple(
+    any(mask & win == win for win in WIN_MASKS) for mask in range(FULL_MASK + 1)
+)
+_CELLS: tuple[tuple[int, ...], ...] = tuple(
+    tuple(bit + 1 for bit in range(CELLS) if mask >> bit & 1)
+    for mask in range(FULL_MASK + 1)
+)
+
+
+def cell_bit(cell: int) -> int:
+    """
+    Get the bit that represents a cell.
+
+    Args:
+        cell (int): The cell number, starting at 1.
+
+    Returns:
+        int: The mask with only the bit of the cell set.
+    """
+    return 1 << (cell - 1)
+
+
+def mask_cells(mask: int) -> tuple[int, ...]:
+    """
+    Get the cells set in a mask.
+
+    Args:
+        mask (int): A mask of any size.
+
+    Returns:
+        tuple[int, ...]: The cell numbers set in the mask, in ascending order.
+    """
+    if mask <= FULL_MASK:
+        return _CELLS[mask]
+
+    cells: list[int] = []
+    offset = 0
+
+    while mask:
+        cells.extend(cell + offset for cell in _CELLS[mask & FULL_MASK])
+        mask >>= CELLS
+        offset += CELLS
+
+    return tuple(cells)
+
+
+def is_winning_mask(mask: int) -> bool:
+    """
+    Check if a mask contains a complete line of the classic board.
+
+    Args:
+        mask (int): A 9-bit mask.
+
+    Returns:
+        bool: True if the mask covers any of the winning lines.
+    """
+    return _WINNING[mask]
+
+
+class Geometry:
+    """
+    Size of an m,n,k board: its rows, columns and marks needed in a row.
+
+    Use geometry() to get an instance, so equal geometries are shared along
+    with their precomputed lines.
+    """
+
+    __slots__ = (
+        'rows',
+        'columns',
+        'in_a_row',
+        'cells',
+        'full_mask',
+        'win_masks',
+        'lines_through',
+        'line_indices',
+    )
+
+    def __init__(self, rows: int, columns: int, in_a_row: int) -> None:
+        """
+        Initializes a new instance of the Geometry class.
+
+        Args:
+            rows (int): The number of rows.
+            columns (int): The number of columns.
+            in_a_row (int): The number of marks in a line needed to win.
+
+        Raises:
+            ValueError: If the line doesn't fit in the board.
+        """
+        if min(rows, columns) < 1 or not 1 <= in_a_row <= max(rows, columns):
+            raise ValueError(
+                f'A {rows}x{columns} board has no lines of {in_a_row}'
+            )
+
+        self.rows = rows
+        self.columns = columns
+        self.in_a_row = in_a_row
+        self.cells = rows * columns
+        self.full_mask = (1 << self.cells) - 1
+        self.win_masks: tuple[int, ...] = tuple(self._lines())
+        self.lines_through: tuple[tuple[int, ...], ...] = tuple(
+            tuple(line for line in self.win_masks if line >> bit & 1)
+            for bit in range(self.cells)
+        )
+        self.line_indices: tuple[tuple[int, ...], ...] = tuple(
+            tuple(
+                index
+                for index, line in enumerate(self.win_masks)
+                if line >> bit & 1
+            )
+            for bit in range(self.cells)
+        )
+
+    def contains(self, cell: int) -> bool:
+        """
+        Check if a cell number is inside the board.
+
+        Args:
+            cell (int): The cell number.
+
+        Returns:
+            bool: True if the cell is between 1 and the number of cells.
+        """
+        return 1 <= cell <= self.cells
+
+    def _lines(self) -> list[int]:
+        """
+        Build the mask of every winning line.
+
+        Returns:
+            list[int]: The masks of the lines in every direction.
+        """
+        lines = []
+
+        for row in range(self.rows):
+            for col in range(self.columns):
+                for row_step, col_step in ((0, 1), (1, 0), (1, 1), (1, -1)):
+                    cells = [
+                        (row + row_step * step, col + col_step * step)
+                        for step in range(self.in_a_row)
+                    ]
+
+                    if all(
+                        0 <= r < self.rows and 0 <= c < self.columns
+                        for r, c in cells
+                    ):
+                        lines.append(
+                            sum(1 << (r * self.columns + c) for r, c in cells)
+                        )
+
+        return lines
+
+    def __reduce__(self) -> tuple:
+        # Unpickle through geometry() so the instance stays shared.
+        return geometry, (self.rows, self.columns, self.in_a_row)
+
+    def __repr__(self) -> str:
+        return (
+            f'Geometry(rows={self.rows}, columns={self.columns}, '
+            f'in_a_row={self.in_a_row})'
+        )
+
+
+@cache
+def geometry(rows: int = 3, columns: int = 3, in_a_row: int = 3) -> Geometry:
+    """
+    Get the shared geometry of a board size.
+
+    Args:
+        rows (int): The number of rows.
+        columns (int): The number of columns.
+        in_a_row (int): The number of marks in a line needed to win.
+
+    Returns:
+        Geometry: The geometry of the board.
+    """
+    return Geometry(rows, columns, in_a_row)
+
+
+CLASSIC = geometry()
+
+
+class BitBoard:
+    """
+    Compact Tic Tac Toe board made of one mask per symbol.
+
+    Bit ``n - 1`` of a mask is set when cell ``n`` holds that symbol. Cells
+    are numbered row by row, starting at 1.
+    """
+
+    __slots__ = ('x', 'o', 'geometry')
+
+    def __init__(
+        self,
+        x: int = 0,
+        o: int = 0,
+        geometry: Geometry = CLASSIC,
+    ) -> None:
+        """
+        Initializes a new instance of the BitBoard class.
+
+        Args:
+            x (int): The mask of the cells taken by X.
+            o (int): The mask of the cells taken by O.
+            geometry (Geometry): The size of the board.
+        """
+        self.x = x
+        self.o = o
+        self.geometry = geometry
+
+    @property
+    def occupied(self) -> int:
+        """
+        Get the mask of the occupied cells.
+
+        Returns:
+            int: The cells taken by either symbol.
+        """
+        return self.x | self.o
+
+    @property
+    def free(self) -> int:
+        """
+        Get the mask of the empty cells.
+
+        Returns:
+            int: The cells not taken by any symbol.
+        """
+        return ~(self.x | self.o) & self.geometry.full_mask
+
+    def mask(self, symbol: PlayerSymbol) -> int:
+        """
+        Get the mask of the cells taken by a symbol.
+
+        Args:
+            symbol (PlayerSymbol): The symbol to look up.
+
+        Returns:
+            int: The mask of the cells taken by the symbol.
+        """
+        return self.x if symbol is PlayerSymbol.X else self.o
+
+    def owner(self, cell: int) -> PlayerSymbol | None:
+        """
+        Get the symbol that holds a cell.
+
+        Args:
+            cell (int): The cell number.
+
+        Returns:
+            PlayerSymbol | None: The symbol in the cell, or None if it's empty.
+        """
+        bit = cell_bit(cell)
+        if self.x & bit:
+            return PlayerSymbol.X
+        if self.o & bit:
+            return PlayerSymbol.O
+        return None
+
+    def is_empty(self, cell: int) -> bool:
+        """
+        Check if a cell is empty.
+
+        Args:
+            cell (int): The cell number.
+
+        Returns:
+            bool: True if the cell is inside the board and empty.
+        """
+        return self.geometry.contains(cell) and not (
+            (self.x | self.o) & cell_bit(cell)
+        )
+
+    def empty_cells(self) -> tuple[int, ...]:
+        """
+        Get the empty cells of the board.
+
+        Returns:
+            tuple[int, ...]: The empty cell numbers, in ascending order.
+        """
+        return mask_cells(~(self.x | self.o) & self.geometry.full_mask)
+
+    def is_full(self) -> bool:
+        """
+        Check if every cell of the board is taken.
+
+        Returns:
+            bool: True if there are no empty cells, False otherwise.
+        """
+        return self.x | self.o == self.geometry.full_mask
+
+    def is_win(self, symbol: PlayerSymbol) -> bool:
+        """
+        Check if a symbol has completed a line anywhere on the board.
+
+        Args:
+            symbol (PlayerSymbol): The symbol to check.
+
+        Returns:
+            bool: True if the symbol has a complete line, False otherwise.
+        """
+        mask = self.x if symbol is PlayerSymbol.X else self.o
+
+        if self.geometry is CLASSIC:
+            return _WINNING[mask]
+
+        return any(mask & line == line for line in self.geometry.win_masks)
+
+    def is_win_at(self, symbol: PlayerSymbol, cell: int) -> bool:
+        """
+        Check if a symbol has completed a line through a cell.
+
+        Only the lines through the cell are checked, so this is the check to
+        use after each move.
+
+        Args:
+            symbol (PlayerSymbol): The symbol to check.
+            cell (int): The cell number of the last move.
+
+        Returns:
+            bool: True if the symbol has a complete line through the cell.
+        """
+        mask = self.x if symbol is PlayerSymbol.X else self.o
+
+        return any(
+            mask & line == line
+            for line in self.geometry.lines_through[cell - 1]
+        )
+
+    def would_win(self, symbol: PlayerSymbol, cell: int) -> bool:
+        """
+        Check if putting a symbol in a cell would complete a line.
+
+        Args:
+            symbol (PlayerSymbol): The symbol to put.
+            cell (int): The cell number.
+
+        Returns:
+            bool: True if the move would win the game.
+        """
+        mask = self.mask(symbol) | cell_bit(cell)
+
+        return any(
+            mask & line == line
+            for line in self.geometry.lines_through[cell - 1]
+        )
+
+    def place(self, symbol: PlayerSymbol, cell: int) -> None:
+        """
+        Put a symbol in a cell.
+
+        Args:
+            symbol (PlayerSymbol): The symbol to put.
+            cell (int): The cell number.
+        """
+        if symbol is PlayerSymbol.X:
+            self.x |= cell_bit(cell)
+        else:
+            self.o |= cell_bit(cell)
+
+    def remove(self, cell: int) -> None:
+        """
+        Clear a cell.
+
+        Args:
+            cell (int): The cell number.
+        """
+        keep = ~cell_bit(cell)
+        self.x &= keep
+        self.o &= keep
+
+    def copy(self) -> 'BitBoard':
+        """
+        Get a copy of the board.
+
+        Returns:
+            BitBoard: A new board with the same cells.
+        """
+        return BitBoard(self.x, self.o, self.geometry)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, BitBoard):
+            return NotImplemented
+        return (
+            self.x == other.x
+            and self.o == other.o
+            and self.geometry is other.geometry
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.x, self.o, self.geometry.cells))
+
+    def __repr__(self) -> str:
+        return f'BitBoard(x={self.x:#b}, o={self.o:#b}, {self.geometry!r})'
+
+
+class LineCounts:
+    """
+    Number of marks of each symbol in every line of a board.
+
+    The counts are updated one move at a time, so a game knows if it's won
+    or full without looking at the board again. They're kept in one byte
+    per line, unless the lines are too long for it.
+    """
+
+    __slots__ = ('geometry', 'x', 'o', 'filled', 'complete_x', 'complete_o')
+
+    def __init__(self, geometry: Geometry = CLASSIC) -> None:
+        """
+        Initializes a new instance of the LineCounts class.
+
+        Args:
+            geometry (Geometry): The size of the board.
+        """
+        lines = len(geometry.win_masks)
+
+        self.geometry = geometry
+        if geometry.in_a_row < 256:
+            self.x: bytearray | list[int] = bytearray(lines)
+            self.o: bytearray | list[int] = bytearray(lines)
+        else:
+            self.x = [0] * lines
+            self.o = [0] * lines
+        self.filled: int = 0
+        # The complete lines of each symbol.
+        self.complete_x: int = 0
+        self.complete_o: int = 0
+
+    def place(self, symbol: PlayerSymbol, cell: int) -> bool:
+        """
+        Count a mark put in a cell.
+
+        Args:
+            symbol (PlayerSymbol): The symbol put.
+            cell (int): The cell number.
+
+        Returns:
+            bool: True if the mark completes a line.
+        """
+        counts = self.x if symbol is PlayerSymbol.X else self.o
+        in_a_row = self.geometry.in_a_row
+        completed = 0
+
+        for index in self.geometry.line_indices[cell - 1]:
+            counts[index] += 1
+            if counts[index] == in_a_row:
+                completed += 1
+
+        self.filled += 1
+        if completed:
+            if symbol is PlayerSymbol.X:
+                self.complete_x += completed
+            else:
+                self.complete_o += completed
+
+        return completed > 0
+
+    def remove(self, symbol: PlayerSymbol, cell: int) -> None:
+        """
+        Stop counting a mark removed from a cell.
+
+        Args:
+            symbol (PlayerSymbol): The symbol removed.
+            cell (int): The cell number.
+        """
+        counts = self.x if symbol is PlayerSymbol.X else self.o
+        in_a_row = self.geometry.in_a_row
+
+        for index in self.geometry.line_indices[cell - 1]:
+            if counts[index] == in_a_row:
+                if symbol is PlayerSymbol.X:
+                    self.complete_x -= 1
+                else:
+                    self.complete_o -= 1
+            counts[index] -= 1
+
+        self.filled -= 1
+
+    def is_win(self, symbol: PlayerSymbol) -> bool:
+        """
+        Check if a symbol has completed a line.
+
+        Args:
+            symbol (PlayerSymbol): The symbol to check.
+
+        Returns:
+            bool: True if the symbol has a complete line.
+        """
+        if symbol is PlayerSymbol.X:
+            return self.complete_x > 0
+
+        return self.complete_o > 0
+
+    def is_full(self) -> bool:
+        """
+        Check if every cell of the board is taken.
+
+        Returns:
+            bool: True if there are no empty cells.
+        """
+        return self.filled == self.geometry.cells
@@ -1,10 +1,18 @@
 from tic_tac_toe.game_type.base import BaseTicTacToe
+from tic_tac_toe.game_type.board import CLASSIC, Geometry
 from tic_tac_toe.player.base import Player
 
 
 class ClassicTicTacToe(BaseTicTacToe):
-    def __init__(self, player: Player, opponent: Player) -> None:
-        super().__init__(player, opponent)
+    __slots__ = ()
+
+    def __init__(
+        self,
+        player: Player,
+        opponent: Player,
+        geometry: Geometry = CLASSIC,
+    ) -> None:
+        super().__init__(player, opponent, geometry)
 
     def play(self) -> None:
         super().play()
@@ -1,17 +1,75 @@
-from queue import Queue
+from collections import Counter
 
-from tic_tac_toe.game_type.base import BaseTicTacToe, Move
+from tic_tac_toe.game_type.base import BaseTicTacToe, Move, MoveRequest
+from tic_tac_toe.game_type.board import CLASSIC, Geometry
+from tic_tac_toe.game_type.move_log import MoveLog
 from tic_tac_toe.player.base import Player
 
 
 class LimitedMemoryTicTacToe(BaseTicTacToe):
-    def __init__(self, player: Player, opponent: Player) -> None:
-        super().__init__(player, opponent)
-        self._memory: Queue[Move] = Queue()
+    # The oldest mark is removed once the memory reaches this many moves on
+    # the classic board. Each player keeps as many marks as it needs in a row.
+    MEMORY_LIMIT = 7
+    # The game is a draw once the same position happens this many times.
+    REPETITION_LIMIT = 3
+
+    __slots__ = ('_memory_limit', '_memory', '_positions', '_draw')
+
+    def __init__(
+        self,
+        player: Player,
+        opponent: Player,
+        geometry: Geometry = CLASSIC,
+    ) -> None:
+        super().__init__(player, opponent, geometry)
+        self._memory_limit: int = 2 * geometry.in_a_row + 1
+        self._memory: MoveLog = MoveLog(self._memory_limit)
+        # The times each position happened, keyed by _position_key().
+        self._positions: Counter[int] = Counter()
+        self._draw: bool = False
+
+    @property
+    def memory(self) -> tuple[int, ...]:
+        """
+        Get the cells of the marks still on the board.
+
+        Returns:
+            tuple[int, ...]: The cells in memory, oldest first.
+        """
+        return tuple(code >> 1 for code in self._memory)
+
+    @property
+    def game_over(self) -> bool:
+        """
+        Check if the game is over.
+
+        Returns:
+            bool: True if there is a winner or the game is drawn by
+                  repetition, False otherwise.
+        """
+        return super().game_over or self._draw
 
     def play(self) -> None:
         super().play()
 
+    def print_results(self) -> None:
+        """
+        Print the results of the game.
+        """
+        if self._draw:
+            print("It's a draw by repetition!")
+
+        super().print_results()
+
+    def move_request(self) -> MoveRequest:
+        """
+        Get what the current player is shown, sharing the memory queue.
+
+        Returns:
+            MoveRequest: The board and the cells in memory.
+        """
+        return MoveRequest(board=self.bitboard, memory=self.memory)
+
     def _before_move(self, move: int) -> None:
         """
         Puts the move in the memory queue before the move is made.
@@ -20,18 +78,72 @@ class LimitedMemoryTicTacToe(BaseTicTacToe):
             move (int): The cell number where the move is made.
         """
         super()._before_move(move)
-        self._memory.put(Move(player=self._current_player, cell=move))
+        self._memory.append(self._encode(move))
 
-        if self._memory.qsize() == 7:
+        if len(self._memory) == self._memory_limit:
             self._remove_first()
 
+    def _after_move(self, move: int) -> None:
+        """
+        Counts the new position and flags a draw when it repeats too often.
+
+        Parameters:
+            move (int): The move that was made.
+        """
+        super()._after_move(move)
+
+        position = self._position_key()
+        self._positions[position] += 1
+
+        if (
+            self._winner is None
+            and self._positions[position] >= self.REPETITION_LIMIT
+        ):
+            self._draw = True
+
+    def _undo_move(self, move: Move) -> None:
+        """
+        Forgets the position of a move and puts back the mark it removed.
+
+        Parameters:
+            move (Move): The move taken back, already out of the history.
+        """
+        position = self._position_key()
+        self._positions[position] -= 1
+        if not self._positions[position]:
+            del self._positions[position]
+
+        self._draw = False
+        self._memory.pop()
+        super()._undo_move(move)
+
+        ply = len(self._move_history)
+        if ply >= self._memory_limit - 1:
+            removed = self._move_history[ply - self._memory_limit + 1]
+            self._memory.appendleft(removed)
+            self._place_mark(self._decode(removed).player.symbol, removed >> 1)
+
     def _remove_first(self) -> None:
         """
         Removes the first move from the memory queue and updates the board.
         """
-        move: Move = self._memory.get()
+        move = self._decode(self._memory.popleft())
+        self._remove_mark(move.player.symbol, move.cell)
+
+    def _position_key(self) -> int:
+        """
+        Get the key of the position, for the repetition rule.
+
+        The position is the order of the moves in memory and the player to
+        move, packed in an integer.
+
+        Returns:
+            int: A key equal only for equal positions.
+        """
+        bits = self.geometry.cells.bit_length() + 1
+        key = 0
 
-        row = (move.cell - 1) // 3
-        col = (move.cell - 1) % 3
+        for code in self._memory:
+            key = key << bits | code
 
-        self.board[row][col] = None
+        return key << 1 | (self._current_player is self.opponent)
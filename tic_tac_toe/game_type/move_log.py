@@ -0,0 +1,208 @@
+from collections.abc import Iterator
+
+
+class MoveLog:
+    """
+    Ring buffer of moves with O(1) push and pop at both ends.
+
+    The moves are the integer codes the games make of them, so a log holds
+    no object per move.
+
+    Moves taken back with pop() stay in the buffer after the last move, so
+    they can be made again with redo(). Appending the move that would be
+    redone keeps the rest of them, anything else drops them.
+
+    The buffer is preallocated with a capacity and only doubles when it's
+    full, which never happens for logs trimmed with popleft().
+    """
+
+    __slots__ = ('_items', '_start', '_size', '_redo')
+
+    def __init__(self, capacity: int) -> None:
+        """
+        Initializes a new instance of the MoveLog class.
+
+        Args:
+            capacity (int): The number of moves preallocated.
+        """
+        self._items: list[int | None] = [None] * max(capacity, 1)
+        self._start: int = 0
+        self._size: int = 0
+        self._redo: int = 0
+
+    @property
+    def can_redo(self) -> bool:
+        """
+        Check if there are moves taken back that can be made again.
+
+        Returns:
+            bool: True if redo() would return a move.
+        """
+        return self._redo > 0
+
+    def peek_redo(self) -> int:
+        """
+        Get the move that redo() would make, without making it.
+
+        Returns:
+            int: The most recent move taken back.
+
+        Raises:
+            IndexError: If there are no moves to redo.
+        """
+        if not self._redo:
+            raise IndexError('No moves to redo')
+
+        return self._at(self._size)
+
+    def append(self, move: int) -> None:
+        """
+        Add a move after the last one.
+
+        Args:
+            move (int): The move to add.
+        """
+        if self._redo:
+            if self._at(self._size) == move:
+                self._redo -= 1
+                self._size += 1
+                return
+
+            self._redo = 0
+
+        if self._size == len(self._items):
+            self._grow()
+
+        self._set(self._size, move)
+        self._size += 1
+
+    def appendleft(self, move: int) -> None:
+        """
+        Add a move before the oldest one, dropping the moves to redo.
+
+        Args:
+            move (int): The move to add.
+        """
+        self._redo = 0
+
+        if self._size == len(self._items):
+            self._grow()
+
+        self._start = (self._start - 1) % len(self._items)
+        self._items[self._start] = move
+        self._size += 1
+
+    def pop(self) -> int:
+        """
+        Take back the last move, keeping it to redo.
+
+        Returns:
+            int: The last move.
+
+        Raises:
+            IndexError: If the log is empty.
+        """
+        if not self._size:
+            raise IndexError('pop from an empty move log')
+
+        self._size -= 1
+        self._redo += 1
+
+        return self._at(self._size)
+
+    def popleft(self) -> int:
+        """
+        Remove the oldest move.
+
+        Returns:
+            int: The oldest move.
+
+        Raises:
+            IndexError: If the log is empty.
+        """
+        if not self._size:
+            raise IndexError('popleft from an empty move log')
+
+        move = self._at(0)
+        self._items[self._start] = None
+        self._start = (self._start + 1) % len(self._items)
+        self._size -= 1
+
+        return move
+
+    def redo(self) -> int:
+        """
+        Make again the last move taken back.
+
+        Returns:
+            int: The move made again.
+
+        Raises:
+            IndexError: If there are no moves to redo.
+        """
+        move = self.peek_redo()
+        self._redo -= 1
+        self._size += 1
+
+        return move
+
+    def clear(self) -> None:
+        """
+        Remove every move, including the moves to redo.
+        """
+        self._items = [None] * len(self._items)
+        self._start = self._size = self._redo = 0
+
+    def _at(self, index: int) -> int:
+        """
+        Get the move at a position counted from the oldest one.
+
+        Args:
+            index (int): The position, which may point at a move to redo.
+
+        Returns:
+            int: The move at the position.
+        """
+        move = self._items[(self._start + index) % len(self._items)]
+        assert move is not None
+
+        return move
+
+    def _set(self, index: int, move: int) -> None:
+        """
+        Put a move at a position counted from the oldest one.
+
+        Args:
+            index (int): The position.
+            move (int): The move to put.
+        """
+        self._items[(self._start + index) % len(self._items)] = move
+
+    def _grow(self) -> None:
+        """
+        Double the capacity, moving the oldest move to the first slot.
+        """
+        capacity = len(self._items)
+        self._items = [
+            self._items[(self._start + index) % capacity]
+            for index in range(capacity)
+        ] + [None] * capacity
+        self._start = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[int]:
+        for index in range(self._size):
+            yield self._at(index)
+
+    def __getitem__(self, index: int) -> int:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError('move log index out of range')
+
+        return self._at(index)
+
+    def __repr__(self) -> str:
+        return f'MoveLog({list(self)!r})'
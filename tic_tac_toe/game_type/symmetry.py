@@ -0,0 +1,409 @@
+"""
+Board symmetries and Zobrist hashing.
+
+A square board has 8 symmetries, the rotations and reflections, and any
+other board has 4. Positions that only differ by a symmetry have the same
+value, so tables keyed by the canonical position, the smallest of its
+transformed versions, need about 8 times fewer entries. The transform that
+led to the canonical position is returned with it, so a move found for the
+canonical position can be mapped back.
+
+Zobrist keys are drawn from a generator seeded with the board size, so the
+hashes are the same in every process. A board is hashed whole when it's
+looked up, since classic positions are keyed by a precomputed table and
+only the other board sizes need a hash.
+"""
+
+from array import array
+from functools import cache
+from random import Random
+from typing import NamedTuple
+
+from tic_tac_toe.game_type.board import (
+    CELLS,
+    CLASSIC,
+    FULL_MASK,
+    BitBoard,
+    Geometry,
+    mask_cells,
+)
+from tic_tac_toe.player.base import PlayerSymbol
+
+IDENTITY = 0
+
+
+class Canonical(NamedTuple):
+    # The masks of the canonical position.
+    x: int
+    o: int
+    # The symmetry that maps the position to the canonical one.
+    transform: int
+
+
+@cache
+def transforms(geometry: Geometry = CLASSIC) -> tuple[tuple[int, ...], ...]:
+    """
+    Get the cell mapping of every symmetry of a board.
+
+    Args:
+        geometry (Geometry): The size of the board.
+
+    Returns:
+        tuple[tuple[int, ...], ...]: For each symmetry, starting with the
+        identity, the cell number each cell is moved to, indexed by the cell
+        number minus one.
+    """
+    rows, columns = geometry.rows, geometry.columns
+    last_row, last_col = rows - 1, columns - 1
+    moves = [
+        lambda r, c: (r, c),
+        lambda r, c: (last_row - r, last_col - c),
+        lambda r, c: (r, last_col - c),
+        lambda r, c: (last_row - r, c),
+    ]
+
+    if rows == columns:
+        moves += [
+            lambda r, c: (c, last_row - r),
+            lambda r, c: (last_col - c, r),
+            lambda r, c: (c, r),
+            lambda r, c: (last_col - c, last_row - r),
+        ]
+
+    mappings = []
+    for move in moves:
+        mapping = []
+        for cell in range(geometry.cells):
+            row, col = move(*divmod(cell, columns))
+            mapping.append(row * columns + col + 1)
+        mappings.append(tuple(mapping))
+
+    return tuple(mappings)
+
+
+@cache
+def inverses(geometry: Geometry = CLASSIC) -> tuple[int, ...]:
+    """
+    Get the symmetry that undoes each symmetry of a board.
+
+    Args:
+        geometry (Geometry): The size of the board.
+
+    Returns:
+        tuple[int, ...]: The index of the inverse of each symmetry.
+    """
+    mappings = transforms(geometry)
+    identity = mappings[IDENTITY]
+
+    return tuple(
+        next(
+            index
+            for index, inverse in enumerate(mappings)
+            if tuple(inverse[cell - 1] for cell in mapping) == identity
+        )
+        for mapping in mappings
+    )
+
+
+# The classic symmetries applied to every 9-bit mask.
+_CLASSIC_MASKS: tuple[tuple[int, ...], ...] = tuple(
+    tuple(
+        sum(1 << (mapping[cell - 1] - 1) for cell in mask_cells(mask))
+        for mask in range(FULL_MASK + 1)
+    )
+    for mapping in transforms(CLASSIC)
+)
+
+
+def map_cell(cell: int, transform: int, geometry: Geometry = CLASSIC) -> int:
+    """
+    Move a cell with a symmetry.
+
+    Args:
+        cell (int): The cell number.
+        transform (int): The index of the symmetry.
+        geometry (Geometry): The size of the board.
+
+    Returns:
+        int: The cell number it's moved to.
+    """
+    return transforms(geometry)[transform][cell - 1]
+
+
+def unmap_cell(cell: int, transform: int, geometry: Geometry = CLASSIC) -> int:
+    """
+    Move a cell back, undoing a symmetry.
+
+    Use it to turn a move found for a canonical position into a move of the
+    original one.
+
+    Args:
+        cell (int): The cell number after the symmetry.
+        transform (int): The index of the symmetry to undo.
+        geometry (Geometry): The size of the board.
+
+    Returns:
+        int: The cell number before the symmetry.
+    """
+    return map_cell(cell, inverses(geometry)[transform], geometry)
+
+
+def map_mask(mask: int, transform: int, geometry: Geometry = CLASSIC) -> int:
+    """
+    Move every cell of a mask with a symmetry.
+
+    Args:
+        mask (int): The mask.
+        transform (int): The index of the symmetry.
+        geometry (Geometry): The size of the board.
+
+    Returns:
+        int: The mask of the moved cells.
+    """
+    if geometry is CLASSIC:
+        return _CLASSIC_MASKS[transform][mask]
+
+    mapping = transforms(geometry)[transform]
+
+    return sum(1 << (mapping[cell - 1] - 1) for cell in mask_cells(mask))
+
+
+def canonical_masks(
+    own: int,
+    other: int,
+    geometry: Geometry = CLASSIC,
+) -> tuple[int, int, int]:
+    """
+    Get the canonical version of a pair of masks.
+
+    Args:
+        own (int): The first mask, e.g. of the player to move.
+        other (int): The second mask.
+        geometry (Geometry): The size of the board.
+
+    Returns:
+        tuple[int, int, int]: The canonical masks and the symmetry that
+        maps the given masks to them.
+    """
+    if geometry is CLASSIC:
+        return min(
+            (table[own], table[other], transform)
+            for transform, table in enumerate(_CLASSIC_MASKS)
+        )
+
+    return min(
+        (
+            map_mask(own, transform, geometry),
+            map_mask(other, transform, geometry),
+            transform,
+        )
+        for transform in range(len(transforms(geometry)))
+    )
+
+
+# The base-3 digits of every 9-bit mask, to index the classic positions.
+_TERNARY: tuple[int, ...] = tuple(
+    sum(3**bit for bit in range(CELLS) if mask >> bit & 1)
+    for mask in range(FULL_MASK + 1)
+)
+# The bits of a canonical key that hold the symmetry.
+_TRANSFORM_BITS = 3
+
+
+@cache
+def _classic_keys() -> array:
+    """
+    Canonicalize every classic position once.
+
+    Returns:
+        array: The canonical key of each position, shifted left by
+        _TRANSFORM_BITS and or-ed with its symmetry, indexed by the base-3
+        encoding of the position.
+    """
+    keys = array('I', bytes(4 * 3**CELLS))
+
+    for own in range(FULL_MASK + 1):
+        free = FULL_MASK & ~own
+        other = free
+
+        # Every subset of the free cells, down to the empty one.
+        while True:
+            canonical_own, canonical_other, transform = canonical_masks(
+                own, other
+            )
+            keys[_TERNARY[own] + 2 * _TERNARY[other]] = (
+                canonical_own << CELLS | canonical_other
+            ) << _TRANSFORM_BITS | transform
+
+            if not other:
+                break
+            other = (other - 1) & free
+
+    return keys
+
+
+def canonical_key(own: int, other: int) -> tuple[int, int]:
+    """
+    Get the key of a classic position shared by its symmetric versions.
+
+    Every position is canonicalized on the first call, so the next ones
+    are a single lookup.
+
+    Args:
+        own (int): The mask of the player to move.
+        other (int): The mask of the opponent.
+
+    Returns:
+        tuple[int, int]: The canonical masks packed as ``own << 9 | other``
+        and the symmetry that maps the position to them.
+    """
+    packed = _classic_keys()[_TERNARY[own] + 2 * _TERNARY[other]]
+
+    return packed >> _TRANSFORM_BITS, packed & (1 << _TRANSFORM_BITS) - 1
+
+
+def canonical(board: BitBoard) -> Canonical:
+    """
+    Get the canonical version of a board.
+
+    Args:
+        board (BitBoard): The board.
+
+    Returns:
+        Canonical: The canonical masks and the symmetry that maps the board
+        to them.
+    """
+    return Canonical(*canonical_masks(board.x, board.o, board.geometry))
+
+
+def canonical_cells(
+    cells: tuple[int, ...],
+    geometry: Geometry = CLASSIC,
+) -> tuple[tuple[int, ...], int]:
+    """
+    Get the canonical version of a sequence of cells, e.g. a move history.
+
+    Args:
+        cells (tuple[int, ...]): The cell numbers, in order.
+        geometry (Geometry): The size of the board.
+
+    Returns:
+        tuple[tuple[int, ...], int]: The smallest transformed sequence and
+        the symmetry that leads to it.
+    """
+    return min(
+        (tuple(mapping[cell - 1] for cell in cells), transform)
+        for transform, mapping in enumerate(transforms(geometry))
+    )
+
+
+HASH_BITS = 64
+HASH_MASK = (1 << HASH_BITS) - 1
+
+
+@cache
+def zobrist_keys(
+    geometry: Geometry = CLASSIC,
+) -> dict[PlayerSymbol, tuple[int, ...]]:
+    """
+    Get the Zobrist keys of a board, as seen through every symmetry.
+
+    Seen through a symmetry, a mark has the key of the cell it's moved to.
+    The key of a mark through each symmetry takes 64 bits of one integer,
+    the identity first, so a single XOR adds the mark to every hash.
+
+    Args:
+        geometry (Geometry): The size of the board.
+
+    Returns:
+        dict[PlayerSymbol, tuple[int, ...]]: The packed keys of each symbol
+        in each cell, indexed by the cell number minus one.
+    """
+    rng = Random(f'{geometry.rows}x{geometry.columns}')
+    mappings = transforms(geometry)
+    keys = {}
+
+    for symbol in PlayerSymbol:
+        base = [rng.getrandbits(HASH_BITS) for _ in range(geometry.cells)]
+        keys[symbol] = tuple(
+            sum(
+                base[mapping[cell] - 1] << (HASH_BITS * transform)
+                for transform, mapping in enumerate(mappings)
+            )
+            for cell in range(geometry.cells)
+        )
+
+    return keys
+
+
+class ZobristHash:
+    """
+    Zobrist hash of a board, seen through every symmetry.
+
+    The hashes of the board through every symmetry are packed in one
+    integer, like the keys, so the canonical hash is found without
+    transforming the board.
+    """
+
+    __slots__ = ('packed', 'symmetries')
+
+    def __init__(self, packed: int, symmetries: int) -> None:
+        """
+        Initializes a new instance of the ZobristHash class.
+
+        Args:
+            packed (int): The hash through each symmetry, packed like the
+                keys.
+            symmetries (int): The number of symmetries of the board.
+        """
+        self.packed = packed
+        self.symmetries = symmetries
+
+    @classmethod
+    def of(cls, board: BitBoard) -> 'ZobristHash':
+        """
+        Hash a whole board.
+
+        Args:
+            board (BitBoard): The board.
+
+        Returns:
+            ZobristHash: The hash of the board.
+        """
+        keys = zobrist_keys(board.geometry)
+        packed = 0
+
+        for symbol in PlayerSymbol:
+            for cell in mask_cells(board.mask(symbol)):
+                packed ^= keys[symbol][cell - 1]
+
+        return cls(packed, len(transforms(board.geometry)))
+
+    @property
+    def hashes(self) -> tuple[int, ...]:
+        """
+        Get the hash of the board seen through each symmetry.
+
+        Returns:
+            tuple[int, ...]: The 64-bit hashes, the identity first.
+        """
+        return tuple(
+            self.packed >> (HASH_BITS * transform) & HASH_MASK
+            for transform in range(self.symmetries)
+        )
+
+    def canonical(self) -> tuple[int, int]:
+        """
+        Get the hash shared by every symmetric version of the board.
+
+        The keys seen through a symmetry are the keys of the moved cells,
+        so the smallest hash marks the same canonical board for all of them.
+
+        Returns:
+            tuple[int, int]: The smallest hash and the symmetry it belongs
+            to, which maps the board to its canonical version.
+        """
+        hashes = self.hashes
+        transform = min(range(len(hashes)), key=hashes.__getitem__)
+
+        return hashes[transform], transform
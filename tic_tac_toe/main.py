@@ -1,10 +1,84 @@
+import argparse
+import math
+import random
+import sys
+from collections.abc import Iterator
+from contextlib import ExitStack
+from time import perf_counter
+from typing import NamedTuple, TextIO
+
+from tic_tac_toe import engine, metrics
 from tic_tac_toe.game_type.base import BaseTicTacToe
-from tic_tac_toe.setup.game import GameSetup
-from tic_tac_toe.setup.players import PlayersSetup
+from tic_tac_toe.player.base import Player, PlayerSymbol
+from tic_tac_toe.plugins import PLAYERS, VARIANTS
+from tic_tac_toe.setup.game import GameSetup, parse_geometry
+from tic_tac_toe.setup.players import HUMAN, PlayersSetup
+
+# The options that make the program play without setup prompts.
+SCRIPT_OPTIONS = (
+    'variant',
+    'board',
+    'symbol',
+    'player',
+    'opponent',
+    'games',
+    'seed',
+    'format',
+    'output',
+)
+
+
+# The playouts or sampled boards of each IA search in a seeded run, about
+# what the default time budget allows.
+SEEDED_NODE_BUDGET = 1_000
+
+
+class GameRow(NamedTuple):
+    # The number of the game, starting at 1.
+    game: int
+    # The symbol of the winner, or None for a draw.
+    winner: str | None
+    # The moves made, and the moves asked for including invalid ones.
+    moves: int
+    turns: int
+
+
+def enable_pondering(*players: Player) -> None:
+    """
+    Let the IA players search during their opponent's turn.
+
+    Args:
+        *players (Player): The players of the game.
+    """
+    from tic_tac_toe.player.ia import IA
+
+    for player in players:
+        if isinstance(player, IA):
+            player.pondering = True
+
+
+def bound_searches(*players: Player) -> None:
+    """
+    Bound the searches of the IA players by their work instead of the clock.
+
+    A search stopped by the clock runs a different number of playouts on
+    each run, so a seeded run wouldn't play the same games.
+
+    Args:
+        *players (Player): The players of the game.
+    """
+    from tic_tac_toe.player.ia import IA
 
+    for player in players:
+        if isinstance(player, IA):
+            player.node_budget = SEEDED_NODE_BUDGET
+            player.time_budget = math.inf
 
-def play_game() -> None:
+
+def play_game(ponder: bool = False) -> None:
     player, opponent = PlayersSetup().initialize_players()
+    if ponder:
+        enable_pondering(player, opponent)
     game: BaseTicTacToe = GameSetup(
         player=player,
         opponent=opponent,
@@ -15,9 +89,280 @@ def play_game() -> None:
     game.print_results()
 
 
-def main():
+def play_scripted(args: argparse.Namespace) -> Iterator[GameRow]:
+    """
+    Play the games described by the command line, without setup prompts.
+
+    Games between IAs are played without any output. A human player is
+    still asked for its moves and shown the board.
+
+    Args:
+        args (argparse.Namespace): The parsed command line.
+
+    Yields:
+        GameRow: The result of each game, as soon as it's over.
+    """
+    random.seed(args.seed)
+    player, opponent = PlayersSetup().create_players(
+        args.symbol, args.player, args.opponent
+    )
+    if args.seed is not None:
+        bound_searches(player, opponent)
+    if args.ponder:
+        enable_pondering(player, opponent)
+    setup = GameSetup(player=player, opponent=opponent)
+    interactive = HUMAN in (args.player, args.opponent)
+
+    for number in range(1, args.games + 1):
+        game = setup.create_game(args.variant, args.board)
+
+        if interactive:
+            turns = 0
+            while not game.game_over:
+                game.play()
+                turns += 1
+            game.print_results()
+        else:
+            turns = engine.run(game).turns
+
+        yield GameRow(
+            game=number,
+            winner=None if game.winner is None else str(game.winner.symbol),
+            moves=len(game.history),
+            turns=turns,
+        )
+
+
+def write_summary(args: argparse.Namespace, output: TextIO) -> dict:
+    """
+    Play the scripted games and write their results.
+
+    The ``csv`` format has one row per game, written as the games end. The
+    ``json`` and ``text`` formats only have the totals.
+
+    Args:
+        args (argparse.Namespace): The parsed command line.
+        output (TextIO): Where to write the results.
+
+    Returns:
+        dict: The totals, from the point of view of the main player.
+    """
+    writer = None
+    if args.format == 'csv':
+        import csv
+
+        writer = csv.writer(output)
+        writer.writerow(GameRow._fields)
+
+    symbol = str(args.symbol)
+    wins = draws = losses = moves = 0
+    start = perf_counter()
+
+    for row in play_scripted(args):
+        if row.winner is None:
+            draws += 1
+        elif row.winner == symbol:
+            wins += 1
+        else:
+            losses += 1
+        moves += row.moves
+
+        if writer is not None:
+            writer.writerow(row)
+
+    seconds = perf_counter() - start
+    board = args.board
+    summary = {
+        'variant': args.variant,
+        'board': f'{board.rows}x{board.columns}x{board.in_a_row}',
+        'symbol': symbol,
+        'player': args.player,
+        'opponent': args.opponent,
+        'seed': args.seed,
+        'games': args.games,
+        'wins': wins,
+        'draws': draws,
+        'losses': losses,
+        'mean_moves': moves / args.games if args.games else 0.0,
+        'seconds': seconds,
+        'games_per_second': args.games / seconds if seconds else 0.0,
+    }
+
+    match args.format:
+        case 'json':
+            import json
+
+            json.dump(summary, output, indent=2)
+            output.write('\n')
+        case 'text':
+            for key, value in summary.items():
+                output.write(f'{key}: {value}\n')
+
+    return summary
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description='Play Tic Tac Toe.',
+        epilog='Any of the scripted options plays without setup prompts, '
+        'with the defaults for the others.',
+    )
+    parser.add_argument(
+        '--serve',
+        action='store_true',
+        help='host games between remote players instead of playing',
+    )
+    parser.add_argument('--host', help='address to listen on')
+    parser.add_argument('--port', type=int, help='port to listen on')
+    parser.add_argument(
+        '--move-timeout',
+        type=float,
+        help='seconds a remote player has for each move',
+    )
+    parser.add_argument(
+        '--metrics',
+        metavar='PATH',
+        help='record metrics and write them to PATH at exit, as JSON if it '
+        'ends in .json, else in the Prometheus text format',
+    )
+    parser.add_argument(
+        '--ponder',
+        action='store_true',
+        help='let the IA search during the turn of a human opponent',
+    )
+
+    script = parser.add_argument_group('scripted options')
+    script.add_argument(
+        '--variant',
+        type=str.lower,
+        help='kind of play: classic, limited, blind or an installed plugin '
+        '(default: classic)',
+    )
+    script.add_argument(
+        '--board',
+        type=parse_geometry,
+        metavar='{classic,gomoku,RxCxK}',
+        help='size of the board and marks in a row to win '
+        '(default: classic)',
+    )
+    script.add_argument(
+        '--symbol',
+        type=str.upper,
+        choices=('X', 'O'),
+        help='symbol of the main player (default: X)',
+    )
+    script.add_argument(
+        '--player',
+        help='main player: human, easy, hard, mcts, learned or an installed '
+        f'plugin (default: {HUMAN})',
+    )
+    script.add_argument(
+        '--opponent',
+        help='opponent, like --player (default: hard)',
+    )
+    script.add_argument(
+        '--games', type=int, help='number of games to play (default: 1)'
+    )
+    script.add_argument(
+        '--seed',
+        type=int,
+        help='seed of the random moves, which also runs each IA search for '
+        'a fixed number of playouts instead of a time budget, so every run '
+        'plays the same games',
+    )
+    script.add_argument(
+        '--format',
+        choices=('text', 'json', 'csv'),
+        help='format of the results (default: text)',
+    )
+    script.add_argument(
+        '--output',
+        metavar='PATH',
+        help='file to write the results to (default: standard output)',
+    )
+
+    args = parser.parse_args(argv)
+    args.scripted = any(
+        getattr(args, name) is not None for name in SCRIPT_OPTIONS
+    )
+    if args.scripted and args.serve:
+        parser.error('the scripted options cannot be used with --serve')
+    if args.games is not None and args.games < 0:
+        parser.error('--games must not be negative')
+
+    defaults = {
+        'variant': 'classic',
+        'board': parse_geometry('classic'),
+        'symbol': 'X',
+        'player': HUMAN,
+        'opponent': 'hard',
+        'games': 1,
+        'format': 'text',
+    }
+    for name, value in defaults.items():
+        if getattr(args, name) is None:
+            setattr(args, name, value)
+
+    if args.variant not in VARIANTS:
+        parser.error(
+            f'unknown variant {args.variant!r}, expected one of '
+            f'{", ".join(VARIANTS.names())}'
+        )
+    for name in ('player', 'opponent'):
+        if getattr(args, name) not in PLAYERS:
+            parser.error(
+                f'unknown {name} {getattr(args, name)!r}, expected one of '
+                f'{", ".join(PLAYERS.names())}'
+            )
+    args.symbol = PlayerSymbol[args.symbol]
+
+    return args
+
+
+def main(argv: list[str] | None = None):
+    args = parse_args(argv)
+
+    if args.metrics:
+        metrics.enable()
+
+    try:
+        run(args)
+    finally:
+        if args.metrics:
+            metrics.REGISTRY.dump(args.metrics)
+
+
+def run(args: argparse.Namespace) -> None:
+    if args.serve:
+        import asyncio
+
+        from tic_tac_toe import server
+
+        options = {
+            'host': args.host,
+            'port': args.port,
+            'move_timeout': args.move_timeout,
+        }
+        try:
+            asyncio.run(
+                server.serve(
+                    **{k: v for k, v in options.items() if v is not None}
+                )
+            )
+        except KeyboardInterrupt:
+            print('\nBye!')
+        return
+
+    if args.scripted:
+        with ExitStack() as stack:
+            output = sys.stdout
+            if args.output is not None:
+                output = stack.enter_context(open(args.output, 'w', newline=''))
+            write_summary(args, output)
+        return
+
     try:
-        play_game()
+        play_game(args.ponder)
     except KeyboardInterrupt:
         print('\nBye!')
     except Exception as e:
@@ -0,0 +1,530 @@
+"""
+Optional instrumentation of games and players.
+
+The games call the active hooks around each move, each decision of a
+player and each render. While metrics are disabled, ``hooks`` is None and
+each of those points costs a single check.
+
+Call enable() to record into a registry, then dump it as JSON or in the
+Prometheus text format::
+
+    metrics.enable()
+    ...
+    metrics.REGISTRY.dump('metrics.prom')
+"""
+
+import os
+from bisect import bisect_left
+from time import perf_counter_ns
+from typing import TYPE_CHECKING, Any
+
+from tic_tac_toe.player.stats import SearchStats
+
+if TYPE_CHECKING:
+    from tic_tac_toe.game_type.base import BaseTicTacToe, MoveRequest
+    from tic_tac_toe.player.base import Player
+
+# Upper bounds of the histogram buckets of durations, in seconds.
+SECONDS_BUCKETS: tuple[float, ...] = (
+    0.000_01,
+    0.000_1,
+    0.001,
+    0.01,
+    0.1,
+    1.0,
+    10.0,
+)
+# Upper bounds of the histogram buckets of game lengths, in moves.
+MOVES_BUCKETS: tuple[float, ...] = (5, 6, 7, 8, 9, 12, 16, 24, 32, 64)
+
+# The help text, type and buckets of every metric.
+METRICS: dict[str, tuple[str, str, tuple[float, ...]]] = {
+    'tic_tac_toe_move_seconds': (
+        'Time a player took to choose a move.',
+        'histogram',
+        SECONDS_BUCKETS,
+    ),
+    'tic_tac_toe_step_seconds': (
+        'Time the game took to apply a move and check its end.',
+        'histogram',
+        SECONDS_BUCKETS,
+    ),
+    'tic_tac_toe_render_seconds': (
+        'Time taken to display the board.',
+        'histogram',
+        SECONDS_BUCKETS,
+    ),
+    'tic_tac_toe_game_length_moves': (
+        'Moves made in each finished game.',
+        'histogram',
+        MOVES_BUCKETS,
+    ),
+    'tic_tac_toe_games_total': (
+        'Finished games.',
+        'counter',
+        (),
+    ),
+    'tic_tac_toe_search_nodes_total': (
+        'Positions or playouts searched by the IA.',
+        'counter',
+        (),
+    ),
+    'tic_tac_toe_cache_hits_total': (
+        'IA moves answered by a table or a reused search tree.',
+        'counter',
+        (),
+    ),
+    'tic_tac_toe_cache_misses_total': (
+        'IA moves searched from scratch.',
+        'counter',
+        (),
+    ),
+}
+
+type Labels = tuple[tuple[str, str], ...]
+
+
+class Histogram:
+    """
+    Count of observations per bucket, with their sum.
+    """
+
+    __slots__ = ('bounds', 'counts', 'count', 'sum')
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        """
+        Initializes a new instance of the Histogram class.
+
+        Args:
+            bounds (tuple[float, ...]): The upper bounds of the buckets, in
+                ascending order. Larger values fall in a last bucket.
+        """
+        self.bounds = bounds
+        self.counts: list[int] = [0] * (len(bounds) + 1)
+        self.count: int = 0
+        self.sum: float = 0.0
+
+    def observe(self, value: float) -> None:
+        """
+        Add an observation.
+
+        Args:
+            value (float): The observed value.
+        """
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+
+class Registry:
+    """
+    Metrics recorded by the hooks, keyed by name and labels.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes a new instance of the Registry class.
+        """
+        self.counters: dict[str, dict[Labels, float]] = {}
+        self.histograms: dict[str, dict[Labels, Histogram]] = {}
+
+    def inc(self, name: str, value: float = 1, **labels: str) -> None:
+        """
+        Add to a counter.
+
+        Args:
+            name (str): The name of the counter.
+            value (float): The amount to add.
+            **labels (str): The labels of the series.
+        """
+        series = self.counters.setdefault(name, {})
+        key = tuple(sorted(labels.items()))
+        series[key] = series.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        """
+        Add an observation to a histogram.
+
+        Args:
+            name (str): The name of the histogram, one of METRICS.
+            value (float): The observed value.
+            **labels (str): The labels of the series.
+        """
+        series = self.histograms.setdefault(name, {})
+        key = tuple(sorted(labels.items()))
+        histogram = series.get(key)
+
+        if histogram is None:
+            histogram = series[key] = Histogram(METRICS[name][2])
+
+        histogram.observe(value)
+
+    def reset(self) -> None:
+        """
+        Forget every metric.
+        """
+        self.counters.clear()
+        self.histograms.clear()
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Get every metric as plain data.
+
+        Returns:
+            dict[str, Any]: The series of each metric by name, plus the
+            cache hit rate of each IA.
+        """
+        metrics: dict[str, Any] = {}
+
+        for name, series in self.counters.items():
+            metrics[name] = [
+                {'labels': dict(labels), 'value': value}
+                for labels, value in series.items()
+            ]
+
+        for name, series in self.histograms.items():
+            metrics[name] = [
+                {
+                    'labels': dict(labels),
+                    'count': histogram.count,
+                    'sum': histogram.sum,
+                    'buckets': dict(
+                        zip(
+                            (*map(str, histogram.bounds), '+Inf'),
+                            histogram.counts,
+                            strict=True,
+                        )
+                    ),
+                }
+                for labels, histogram in series.items()
+            ]
+
+        hits = self.counters.get('tic_tac_toe_cache_hits_total', {})
+        misses = self.counters.get('tic_tac_toe_cache_misses_total', {})
+        metrics['cache_hit_rate'] = {
+            dict(labels).get('player', ''): hits.get(labels, 0)
+            / (hits.get(labels, 0) + misses.get(labels, 0))
+            for labels in hits.keys() | misses.keys()
+        }
+
+        return metrics
+
+    def to_json(self) -> str:
+        """
+        Write every metric as JSON.
+
+        Returns:
+            str: The snapshot of the registry.
+        """
+        import json
+
+        return json.dumps(self.snapshot(), indent=2)
+
+    def to_prometheus(self) -> str:
+        """
+        Write every metric in the Prometheus text format.
+
+        Returns:
+            str: The exposition of every series.
+        """
+        lines = []
+
+        for name, (help_text, kind, _) in METRICS.items():
+            counters = self.counters.get(name, {})
+            histograms = self.histograms.get(name, {})
+            if not counters and not histograms:
+                continue
+
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} {kind}')
+
+            for labels, value in counters.items():
+                lines.append(f'{name}{_format_labels(labels)} {value:g}')
+
+            for labels, histogram in histograms.items():
+                total = 0
+                for bound, count in zip(
+                    (*histogram.bounds, float('inf')),
+                    histogram.counts,
+                    strict=True,
+                ):
+                    total += count
+                    le = '+Inf' if bound == float('inf') else f'{bound:g}'
+                    bucket = _format_labels((*labels, ('le', le)))
+                    lines.append(f'{name}_bucket{bucket} {total}')
+
+                lines.append(
+                    f'{name}_sum{_format_labels(labels)} {histogram.sum:g}'
+                )
+                lines.append(
+                    f'{name}_count{_format_labels(labels)} {histogram.count}'
+                )
+
+        return '\n'.join(lines) + '\n'
+
+    def dump(self, path: str | os.PathLike[str]) -> None:
+        """
+        Write a snapshot to a file, replacing it atomically.
+
+        Files ending in ``.json`` get JSON, any other the Prometheus text
+        format, e.g. for the textfile collector of the node exporter.
+
+        Args:
+            path (str | os.PathLike[str]): The file to write.
+        """
+        path = os.fspath(path)
+        if path.endswith('.json'):
+            text = self.to_json()
+        else:
+            text = self.to_prometheus()
+        directory, name = os.path.split(path)
+        temporary = os.path.join(directory, f'.{name}.tmp')
+
+        with open(temporary, 'w') as file:
+            file.write(text)
+        os.replace(temporary, path)
+
+
+def _format_labels(labels: Labels) -> str:
+    """
+    Write the labels of a series.
+
+    Args:
+        labels (Labels): The label names and values.
+
+    Returns:
+        str: The labels between braces, or nothing if there are none.
+    """
+    if not labels:
+        return ''
+
+    pairs = ','.join(
+        '{}="{}"'.format(
+            name,
+            value.replace('\\', '\\\\')
+            .replace('"', '\\"')
+            .replace('\n', '\\n'),
+        )
+        for name, value in labels
+    )
+
+    return f'{{{pairs}}}'
+
+
+def player_label(player: 'Player') -> str:
+    """
+    Get the label of a kind of player.
+
+    Args:
+        player (Player): The player.
+
+    Returns:
+        str: The class name, with the level for IAs, e.g. ``ia_hard``.
+    """
+    name = type(player).__name__.lower()
+    level = getattr(player, 'level', None)
+
+    return f'{name}_{level}' if level is not None else name
+
+
+class Hooks:
+    """
+    Records the events of games and players in a registry.
+    """
+
+    def __init__(self, registry: Registry) -> None:
+        """
+        Initializes a new instance of the Hooks class.
+
+        Args:
+            registry (Registry): Where to record the metrics.
+        """
+        self.registry = registry
+
+    @staticmethod
+    def clock() -> int:
+        """
+        Read the clock used by the hooks.
+
+        Returns:
+            int: The time in nanoseconds.
+        """
+        return perf_counter_ns()
+
+    def move(
+        self,
+        game: 'BaseTicTacToe',
+        player: 'Player',
+        start: int,
+        before: tuple[int, int, int, int] | None,
+    ) -> None:
+        """
+        Record the decision of a player.
+
+        Args:
+            game (BaseTicTacToe): The game.
+            player (Player): The player who chose a move.
+            start (int): The clock when the player was asked.
+            before (tuple[int, int, int, int] | None): The search stats of
+                the player when it was asked, if it has any.
+        """
+        elapsed = (self.clock() - start) / 1e9
+        label = player_label(player)
+        self.registry.observe(
+            'tic_tac_toe_move_seconds',
+            elapsed,
+            variant=type(game).__name__,
+            player=label,
+        )
+
+        stats = getattr(player, 'stats', None)
+        if before is None or not isinstance(stats, SearchStats):
+            return
+
+        _, nodes, hits, misses = (
+            now - then
+            for now, then in zip(stats.snapshot(), before, strict=True)
+        )
+        for name, value in (
+            ('tic_tac_toe_search_nodes_total', nodes),
+            ('tic_tac_toe_cache_hits_total', hits),
+            ('tic_tac_toe_cache_misses_total', misses),
+        ):
+            if value:
+                self.registry.inc(name, value, player=label)
+
+    def request(
+        self,
+        game: 'BaseTicTacToe',
+        request: 'MoveRequest',
+    ) -> int:
+        """
+        Ask the current player of a game for a move, recording it.
+
+        Args:
+            game (BaseTicTacToe): The game.
+            request (MoveRequest): What the player is shown.
+
+        Returns:
+            int: The cell number chosen by the player.
+        """
+        player = game.current_player
+        before = _search_snapshot(player)
+        start = self.clock()
+        move = player.make_move(**request._asdict())
+        self.move(game, player, start, before)
+
+        return move
+
+    async def request_async(
+        self,
+        game: 'BaseTicTacToe',
+        request: 'MoveRequest',
+    ) -> int:
+        """
+        Ask the current player of a game for a move without blocking,
+        recording it.
+
+        Args:
+            game (BaseTicTacToe): The game.
+            request (MoveRequest): What the player is shown.
+
+        Returns:
+            int: The cell number chosen by the player.
+        """
+        player = game.current_player
+        before = _search_snapshot(player)
+        start = self.clock()
+        move = await player.make_move_async(**request._asdict())
+        self.move(game, player, start, before)
+
+        return move
+
+    def step(self, game: 'BaseTicTacToe', start: int) -> None:
+        """
+        Record a move applied to a game, and the game if it ended.
+
+        Args:
+            game (BaseTicTacToe): The game, after the move.
+            start (int): The clock before the move was applied.
+        """
+        variant = type(game).__name__
+        self.registry.observe(
+            'tic_tac_toe_step_seconds',
+            (self.clock() - start) / 1e9,
+            variant=variant,
+        )
+
+        if not game.game_over:
+            return
+
+        winner = game.winner
+        outcome = 'draw' if winner is None else f'{winner.symbol}_wins'
+        self.registry.inc(
+            'tic_tac_toe_games_total', variant=variant, outcome=outcome
+        )
+        self.registry.observe(
+            'tic_tac_toe_game_length_moves',
+            len(game.history),
+            variant=variant,
+        )
+
+    def render(self, game: 'BaseTicTacToe', start: int) -> None:
+        """
+        Record the display of a board.
+
+        Args:
+            game (BaseTicTacToe): The game displayed.
+            start (int): The clock before the display.
+        """
+        self.registry.observe(
+            'tic_tac_toe_render_seconds',
+            (self.clock() - start) / 1e9,
+            variant=type(game).__name__,
+        )
+
+
+def _search_snapshot(player: 'Player') -> tuple[int, int, int, int] | None:
+    """
+    Get the search stats of a player, if it keeps any.
+
+    Args:
+        player (Player): The player.
+
+    Returns:
+        tuple[int, int, int, int] | None: The totals of its searches.
+    """
+    stats = getattr(player, 'stats', None)
+
+    return stats.snapshot() if isinstance(stats, SearchStats) else None
+
+
+REGISTRY = Registry()
+
+# The active hooks, or None while metrics are disabled.
+hooks: Hooks | None = None
+
+
+def enable(registry: Registry | None = None) -> Hooks:
+    """
+    Start recording metrics.
+
+    Args:
+        registry (Registry | None): Where to record them. Defaults to the
+            shared REGISTRY.
+
+    Returns:
+        Hooks: The active hooks.
+    """
+    global hooks
+    hooks = Hooks(REGISTRY if registry is None else registry)
+
+    return hooks
+
+
+def disable() -> None:
+    """
+    Stop recording metrics.
+    """
+    global hooks
+    hooks = None
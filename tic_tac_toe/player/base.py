@@ -1,9 +1,14 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from enum import StrEnum
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from tic_tac_toe.game_type.board import BitBoard
 
 type PlayerOrNone = Player | None
 type Board = list[list[PlayerOrNone]]
-type BoardOrNone = Board | None
+type BoardOrNone = BitBoard | None
 
 
 class PlayerSymbol(StrEnum):
@@ -12,6 +17,8 @@ class PlayerSymbol(StrEnum):
 
 
 class Player(ABC):
+    __slots__ = ('symbol',)
+
     def __init__(self, symbol: PlayerSymbol) -> None:
         """
         Initializes a new instance of the class.
@@ -32,14 +39,60 @@ class Player(ABC):
         self,
         board: BoardOrNone,
         hide_move: bool = False,
+        memory: Sequence[int] | None = None,
     ) -> int:
         """
         Makes player move.
 
         Args:
             board (BoardOrNone): The current state of the board.
+            hide_move (bool): Whether the move must be hidden from the others.
+            memory (Sequence[int] | None): The cells of the marks still on the
+                board, oldest first, in variants that forget old moves.
 
         Returns:
             int: The index of the cell where the move was made.
         """
         raise NotImplementedError('Player.make_move() not implemented')
+
+    async def make_move_async(
+        self,
+        board: BoardOrNone,
+        hide_move: bool = False,
+        memory: Sequence[int] | None = None,
+    ) -> int:
+        """
+        Makes player move without blocking the event loop.
+
+        The default calls make_move() right away, which suits players that
+        answer at once. Players that wait or think override it.
+
+        Args:
+            board (BoardOrNone): The current state of the board.
+            hide_move (bool): Whether the move must be hidden from the others.
+            memory (Sequence[int] | None): The cells of the marks still on the
+                board, oldest first, in variants that forget old moves.
+
+        Returns:
+            int: The index of the cell where the move was made.
+        """
+        return self.make_move(board, hide_move, memory)
+
+    # Not abstract, since most players never ponder.
+    def start_pondering(self, board: 'BitBoard') -> None:  # noqa: B027
+        """
+        Think during the opponent's turn, until stop_pondering() is called.
+
+        The default does nothing. Players that search override it, to run
+        the search in the background and answer faster once it's their turn.
+
+        Args:
+            board (BitBoard): The board the opponent is choosing a move on.
+        """
+
+    def stop_pondering(self) -> None:  # noqa: B027
+        """
+        Stop thinking, since the opponent has chosen its move.
+
+        The default does nothing.
+        """
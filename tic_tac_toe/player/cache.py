@@ -0,0 +1,417 @@
+"""
+Persistent cache of the moves found by the IA searches.
+
+The moves are stored in a SQLite database, keyed by the variant and the
+canonical position, so every process and every run that opens the same file
+shares them. A move is stored for the canonical position and mapped back to
+the board it's asked for, so the 8 symmetric versions of a position share
+one entry.
+
+The database holds at most ``capacity`` entries. When a write makes it grow
+past that, the least recently used entries are evicted. The last use of an
+entry is only written again once it's older than a minute, and in batches,
+so reading the cache rarely takes the write lock. Writers in other
+processes wait for each other, so a tournament's worker processes can share
+one file. Each process also keeps the entries it used in memory, and
+counts a use of one as a use of the stored entry.
+"""
+
+import os
+import sqlite3
+from collections.abc import Iterable, Sequence
+from functools import cache
+from time import time_ns
+
+from tic_tac_toe.game_type.blind import BlindBoard
+from tic_tac_toe.game_type.board import CLASSIC, BitBoard
+from tic_tac_toe.game_type.symmetry import (
+    HASH_MASK,
+    ZobristHash,
+    canonical_cells,
+    canonical_key,
+)
+from tic_tac_toe.player.base import PlayerSymbol
+
+DEFAULT_CAPACITY = 1_000_000
+# The entries each process keeps in memory.
+MEMO_SIZE = 65_536
+# How old, in nanoseconds, the last use of an entry gets before it's updated.
+USE_RESOLUTION = 60 * 10**9
+# The last uses kept in memory before they're written together.
+USE_BATCH = 256
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS positions (
+    variant TEXT NOT NULL,
+    key INTEGER NOT NULL,
+    move INTEGER NOT NULL,
+    effort INTEGER NOT NULL,
+    used INTEGER NOT NULL,
+    PRIMARY KEY (variant, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS positions_used ON positions (used);
+"""
+
+
+def _mix(value: int) -> int:
+    """
+    Scramble a 64-bit integer, with the finalizer of SplitMix64.
+
+    Args:
+        value (int): The integer.
+
+    Returns:
+        int: A 64-bit integer that differs in about half of its bits for
+        inputs that differ in one.
+    """
+    value = (value + 0x9E3779B97F4A7C15) & HASH_MASK
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & HASH_MASK
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & HASH_MASK
+
+    return value ^ (value >> 31)
+
+
+def _fold(values: Iterable[int]) -> int:
+    """
+    Hash a sequence of small integers, the same way in every process.
+
+    Args:
+        values (Iterable[int]): The integers, in order.
+
+    Returns:
+        int: The 64-bit hash.
+    """
+    key = 0
+
+    for value in values:
+        key = _mix(key ^ value)
+
+    return key
+
+
+@cache
+def _salt(symbol: PlayerSymbol, hidden: int) -> int:
+    """
+    Hash what a board key depends on besides the marks.
+
+    Args:
+        symbol (PlayerSymbol): The symbol of the player to move.
+        hidden (int): The number of opponent marks not shown.
+
+    Returns:
+        int: The 64-bit hash.
+    """
+    return _fold((symbol is PlayerSymbol.O, hidden))
+
+
+def board_key(board: BitBoard, symbol: PlayerSymbol) -> tuple[int, int]:
+    """
+    Get the cache key of a board, for the player to move.
+
+    The hidden marks of a blind board are part of the key, since the same
+    known cells call for different moves with more marks hidden.
+
+    Args:
+        board (BitBoard): The board.
+        symbol (PlayerSymbol): The symbol of the player to move.
+
+    Returns:
+        tuple[int, int]: The key and the symmetry that maps the board to its
+        canonical version.
+    """
+    hidden = board.hidden if isinstance(board, BlindBoard) else 0
+    salt = _salt(symbol, hidden)
+
+    if board.geometry is CLASSIC:
+        # Every classic position is canonicalized once, in a table.
+        packed, transform = canonical_key(board.x, board.o)
+        return packed ^ salt, transform
+
+    hashed, transform = ZobristHash.of(board).canonical()
+
+    return hashed ^ salt, transform
+
+
+def memory_key(memory: Sequence[int]) -> tuple[int, int]:
+    """
+    Get the cache key of the memory of a limited memory game.
+
+    Args:
+        memory (Sequence[int]): The cells in memory, oldest first.
+
+    Returns:
+        tuple[int, int]: The key and the symmetry that maps the memory to its
+        canonical version.
+    """
+    cells, transform = canonical_cells(tuple(memory))
+
+    return _fold((len(cells), *cells)), transform
+
+
+class PositionCache:
+    """
+    Moves found by the IA searches, shared through a SQLite database.
+
+    The connection is opened on first use in each process, so a cache can
+    be handed to worker processes and pickled with the IA that uses it.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        capacity: int = DEFAULT_CAPACITY,
+    ) -> None:
+        """
+        Initializes a new instance of the PositionCache class.
+
+        Args:
+            path (str | os.PathLike[str]): The database file, created if
+                it doesn't exist.
+            capacity (int): The number of entries kept.
+        """
+        self.path = os.fspath(path)
+        self.capacity = capacity
+        self.hits: int = 0
+        self.misses: int = 0
+        self._connection: sqlite3.Connection | None = None
+        self._pid: int | None = None
+        # The move, effort and last use written of the entries used by
+        # this process.
+        self._memo: dict[tuple[str, int], tuple[int, int, int]] = {}
+        # The last uses not written yet, as update parameters.
+        self._uses: list[tuple[int, str, int]] = []
+        # Writes left before the number of entries is checked again.
+        self._writes_to_check: int = 0
+
+    def get(self, variant: str, key: int, effort: int = 0) -> int | None:
+        """
+        Get the move stored for a position.
+
+        Args:
+            variant (str): The namespace of the position, e.g. the variant,
+                the board size and the search that found the move.
+            key (int): The 64-bit key of the canonical position.
+            effort (int): The least search effort the move must have been
+                found with, e.g. the time budget in microseconds.
+
+        Returns:
+            int | None: The move for the canonical position, or None if
+            there's none found with enough effort.
+        """
+        memo = self._memo.get((variant, key))
+        if memo is not None and memo[1] >= effort:
+            self.hits += 1
+            self._use(variant, key, memo)
+            return memo[0]
+
+        connection = self._connect()
+        row = connection.execute(
+            'SELECT move, effort, used FROM positions '
+            'WHERE variant = ? AND key = ? AND effort >= ?',
+            (variant, _signed(key), effort),
+        ).fetchone()
+
+        if row is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        move, stored_effort, used = row
+        self._use(variant, key, (move, stored_effort, used))
+
+        return move
+
+    def put(self, variant: str, key: int, move: int, effort: int = 0) -> None:
+        """
+        Store the move found for a position.
+
+        A move found with less effort than the stored one is ignored.
+
+        Args:
+            variant (str): The namespace of the position.
+            key (int): The 64-bit key of the canonical position.
+            move (int): The move for the canonical position.
+            effort (int): The search effort the move was found with.
+        """
+        now = time_ns()
+        connection = self._connect()
+        connection.execute(
+            'INSERT INTO positions (variant, key, move, effort, used) '
+            'VALUES (?, ?, ?, ?, ?) '
+            'ON CONFLICT (variant, key) DO UPDATE SET '
+            'move = excluded.move, effort = excluded.effort, '
+            'used = excluded.used '
+            'WHERE excluded.effort >= positions.effort',
+            (variant, _signed(key), move, effort, now),
+        )
+        memo = self._memo.get((variant, key))
+        if memo is None or memo[1] <= effort:
+            self._remember(variant, key, (move, effort, now))
+
+        self._writes_to_check -= 1
+        if self._writes_to_check <= 0:
+            self.evict()
+
+    def evict(self) -> int:
+        """
+        Remove the least recently used entries beyond the capacity.
+
+        The number of entries is only counted every few writes, so the
+        database may briefly hold a few more than the capacity.
+
+        Returns:
+            int: The number of entries removed.
+        """
+        self.flush()
+        connection = self._connect()
+        (size,) = connection.execute(
+            'SELECT count(*) FROM positions'
+        ).fetchone()
+        excess = max(0, size - self.capacity)
+
+        if excess:
+            # Free some room at once, so the next writes don't evict again.
+            excess += self.capacity // 64
+            connection.execute(
+                'DELETE FROM positions WHERE (variant, key) IN ('
+                'SELECT variant, key FROM positions ORDER BY used LIMIT ?)',
+                (excess,),
+            )
+
+        self._writes_to_check = max(
+            1, min(self.capacity - size + excess, 1_024)
+        )
+
+        return excess
+
+    def flush(self) -> None:
+        """
+        Write the last uses of the entries kept in memory.
+        """
+        if not self._uses:
+            return
+
+        self._connect().executemany(
+            'UPDATE positions SET used = ? WHERE variant = ? AND key = ?',
+            self._uses,
+        )
+        self._uses.clear()
+
+    def _use(
+        self,
+        variant: str,
+        key: int,
+        entry: tuple[int, int, int],
+    ) -> None:
+        """
+        Keep an entry that was just used, and its last use once it's old.
+
+        Args:
+            variant (str): The namespace of the position.
+            key (int): The 64-bit key of the canonical position.
+            entry (tuple[int, int, int]): The move, effort and last use
+                written of the entry.
+        """
+        now = time_ns()
+
+        if now - entry[2] > USE_RESOLUTION:
+            entry = (*entry[:2], now)
+            self._uses.append((now, variant, _signed(key)))
+            if len(self._uses) >= USE_BATCH:
+                self.flush()
+
+        self._remember(variant, key, entry)
+
+    def _remember(
+        self,
+        variant: str,
+        key: int,
+        entry: tuple[int, int, int],
+    ) -> None:
+        """
+        Keep an entry in the memory of this process.
+
+        The memory is emptied when it's full.
+
+        Args:
+            variant (str): The namespace of the position.
+            key (int): The 64-bit key of the canonical position.
+            entry (tuple[int, int, int]): The move, effort and last use
+                written of the entry.
+        """
+        if len(self._memo) >= MEMO_SIZE:
+            self._memo.clear()
+
+        self._memo[variant, key] = entry
+
+    def __len__(self) -> int:
+        (size,) = (
+            self._connect().execute('SELECT count(*) FROM positions').fetchone()
+        )
+
+        return size
+
+    def close(self) -> None:
+        """
+        Write the last uses kept in memory and close the connection of this
+        process, if it's open.
+        """
+        if self._connection is not None and self._pid == os.getpid():
+            self.flush()
+            self._connection.close()
+
+        self._connection = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Get the connection of this process, opening it if needed.
+
+        Returns:
+            sqlite3.Connection: The connection, in autocommit mode.
+        """
+        if self._connection is not None and self._pid == os.getpid():
+            return self._connection
+
+        connection = sqlite3.connect(
+            self.path, timeout=60.0, isolation_level=None
+        )
+        connection.execute('PRAGMA journal_mode = WAL')
+        connection.execute('PRAGMA synchronous = NORMAL')
+        connection.executescript(_SCHEMA)
+
+        self._connection = connection
+        self._pid = os.getpid()
+        self._writes_to_check = 0
+
+        return connection
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state['_connection'] = None
+        state['_pid'] = None
+        state['_memo'] = {}
+        state['_uses'] = []
+
+        return state
+
+    def __enter__(self) -> 'PositionCache':
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f'PositionCache({self.path!r}, capacity={self.capacity})'
+
+
+def _signed(key: int) -> int:
+    """
+    Store a 64-bit key in a SQLite integer, which is signed.
+
+    Args:
+        key (int): The unsigned key.
+
+    Returns:
+        int: The key as a signed 64-bit integer.
+    """
+    return key - (1 << 64) if key >> 63 else key
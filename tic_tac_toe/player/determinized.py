@@ -0,0 +1,160 @@
+from random import Random, getrandbits
+from time import monotonic
+
+from tic_tac_toe.game_type.blind import BlindBoard
+from tic_tac_toe.game_type.board import (
+    FULL_MASK,
+    cell_bit,
+    is_winning_mask,
+    mask_cells,
+)
+from tic_tac_toe.player import pool
+from tic_tac_toe.player.base import PlayerSymbol
+from tic_tac_toe.player.stats import SearchStats
+
+# Like the default of ia.DEFAULT_TIME_BUDGET, within a 50 ms move latency.
+DEFAULT_TIME_BUDGET = 0.03
+
+# Determinizations sampled between two reads of the clock.
+_BATCH = 16
+
+
+def best_move(
+    board: BlindBoard,
+    symbol: PlayerSymbol,
+    time_budget: float = DEFAULT_TIME_BUDGET,
+    workers: int | None = None,
+    stats: SearchStats | None = None,
+    sample_budget: int | None = None,
+) -> int:
+    """
+    Get a move for the blind variant by determinized Monte Carlo sampling.
+
+    The hidden opponent marks are placed at random among the unknown cells,
+    rejecting placements where the opponent would already have won, and every
+    candidate move is scored with a random playout on each sampled board.
+
+    Args:
+        board (BlindBoard): The board as known by the player.
+        symbol (PlayerSymbol): The symbol to move.
+        time_budget (float): The seconds the search may take.
+        workers (int | None): The number of processes running playouts.
+            Defaults to the number of CPUs.
+        stats (SearchStats | None): Where to add the playouts run.
+        sample_budget (int | None): The number of boards each process may
+            sample, or None to only use the time budget.
+
+    Returns:
+        int: The cell number with the best average result.
+    """
+    other = PlayerSymbol.O if symbol is PlayerSymbol.X else PlayerSymbol.X
+    own, known = board.mask(symbol), board.mask(other)
+    candidates = mask_cells(~(own | known) & FULL_MASK)
+
+    if len(candidates) == 1:
+        return candidates[0]
+
+    workers = pool.worker_count(workers)
+    task = (own, known, board.hidden, time_budget, sample_budget)
+
+    if workers == 1:
+        scores, samples = search(*task, seed=getrandbits(64))
+    else:
+        futures = [
+            worker.submit(search, *task, seed=getrandbits(64))
+            for worker in pool.executors(workers)
+        ]
+        scores, samples = [0.0] * len(candidates), 0
+        for future in futures:
+            partial, count = future.result()
+            scores = [total + score for total, score in zip(scores, partial)]
+            samples += count
+
+    if stats is not None:
+        stats.nodes += samples * len(candidates)
+        stats.misses += 1
+
+    return max(zip(scores, candidates))[1]
+
+
+def search(
+    own: int,
+    known: int,
+    hidden: int,
+    time_budget: float,
+    sample_budget: int | None,
+    seed: int,
+) -> tuple[list[float], int]:
+    """
+    Score every candidate move until a budget runs out.
+
+    Args:
+        own (int): The mask of the player to move.
+        known (int): The mask of the opponent marks that are known.
+        hidden (int): The number of opponent marks not known.
+        time_budget (float): The seconds the search may take.
+        sample_budget (int | None): The number of boards the search may
+            sample, or None for no limit.
+        seed (int): The seed of the random generator.
+
+    Returns:
+        tuple[list[float], int]: The total score of each candidate, in the
+        order of the free cells, and the number of sampled boards.
+    """
+    rng = Random(seed)
+    deadline = monotonic() + time_budget
+    unknown = mask_cells(~(own | known) & FULL_MASK)
+    hidden = min(hidden, len(unknown))
+    scores = [0.0] * len(unknown)
+    samples = 0
+
+    while True:
+        for _ in range(_BATCH):
+            if samples == sample_budget:
+                return scores, samples
+
+            other = known
+            for cell in rng.sample(unknown, hidden):
+                other |= cell_bit(cell)
+
+            if is_winning_mask(other):
+                continue
+
+            for index, cell in enumerate(unknown):
+                scores[index] += playout(own, other, cell, rng)
+            samples += 1
+
+        if monotonic() >= deadline:
+            return scores, samples
+
+
+def playout(own: int, other: int, cell: int, rng: Random) -> float:
+    """
+    Play a move and finish the game with random moves.
+
+    A move on a taken cell loses the turn, as in the blind variant.
+
+    Args:
+        own (int): The mask of the player to move.
+        other (int): The mask of the opponent.
+        cell (int): The cell to play.
+        rng (Random): The random generator.
+
+    Returns:
+        float: 1 if the player wins, 0.5 for a tie and 0 if it loses.
+    """
+    if not other & cell_bit(cell):
+        own |= cell_bit(cell)
+        if is_winning_mask(own):
+            return 1.0
+
+    mover, waiting, result = other, own, 0.0
+
+    while free := ~(mover | waiting) & FULL_MASK:
+        mover |= cell_bit(rng.choice(mask_cells(free)))
+        if is_winning_mask(mover):
+            return result
+
+        mover, waiting, result = waiting, mover, 1.0 - result
+
+    return 0.5
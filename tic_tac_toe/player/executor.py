@@ -0,0 +1,149 @@
+import asyncio
+from collections.abc import Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+from random import choice
+
+from tic_tac_toe.game_type.board import BitBoard
+from tic_tac_toe.player.base import BoardOrNone, Player
+
+
+class ExecutorPlayer(Player):
+    """
+    Runs the moves of another player in an executor.
+
+    Wrapping an IA keeps its search off the event loop: a thread pool
+    suits searches that share their tables with the process, and a process
+    pool suits long searches. A process pool pickles the player on every
+    move, so the worker searches a copy: the search tree kept between moves
+    is lost, and a pondering IA, which holds a thread, can't be sent.
+
+    A move that takes longer than the timeout is given up on and a random
+    empty cell is played instead. A search that already started can't be
+    interrupted, so it runs to its own time budget in the background, on a
+    copy of the board. The next move waits for it, within its own timeout,
+    so the searches of the wrapped player never overlap.
+    """
+
+    def __init__(
+        self,
+        player: Player,
+        executor: Executor | None = None,
+        timeout: float | None = None,
+    ) -> None:
+        """
+        Initializes a new instance of the ExecutorPlayer class.
+
+        Args:
+            player (Player): The player whose moves are run.
+            executor (Executor | None): Where to run the moves, or None for
+                the default thread pool of the event loop.
+            timeout (float | None): The seconds a move may take, or None for
+                no limit.
+
+        Raises:
+            ValueError: If a pondering player would run in a process pool.
+        """
+        if isinstance(executor, ProcessPoolExecutor) and getattr(
+            player, 'pondering', False
+        ):
+            raise ValueError(
+                'A pondering player cannot run in a process pool, since it '
+                'cannot be sent to the workers'
+            )
+
+        super().__init__(player.symbol)
+        self.player = player
+        self.executor = executor
+        self.timeout = timeout
+        self.timeouts: int = 0
+        # The move running in the executor, which may outlive its timeout.
+        self._running: asyncio.Future[int] | None = None
+
+    def make_move(
+        self,
+        board: BoardOrNone,
+        hide_move: bool = False,
+        memory: Sequence[int] | None = None,
+    ) -> int:
+        """
+        Makes the move of the wrapped player in the calling thread.
+
+        Args:
+            board (BoardOrNone): The current state of the board.
+            hide_move (bool): Whether the move must be hidden from the others.
+            memory (Sequence[int] | None): The cells in memory, oldest first.
+
+        Returns:
+            int: The index of the cell where the move was made.
+        """
+        return self.player.make_move(board, hide_move, memory)
+
+    async def make_move_async(
+        self,
+        board: BoardOrNone,
+        hide_move: bool = False,
+        memory: Sequence[int] | None = None,
+    ) -> int:
+        """
+        Makes the move of the wrapped player in the executor.
+
+        Args:
+            board (BoardOrNone): The current state of the board.
+            hide_move (bool): Whether the move must be hidden from the others.
+            memory (Sequence[int] | None): The cells in memory, oldest first.
+
+        Returns:
+            int: The index of the cell where the move was made, or a random
+            empty cell if the move timed out.
+
+        Raises:
+            TimeoutError: If the move timed out and there's no board to pick
+                a random cell from.
+        """
+        loop = asyncio.get_running_loop()
+        # The search may outlive the timeout, so it gets a board and memory
+        # the game can't change under it.
+        shown = None if board is None else board.copy()
+        kept = None if memory is None else tuple(memory)
+
+        try:
+            async with asyncio.timeout(self.timeout):
+                while (
+                    self._running is not None
+                    and self._running.get_loop() is loop
+                    and not self._running.done()
+                ):
+                    await asyncio.wait((self._running,))
+
+                self._running = loop.run_in_executor(
+                    self.executor,
+                    partial(self.player.make_move, shown, hide_move, kept),
+                )
+                # Shielded, so a timeout leaves the future running and the
+                # next move can wait for it.
+                return await asyncio.shield(self._running)
+        except TimeoutError:
+            self.timeouts += 1
+            if board is None or not board.empty_cells():
+                raise
+
+            return choice(board.empty_cells())
+
+    def start_pondering(self, board: BitBoard) -> None:
+        """
+        Let the wrapped player think during the opponent's turn.
+
+        Args:
+            board (BitBoard): The board the opponent is choosing a move on.
+        """
+        self.player.start_pondering(board)
+
+    def stop_pondering(self) -> None:
+        """
+        Stop the thinking of the wrapped player.
+        """
+        self.player.stop_pondering()
+
+    def __repr__(self) -> str:
+        return f'ExecutorPlayer({self.player!r}, timeout={self.timeout})'
@@ -1,13 +1,15 @@
+from collections.abc import Sequence
+from functools import cache
 from getpass import getpass
 
-from tic_tac_toe.player.base import Player, PlayerSymbol
-
-type PlayerOrNone = Player | None
-type Board = list[list[PlayerOrNone]]
-type BoardOrNone = Board | None
+from tic_tac_toe.player.base import BoardOrNone, Player, PlayerSymbol
 
 
 class Human(Player):
+    # A human player holds nothing but its symbol, so one instance per
+    # symbol can play any number of games, see human().
+    __slots__ = ()
+
     def __init__(self, symbol: PlayerSymbol) -> None:
         super().__init__(symbol)
 
@@ -15,28 +17,64 @@ class Human(Player):
         self,
         board: BoardOrNone = None,
         hide_move: bool = False,
+        memory: Sequence[int] | None = None,
     ) -> int:
         """
         Prompts the human player to make a move.
 
         Parameters:
-            board (Board): The current state of the game board.
+            board (BoardOrNone): The current state of the game board.
 
         Returns:
             int: The index of the cell where the move was made.
         """
+        cells = board.geometry.cells if board is not None else 9
+        prompt = f'Enter your move (1-{cells}): '
+
         while True:
             try:
-                if hide_move:
-                    move = int(getpass('Enter your move (1-9): '))
-                else:
-                    move = int(input('Enter your move (1-9): '))
+                read = getpass if hide_move else input
+                move = int(read(prompt))
 
-                if 1 <= move <= 9:
+                if 1 <= move <= cells:
                     return move
                 else:
                     print(
-                        'Invalid move. Please enter a number between 1 and 9.'
+                        'Invalid move.',
+                        f'Please enter a number between 1 and {cells}.',
                     )
             except ValueError:
                 print('Invalid input. Please enter a number.')
+
+    async def make_move_async(
+        self,
+        board: BoardOrNone = None,
+        hide_move: bool = False,
+        memory: Sequence[int] | None = None,
+    ) -> int:
+        """
+        Prompts the human player in a thread, so the event loop keeps going.
+
+        Parameters:
+            board (BoardOrNone): The current state of the game board.
+
+        Returns:
+            int: The index of the cell where the move was made.
+        """
+        import asyncio
+
+        return await asyncio.to_thread(self.make_move, board, hide_move, memory)
+
+
+@cache
+def human(symbol: PlayerSymbol) -> Human:
+    """
+    Get the human player of a symbol, shared by every game.
+
+    Args:
+        symbol (PlayerSymbol): The symbol associated with the player.
+
+    Returns:
+        Human: The player.
+    """
+    return Human(symbol)
@@ -1,46 +1,190 @@
+from collections.abc import Callable, Sequence
 from enum import StrEnum
-from random import choice
+from importlib import import_module
+from random import choice, getrandbits
+from types import ModuleType
+from typing import TYPE_CHECKING
 
-from tic_tac_toe.game_type.base import Board
+from tic_tac_toe.game_type.blind import BlindBoard
+from tic_tac_toe.game_type.board import CLASSIC, BitBoard, Geometry, mask_cells
+from tic_tac_toe.game_type.symmetry import map_cell, unmap_cell
 
 from .base import Player, PlayerSymbol
+from .stats import SearchStats
+
+if TYPE_CHECKING:
+    from .cache import PositionCache
+    from .mcts import Ponderer, Searcher, Statistics
+
+# The seconds a sampling or tree search may take by default. It leaves a
+# margin for the dispatch to the worker processes within a move latency of
+# 50 ms. The engines are imported by the first move that needs them, so
+# creating an IA stays cheap.
+DEFAULT_TIME_BUDGET = 0.03
+
+
+class _Engines:
+    """
+    The engine modules of the package, each imported on first use.
+
+    A module is kept as an attribute once imported, so later moves reach it
+    with an attribute lookup, without a call or an import statement.
+    """
+
+    def __getattr__(self, name: str) -> ModuleType:
+        """
+        Import an engine module the first time it's used.
+
+        Args:
+            name (str): The module name, e.g. ``'solved'``.
+
+        Returns:
+            ModuleType: The module.
+
+        Raises:
+            AttributeError: If the name is private, e.g. a special method
+                looked up on the instance.
+        """
+        if name.startswith('_'):
+            raise AttributeError(name)
+
+        module = import_module(f'{__package__}.{name}')
+        setattr(self, name, module)
+
+        return module
+
+
+_engines = _Engines()
 
 
 class IALevel(StrEnum):
     EASY = 'easy'
+    HARD = 'hard'
+    MCTS = 'mcts'
+    LEARNED = 'learned'
 
 
 class IA(Player):
-    def __init__(self, symbol: PlayerSymbol, level: IALevel) -> None:
+    def __init__(
+        self,
+        symbol: PlayerSymbol,
+        level: IALevel,
+        time_budget: float = DEFAULT_TIME_BUDGET,
+        workers: int | None = None,
+        node_budget: int | None = None,
+        cache: 'PositionCache | None' = None,
+        ponder: bool = False,
+    ) -> None:
+        """
+        Initializes a new instance of the IA class.
+
+        Args:
+            symbol (PlayerSymbol): The symbol associated with the player.
+            level (IALevel): The level of the IA.
+            time_budget (float): The seconds a sampling search may take.
+            workers (int | None): The number of processes a sampling search
+                may use. Defaults to the number of CPUs.
+            node_budget (int | None): The number of playouts a tree search
+                may run per tree, or of boards a sampling search may sample
+                per process, or None to only use the time budget.
+            cache (PositionCache | None): Where to look up the moves of the
+                searches before searching, and store the moves found.
+            ponder (bool): Whether a tree search keeps searching during the
+                opponent's turn, in a background thread.
+        """
         super().__init__(symbol)
         self.level = level
+        self.time_budget = time_budget
+        self.workers = workers
+        self.node_budget = node_budget
+        self.cache = cache
+        self.pondering = ponder
+        self.stats = SearchStats()
+        self._searcher: Searcher | None = None
+        self._ponderer: Ponderer | None = None
+        # The playouts of the last tree search, which a pondered position
+        # must have to be answered without searching.
+        self._search_playouts: int = 0
 
     def make_move(
         self,
-        board: Board,
+        board: BitBoard,
         hide_move: bool = False,
+        memory: Sequence[int] | None = None,
     ) -> int:
         """
         Makes a move based on the IA level provided.
 
         Args:
-            board (Board): The current state of the game board.
+            board (BitBoard): The current state of the game board.
+            memory (Sequence[int] | None): The cells in memory, oldest first,
+                in the limited memory variant.
 
         Returns:
             int: The index of the cell where the move was made.
         """
+        self.stats.moves += 1
+
         match self.level:
             case IALevel.EASY:
                 return self._dumb_move(board)
+            case IALevel.HARD if board.geometry is not CLASSIC:
+                return self._greedy_move(board)
+            case IALevel.HARD if isinstance(board, BlindBoard):
+                return self._sampled_move(board)
+            case IALevel.HARD if memory is not None:
+                return self._retrograde_move(memory)
+            case IALevel.HARD:
+                return self._perfect_move(board)
+            case IALevel.MCTS:
+                return self._tree_search_move(board)
+            case IALevel.LEARNED if board.geometry is not CLASSIC:
+                return self._greedy_move(board)
+            case IALevel.LEARNED:
+                return self._learned_move(board, memory)
             case _:
                 raise ValueError
 
-    def _dumb_move(self, board: Board) -> int:
+    def start_pondering(self, board: BitBoard) -> None:
+        """
+        Grow the search tree from the opponent's position in the background.
+
+        Only tree searches ponder, the other levels answer at once.
+
+        Args:
+            board (BitBoard): The board the opponent is choosing a move on.
+        """
+        if not self.pondering or self.level is not IALevel.MCTS:
+            return
+
+        mcts = _engines.mcts
+
+        if self._searcher is None:
+            # Drawn from the global generator, which a run may seed.
+            self._searcher = mcts.Searcher(getrandbits(64))
+        if self._ponderer is None:
+            self._ponderer = mcts.Ponderer(self._searcher)
+
+        opponent = (
+            PlayerSymbol.O if self.symbol is PlayerSymbol.X else PlayerSymbol.X
+        )
+        self._ponderer.start(
+            board.mask(opponent), board.mask(self.symbol), board.geometry
+        )
+
+    def stop_pondering(self) -> None:
+        """
+        Stop the background search, keeping the tree it grew.
+        """
+        if self._ponderer is not None:
+            self.stats.nodes += self._ponderer.stop()
+
+    def _dumb_move(self, board: BitBoard) -> int:
         """
         Makes a random move by choosing an available cell on the board.
 
         Args:
-            board (Board): The current state of the game board.
+            board (BitBoard): The current state of the game board.
 
         Returns:
             int: The index of the cell where the move was made.
@@ -50,22 +194,378 @@ class IA(Player):
 
         return move
 
-    def _get_available_cells(self, board: Board) -> list[int]:
+    def _greedy_move(self, board: BitBoard) -> int:
+        """
+        Makes a winning move if there is one, blocks the opponent otherwise,
+        and plays at random when neither is possible.
+
+        It's used on boards too large for the solvers.
+
+        Args:
+            board (BitBoard): The current state of the game board.
+
+        Returns:
+            int: The index of the cell where the move was made.
+        """
+        available_cells = self._get_available_cells(board=board)
+        opponent = (
+            PlayerSymbol.O if self.symbol is PlayerSymbol.X else PlayerSymbol.X
+        )
+
+        for symbol in (self.symbol, opponent):
+            for cell in available_cells:
+                if board.would_win(symbol, cell):
+                    return cell
+
+        return choice(available_cells)
+
+    def _perfect_move(self, board: BitBoard) -> int:
+        """
+        Makes the best possible move.
+
+        The move is read from the solved table, falling back to a cached
+        alpha-beta search for positions that aren't in it.
+
+        Args:
+            board (BitBoard): The current state of the game board.
+
+        Returns:
+            int: The index of the cell where the move was made.
+        """
+        negamax, solved = _engines.negamax, _engines.solved
+
+        outcome, moves = solved.lookup(board=board, symbol=self.symbol)
+
+        if outcome is solved.Outcome.UNKNOWN:
+            self.stats.misses += 1
+            searched = negamax.searched()
+            move = negamax.best_move(board=board, symbol=self.symbol)
+            self.stats.nodes += negamax.searched() - searched
+
+            return move
+
+        self.stats.hits += 1
+
+        return choice(mask_cells(moves))
+
+    def _sampled_move(self, board: BlindBoard) -> int:
+        """
+        Makes a move in the blind variant by sampling the hidden boards.
+
+        Args:
+            board (BlindBoard): The board as known by the IA.
+
+        Returns:
+            int: The index of the cell where the move was made.
+        """
+        determinized = _engines.determinized
+
+        def search() -> int:
+            return determinized.best_move(
+                board=board,
+                symbol=self.symbol,
+                time_budget=self.time_budget,
+                workers=self.workers,
+                stats=self.stats,
+                sample_budget=self.node_budget,
+            )
+
+        if self.cache is None:
+            return search()
+        if self.node_budget is not None:
+            return self._cached_board_move(
+                'sampled-nodes', board, self.node_budget, search
+            )
+
+        return self._cached_board_move(
+            'sampled', board, int(self.time_budget * 1e6), search
+        )
+
+    def _tree_search_move(self, board: BitBoard) -> int:
+        """
+        Makes the most visited move of a Monte Carlo Tree Search.
+
+        The tree is kept between calls, so the search of the next move
+        starts from what was already explored.
+
+        Args:
+            board (BitBoard): The current state of the game board.
+
+        Returns:
+            int: The index of the cell where the move was made.
+        """
+        mcts = _engines.mcts
+
+        if self._searcher is None:
+            # Drawn from the global generator, which a run may seed.
+            self._searcher = mcts.Searcher(getrandbits(64))
+
+        def search() -> int:
+            statistics, share = self._pondered(board)
+            if share >= 1.0:
+                self.stats.hits += 1
+                return max(statistics, key=lambda move: statistics[move])
+
+            node_budget = self.node_budget
+            if node_budget is not None:
+                node_budget = max(1, round(node_budget * (1.0 - share)))
+
+            nodes = self.stats.nodes
+            move = mcts.best_move(
+                board=board,
+                symbol=self.symbol,
+                searcher=self._searcher,
+                time_budget=self.time_budget * (1.0 - share),
+                node_budget=node_budget,
+                workers=self.workers,
+                stats=self.stats,
+            )
+            if not share:
+                self._search_playouts = self.stats.nodes - nodes
+
+            return move
+
+        if self.cache is None:
+            return search()
+        if self.node_budget is not None:
+            return self._cached_board_move(
+                'mcts-nodes', board, self.node_budget, search
+            )
+
+        return self._cached_board_move(
+            'mcts', board, int(self.time_budget * 1e6), search
+        )
+
+    def _learned_move(
+        self,
+        board: BitBoard,
+        memory: Sequence[int] | None,
+    ) -> int:
+        """
+        Makes the move of the policy trained by self-play.
+
+        Positions the policy never met are played at random.
+
+        Args:
+            board (BitBoard): The current state of the game board.
+            memory (Sequence[int] | None): The cells in memory, oldest first,
+                in the limited memory variant.
+
+        Returns:
+            int: The index of the cell where the move was made.
+        """
+        learned = _engines.learned
+
+        move = learned.best_move(board=board, symbol=self.symbol, memory=memory)
+
+        if not move:
+            self.stats.misses += 1
+            return self._dumb_move(board)
+
+        self.stats.hits += 1
+
+        return move
+
+    def _pondered(self, board: BitBoard) -> tuple['Statistics', float]:
+        """
+        Find how much of the search of a position was done by pondering.
+
+        The pondered playouts only shorten the search when it's run by a
+        single worker, which reuses the pondered tree, and otherwise only
+        spare it when they're as many as a whole search.
+
+        Args:
+            board (BitBoard): The current state of the game board.
+
+        Returns:
+            tuple[Statistics, float]: The pondered visits and wins of every
+            move, and the share of a search they make up, from 0 to 1.
+        """
+        if not self.pondering or self._searcher is None:
+            return {}, 0.0
+
+        pool = _engines.pool
+
+        opponent = (
+            PlayerSymbol.O if self.symbol is PlayerSymbol.X else PlayerSymbol.X
+        )
+        statistics = self._searcher.statistics(
+            board.mask(self.symbol), board.mask(opponent), board.geometry
+        )
+        enough = self.node_budget or self._search_playouts
+
+        if not statistics or not enough:
+            return {}, 0.0
+
+        visits = sum(visits for visits, _ in statistics.values())
+        share = min(1.0, visits / enough)
+        if share < 1.0 and pool.worker_count(self.workers) > 1:
+            return statistics, 0.0
+
+        return statistics, share
+
+    def _retrograde_move(self, memory: Sequence[int]) -> int:
+        """
+        Makes the best possible move in the limited memory variant.
+
+        Args:
+            memory (Sequence[int]): The cells in memory, oldest first.
+
+        Returns:
+            int: The index of the cell where the move was made.
+        """
+        retrograde = _engines.retrograde
+
+        # A lookup is cheaper than building a closure for the cache, so
+        # it's only built when there's a cache.
+        if self.cache is None:
+            self.stats.hits += 1
+            return retrograde.lookup(memory).move
+
+        from .cache import memory_key
+
+        def solve() -> int:
+            self.stats.hits += 1
+            return retrograde.lookup(memory).move
+
+        key, transform = memory_key(memory)
+
+        return self._cached('retrograde', CLASSIC, key, transform, 0, solve)
+
+    def _cached_board_move(
+        self,
+        search: str,
+        board: BitBoard,
+        effort: int,
+        find: Callable[[], int],
+    ) -> int:
+        """
+        Makes the move stored in the cache for a board, or finds it.
+
+        Args:
+            search (str): The name of the search that finds the move.
+            board (BitBoard): The current state of the game board.
+            effort (int): The effort the search is allowed, e.g. its time
+                budget in microseconds.
+            find (Callable[[], int]): Runs the search.
+
+        Returns:
+            int: The index of the cell where the move was made.
+        """
+        from .cache import board_key
+
+        key, transform = board_key(board, self.symbol)
+
+        return self._cached(
+            search, board.geometry, key, transform, effort, find
+        )
+
+    def _cached(
+        self,
+        search: str,
+        geometry: Geometry,
+        key: int,
+        transform: int,
+        effort: int,
+        find: Callable[[], int],
+    ) -> int:
+        """
+        Makes the move stored in the cache for a position, or finds it and
+        stores it.
+
+        The cache holds the moves of the canonical positions, so moves are
+        mapped with the symmetry of the position on the way in and out.
+
+        Args:
+            search (str): The name of the search that finds the move.
+            geometry (Geometry): The size of the board.
+            key (int): The key of the canonical position.
+            transform (int): The symmetry that maps the position to the
+                canonical one.
+            effort (int): The least effort the stored move must have been
+                found with.
+            find (Callable[[], int]): Runs the search.
+
+        Returns:
+            int: The index of the cell where the move was made.
+        """
+        assert self.cache is not None
+        variant = (
+            f'{search}/{geometry.rows}x{geometry.columns}x{geometry.in_a_row}'
+        )
+        move = self.cache.get(variant, key, effort)
+
+        if move is not None:
+            self.stats.hits += 1
+            return unmap_cell(move, transform, geometry)
+
+        move = find()
+        canonical_move = map_cell(move, transform, geometry)
+        self.cache.put(variant, key, canonical_move, effort)
+
+        return move
+
+    def _get_available_cells(self, board: BitBoard) -> list[int]:
         """
         Get a list of available cells on the board.
 
         Args:
-            board (Board): The current state of the game board.
+            board (BitBoard): The current state of the game board.
 
         Returns:
             list[int]: A list of available cell indices,
-            where each index is a number between 1 and 9.
+            where each index is a number between 1 and the number of cells.
         """
-        available_cells = []
+        return list(board.empty_cells())
+
+
+def easy_ia(symbol: PlayerSymbol) -> IA:
+    """
+    Creates an IA that plays at random.
+
+    Args:
+        symbol (PlayerSymbol): The symbol associated with the player.
+
+    Returns:
+        IA: The new player.
+    """
+    return IA(symbol=symbol, level=IALevel.EASY)
+
+
+def hard_ia(symbol: PlayerSymbol) -> IA:
+    """
+    Creates an IA that plays perfectly where it can.
+
+    Args:
+        symbol (PlayerSymbol): The symbol associated with the player.
+
+    Returns:
+        IA: The new player.
+    """
+    return IA(symbol=symbol, level=IALevel.HARD)
+
+
+def mcts_ia(symbol: PlayerSymbol) -> IA:
+    """
+    Creates an IA that plays by Monte Carlo Tree Search.
+
+    Args:
+        symbol (PlayerSymbol): The symbol associated with the player.
+
+    Returns:
+        IA: The new player.
+    """
+    return IA(symbol=symbol, level=IALevel.MCTS)
+
+
+def learned_ia(symbol: PlayerSymbol) -> IA:
+    """
+    Creates an IA that plays the policy trained by self-play.
 
-        for row in range(3):
-            for col in range(3):
-                if board[row][col] is None:
-                    available_cells.append(row * 3 + col + 1)
+    Args:
+        symbol (PlayerSymbol): The symbol associated with the player.
 
-        return available_cells
+    Returns:
+        IA: The new player.
+    """
+    return IA(symbol=symbol, level=IALevel.LEARNED)
@@ -0,0 +1,177 @@
+"""
+Moves of the LEARNED IA level, read from a policy trained by self-play.
+
+A position is encoded as in the solved table, relative to the player to
+move, plus a context for what the variant hides from the board:
+
+- classic: 0;
+- limited memory: the cell of the mark the next move removes, or 0;
+- blind: the number of opponent marks still hidden.
+
+The policy holds one byte per encoded position, the cell to play, or 0 for
+positions never met in training, so choosing a move is a single lookup.
+Policies are written by ``python -m tic_tac_toe.training`` and read from the
+directory in the ``TIC_TAC_TOE_LEARNED`` environment variable, which
+defaults to ``~/.cache/tic_tac_toe/learned``.
+"""
+
+import os
+import warnings
+from collections.abc import Sequence
+from functools import cache
+from pathlib import Path
+
+from tic_tac_toe.game_type.blind import BlindBoard
+from tic_tac_toe.game_type.board import CELLS, BitBoard
+from tic_tac_toe.game_type.limited import LimitedMemoryTicTacToe
+from tic_tac_toe.player.base import PlayerSymbol
+from tic_tac_toe.player.solved import index
+
+# The encodings of the cells, and of the contexts of each variant.
+CODES = 3**CELLS
+CONTEXTS = CELLS + 1
+STATES = CODES * CONTEXTS
+
+VARIANTS = ('classic', 'limited', 'blind')
+POLICY_SUFFIX = '.policy'
+
+# Marks on the board before the move that removes the oldest one.
+_KEPT_MARKS = LimitedMemoryTicTacToe.MEMORY_LIMIT - 1
+
+
+def directory() -> Path:
+    """
+    Get the directory of the trained policies.
+
+    Returns:
+        Path: The directory in ``TIC_TAC_TOE_LEARNED``, or the default one.
+    """
+    default = Path.home() / '.cache' / 'tic_tac_toe' / 'learned'
+
+    return Path(os.environ.get('TIC_TAC_TOE_LEARNED', default))
+
+
+def policy_path(variant: str, folder: Path | None = None) -> Path:
+    """
+    Get the file of the policy of a variant.
+
+    Args:
+        variant (str): One of VARIANTS.
+        folder (Path | None): The directory of the policies. Defaults to
+            directory().
+
+    Returns:
+        Path: The policy file.
+    """
+    return (folder or directory()) / f'{variant}{POLICY_SUFFIX}'
+
+
+@cache
+def load_policy(variant: str) -> bytes:
+    """
+    Load the policy of a variant, on first use only.
+
+    A missing policy plays like an untrained one, at random, with a warning.
+
+    Args:
+        variant (str): One of VARIANTS.
+
+    Returns:
+        bytes: The cell to play in each encoded position, or 0.
+    """
+    path = policy_path(variant)
+
+    try:
+        policy = path.read_bytes()
+    except FileNotFoundError:
+        warnings.warn(
+            f'No learned policy at {path}, playing at random. Train one '
+            f'with python -m tic_tac_toe.training --variant {variant}',
+            stacklevel=2,
+        )
+        return bytes(STATES)
+
+    if len(policy) != STATES:
+        raise ValueError(f'{path} is not a policy of {STATES} positions')
+
+    return policy
+
+
+def state(own: int, other: int, context: int = 0) -> int:
+    """
+    Encode a position.
+
+    Args:
+        own (int): The mask of the player to move.
+        other (int): The mask of the opponent marks the player knows.
+        context (int): The context of the variant, below CONTEXTS.
+
+    Returns:
+        int: The index of the position in a policy.
+    """
+    return index(own, other) + CODES * context
+
+
+def variant_of(board: BitBoard, memory: Sequence[int] | None) -> str:
+    """
+    Get the variant a move is asked for.
+
+    Args:
+        board (BitBoard): The board the player is shown.
+        memory (Sequence[int] | None): The cells in memory, in the limited
+            memory variant.
+
+    Returns:
+        str: One of VARIANTS.
+    """
+    if isinstance(board, BlindBoard):
+        return 'blind'
+    if memory is not None:
+        return 'limited'
+
+    return 'classic'
+
+
+def context_of(board: BitBoard, memory: Sequence[int] | None) -> int:
+    """
+    Get the context of a position.
+
+    Args:
+        board (BitBoard): The board the player is shown.
+        memory (Sequence[int] | None): The cells in memory, oldest first, in
+            the limited memory variant.
+
+    Returns:
+        int: The context, below CONTEXTS.
+    """
+    if isinstance(board, BlindBoard):
+        return min(board.hidden, CONTEXTS - 1)
+    if memory is not None and len(memory) >= _KEPT_MARKS:
+        return memory[0]
+
+    return 0
+
+
+def best_move(
+    board: BitBoard,
+    symbol: PlayerSymbol,
+    memory: Sequence[int] | None = None,
+) -> int:
+    """
+    Get the move of the trained policy.
+
+    Args:
+        board (BitBoard): The classic board the player is shown.
+        symbol (PlayerSymbol): The symbol to move.
+        memory (Sequence[int] | None): The cells in memory, oldest first, in
+            the limited memory variant.
+
+    Returns:
+        int: The cell to play, or 0 if the position was never trained.
+    """
+    other = PlayerSymbol.O if symbol is PlayerSymbol.X else PlayerSymbol.X
+    position = state(
+        board.mask(symbol), board.mask(other), context_of(board, memory)
+    )
+
+    return load_policy(variant_of(board, memory))[position]
@@ -0,0 +1,537 @@
+import threading
+from math import log, sqrt
+from random import Random, getrandbits
+from time import monotonic
+
+from tic_tac_toe.game_type.board import (
+    BitBoard,
+    Geometry,
+    cell_bit,
+    mask_cells,
+)
+from tic_tac_toe.player import pool
+from tic_tac_toe.player.base import PlayerSymbol
+from tic_tac_toe.player.stats import SearchStats
+
+# Like the default of ia.DEFAULT_TIME_BUDGET, within a 50 ms move latency.
+DEFAULT_TIME_BUDGET = 0.03
+# The seconds of each search of a ponderer, which bound the time it takes
+# to stop, and the playouts after which it stops on its own, which bound
+# the size of the tree while the opponent takes its time.
+PONDER_SLICE = 0.01
+PONDER_PLAYOUTS = 200_000
+
+EXPLORATION = sqrt(2)
+
+type Statistics = dict[int, tuple[int, float]]
+
+
+class Node:
+    """
+    Node of a Monte Carlo search tree.
+
+    The masks are relative to the player to move in the node, while the
+    visits and wins count the results of the player who moved into it.
+    """
+
+    __slots__ = (
+        'move',
+        'parent',
+        'children',
+        'untried',
+        'visits',
+        'wins',
+        'own',
+        'other',
+        'result',
+    )
+
+    def __init__(
+        self,
+        own: int,
+        other: int,
+        untried: list[int],
+        move: int = 0,
+        parent: 'Node | None' = None,
+        result: float | None = None,
+    ) -> None:
+        """
+        Initializes a new instance of the Node class.
+
+        Args:
+            own (int): The mask of the player to move.
+            other (int): The mask of the player who just moved.
+            untried (list[int]): The moves not expanded yet.
+            move (int): The move that led to the node.
+            parent (Node | None): The parent node, None for the root.
+            result (float | None): The result for the player who just moved
+                if the game is over, None otherwise.
+        """
+        self.move = move
+        self.parent = parent
+        self.children: list[Node] = []
+        self.untried = untried
+        self.visits = 0
+        self.wins = 0.0
+        self.own = own
+        self.other = other
+        self.result = result
+
+
+class Searcher:
+    """
+    Monte Carlo Tree Search that keeps its tree between moves.
+
+    The search assumes the classic rules on any board size.
+    """
+
+    def __init__(self, seed: int | None = None) -> None:
+        """
+        Initializes a new instance of the Searcher class.
+
+        Args:
+            seed (int | None): The seed of the random generator.
+        """
+        self.rng = Random(seed)
+        self.root: Node | None = None
+        # The board size of the tree, since masks alone don't tell it.
+        self.geometry: Geometry | None = None
+        # The playouts of the last search and whether it reused a subtree.
+        self.playouts: int = 0
+        self.reused: bool = False
+
+    def search(
+        self,
+        own: int,
+        other: int,
+        geometry: Geometry,
+        time_budget: float,
+        node_budget: int | None = None,
+    ) -> Statistics:
+        """
+        Grow the tree of a position until a budget runs out.
+
+        The subtree of the position is reused if it was reached from the
+        root of the previous search, on the same board size.
+
+        Args:
+            own (int): The mask of the player to move.
+            other (int): The mask of the opponent.
+            geometry (Geometry): The size of the board.
+            time_budget (float): The seconds the search may take.
+            node_budget (int | None): The number of playouts the search may
+                run, or None for no limit.
+
+        Returns:
+            Statistics: The visits and wins of every move of the position.
+        """
+        deadline = monotonic() + time_budget
+        root = self._reuse(own, other, geometry)
+        self.reused = root is not None
+        if root is None:
+            root = self._new_node(own, other, geometry)
+        root.parent = None
+        self.root = root
+        self.geometry = geometry
+        playouts = 0
+
+        while root.result is None and (
+            node_budget is None or playouts < node_budget
+        ):
+            self._iterate(root, geometry)
+            playouts += 1
+
+            if monotonic() >= deadline:
+                break
+
+        self.playouts = playouts
+
+        return {
+            child.move: (child.visits, child.wins) for child in root.children
+        }
+
+    def statistics(
+        self,
+        own: int,
+        other: int,
+        geometry: Geometry,
+    ) -> Statistics | None:
+        """
+        Get what the tree already knows of a position, without searching.
+
+        Args:
+            own (int): The mask of the player to move.
+            other (int): The mask of the opponent.
+            geometry (Geometry): The size of the board.
+
+        Returns:
+            Statistics | None: The visits and wins of every move of the
+            position, or None if it's not in reach of the root.
+        """
+        node = self._reuse(own, other, geometry)
+        if node is None:
+            return None
+
+        return {
+            child.move: (child.visits, child.wins) for child in node.children
+        }
+
+    def _reuse(self, own: int, other: int, geometry: Geometry) -> Node | None:
+        """
+        Find a position in the previous root or the two levels below it.
+
+        Args:
+            own (int): The mask of the player to move.
+            other (int): The mask of the opponent.
+            geometry (Geometry): The size of the board, which must be the
+                one of the tree, e.g. empty boards of any size have the
+                same masks.
+
+        Returns:
+            Node | None: The node of the position, or None if it's not there.
+        """
+        if self.root is None or geometry is not self.geometry:
+            return None
+
+        pending = [self.root]
+        for _ in range(3):
+            for node in pending:
+                if node.own == own and node.other == other:
+                    return node
+            pending = [child for node in pending for child in node.children]
+
+        return None
+
+    def _new_node(
+        self,
+        own: int,
+        other: int,
+        geometry: Geometry,
+        move: int = 0,
+        parent: Node | None = None,
+        result: float | None = None,
+    ) -> Node:
+        """
+        Create a node with its moves in random order.
+
+        Args:
+            own (int): The mask of the player to move.
+            other (int): The mask of the player who just moved.
+            geometry (Geometry): The size of the board.
+            move (int): The move that led to the node.
+            parent (Node | None): The parent node.
+            result (float | None): The result of a finished game.
+
+        Returns:
+            Node: The new node.
+        """
+        untried = []
+        if result is None:
+            untried = list(mask_cells(~(own | other) & geometry.full_mask))
+            self.rng.shuffle(untried)
+
+        return Node(own, other, untried, move, parent, result)
+
+    def _iterate(self, root: Node, geometry: Geometry) -> None:
+        """
+        Run one selection, expansion, playout and backpropagation step.
+
+        Args:
+            root (Node): The root of the tree.
+            geometry (Geometry): The size of the board.
+        """
+        node = root
+
+        while not node.untried and node.children and node.result is None:
+            node = self._select(node)
+
+        if node.untried and node.result is None:
+            cell = node.untried.pop()
+            mover = node.own | cell_bit(cell)
+            result = None
+
+            if _is_win_at(mover, cell, geometry):
+                result = 1.0
+            elif (mover | node.other) == geometry.full_mask:
+                result = 0.5
+
+            child = self._new_node(
+                node.other, mover, geometry, cell, node, result
+            )
+            node.children.append(child)
+            node = child
+
+        if node.result is not None:
+            score = node.result
+        else:
+            score = 1.0 - self._playout(node.own, node.other, geometry)
+
+        while node is not None:
+            node.visits += 1
+            node.wins += score
+            score = 1.0 - score
+            node = node.parent
+
+    def _select(self, node: Node) -> Node:
+        """
+        Pick the child with the best upper confidence bound.
+
+        Args:
+            node (Node): A fully expanded node.
+
+        Returns:
+            Node: The selected child.
+        """
+        scale = EXPLORATION * sqrt(log(node.visits))
+
+        return max(
+            node.children,
+            key=lambda child: child.wins / child.visits
+            + scale / sqrt(child.visits),
+        )
+
+    def _playout(self, own: int, other: int, geometry: Geometry) -> float:
+        """
+        Finish the game with random moves.
+
+        Args:
+            own (int): The mask of the player to move.
+            other (int): The mask of the opponent.
+            geometry (Geometry): The size of the board.
+
+        Returns:
+            float: 1 if the player to move wins, 0.5 for a tie and 0 if it
+            loses.
+        """
+        cells = list(mask_cells(~(own | other) & geometry.full_mask))
+        self.rng.shuffle(cells)
+        mover, waiting, result = own, other, 1.0
+
+        for cell in cells:
+            mover |= cell_bit(cell)
+            if _is_win_at(mover, cell, geometry):
+                return result
+
+            mover, waiting, result = waiting, mover, 1.0 - result
+
+        return 0.5
+
+
+class Ponderer:
+    """
+    Grows the tree of a searcher in a background thread.
+
+    The tree is grown from the position the opponent is choosing a move in,
+    so the position after its move is one level down, already searched as
+    much as the move looked likely. The thread runs short searches and
+    checks between them whether it must stop, so a mispredicted move only
+    waits for the current one to end.
+    """
+
+    __slots__ = ('searcher', 'playouts', '_stop', '_thread')
+
+    def __init__(self, searcher: Searcher) -> None:
+        """
+        Initializes a new instance of the Ponderer class.
+
+        Args:
+            searcher (Searcher): The searcher whose tree is grown. It must
+                not be used by anything else until stop() returns.
+        """
+        self.searcher = searcher
+        # The playouts run since the last start().
+        self.playouts: int = 0
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(
+        self,
+        own: int,
+        other: int,
+        geometry: Geometry,
+        limit: int = PONDER_PLAYOUTS,
+    ) -> None:
+        """
+        Start growing the tree of a position, stopping the previous search.
+
+        Args:
+            own (int): The mask of the player to move, the opponent.
+            other (int): The mask of the player who just moved.
+            geometry (Geometry): The size of the board.
+            limit (int): The playouts after which the thread stops.
+        """
+        self.stop()
+        self.playouts = 0
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(own, other, geometry, limit),
+            name='tic-tac-toe-ponder',
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> int:
+        """
+        Stop growing the tree, and wait for the current search to end.
+
+        Returns:
+            int: The playouts run since the last start().
+        """
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+        return self.playouts
+
+    def _run(
+        self,
+        own: int,
+        other: int,
+        geometry: Geometry,
+        limit: int,
+    ) -> None:
+        """
+        Search in slices until stopped, the limit is reached or the game is
+        over.
+
+        Args:
+            own (int): The mask of the player to move.
+            other (int): The mask of the opponent.
+            geometry (Geometry): The size of the board.
+            limit (int): The playouts after which to stop.
+        """
+        searcher = self.searcher
+
+        while not self._stop.is_set() and self.playouts < limit:
+            searcher.search(
+                own, other, geometry, PONDER_SLICE, limit - self.playouts
+            )
+            if not searcher.playouts:
+                return
+            self.playouts += searcher.playouts
+
+
+def _is_win_at(mask: int, cell: int, geometry: Geometry) -> bool:
+    """
+    Check if a mask has a complete line through a cell.
+
+    Args:
+        mask (int): The mask of a player.
+        cell (int): The cell number of the last move.
+        geometry (Geometry): The size of the board.
+
+    Returns:
+        bool: True if there's a complete line through the cell.
+    """
+    return any(mask & line == line for line in geometry.lines_through[cell - 1])
+
+
+# Searchers of a worker process, by board size and symbol to move, kept
+# between tasks for subtree reuse.
+_worker_searchers: dict[tuple[Geometry, PlayerSymbol], Searcher] = {}
+
+
+def search_in_worker(
+    own: int,
+    other: int,
+    geometry: Geometry,
+    symbol: PlayerSymbol,
+    time_budget: float,
+    node_budget: int | None,
+    seed: int,
+) -> Statistics:
+    """
+    Run a search with a searcher of the current worker process.
+
+    Args:
+        own (int): The mask of the player to move.
+        other (int): The mask of the opponent.
+        geometry (Geometry): The size of the board.
+        symbol (PlayerSymbol): The symbol to move.
+        time_budget (float): The seconds the search may take.
+        node_budget (int | None): The number of playouts the search may run.
+        seed (int): The seed used if the worker has no searcher yet.
+
+    Returns:
+        Statistics: The visits and wins of every move of the position.
+    """
+    searcher = _worker_searchers.get((geometry, symbol))
+    if searcher is None:
+        searcher = _worker_searchers[geometry, symbol] = Searcher(seed)
+
+    return searcher.search(own, other, geometry, time_budget, node_budget)
+
+
+def best_move(
+    board: BitBoard,
+    symbol: PlayerSymbol,
+    searcher: Searcher,
+    time_budget: float = DEFAULT_TIME_BUDGET,
+    node_budget: int | None = None,
+    workers: int | None = None,
+    stats: SearchStats | None = None,
+) -> int:
+    """
+    Get the most visited move of a Monte Carlo Tree Search.
+
+    With more than one worker, each worker process grows its own tree of
+    the position and the statistics of the root moves are added up. Each
+    tree runs in a process of its own, so the search takes its time budget
+    once.
+
+    Args:
+        board (BitBoard): The current state of the game board.
+        symbol (PlayerSymbol): The symbol to move.
+        searcher (Searcher): The searcher used when there's a single worker.
+        time_budget (float): The seconds the search may take.
+        node_budget (int | None): The number of playouts each tree may run,
+            or None for no limit.
+        workers (int | None): The number of processes growing trees.
+            Defaults to the number of CPUs.
+        stats (SearchStats | None): Where to add the playouts run and
+            whether a previous tree was reused.
+
+    Returns:
+        int: The cell number of the best move.
+    """
+    other = PlayerSymbol.O if symbol is PlayerSymbol.X else PlayerSymbol.X
+    task = (board.mask(symbol), board.mask(other), board.geometry)
+    workers = pool.worker_count(workers)
+
+    if workers == 1:
+        statistics = searcher.search(*task, time_budget, node_budget)
+        if stats is not None:
+            stats.nodes += searcher.playouts
+            if searcher.reused:
+                stats.hits += 1
+            else:
+                stats.misses += 1
+    else:
+        futures = [
+            worker.submit(
+                search_in_worker,
+                *task,
+                symbol,
+                time_budget,
+                node_budget,
+                getrandbits(64),
+            )
+            for worker in pool.executors(workers)
+        ]
+        statistics = {}
+        for future in futures:
+            for move, (visits, wins) in future.result().items():
+                total_visits, total_wins = statistics.get(move, (0, 0.0))
+                statistics[move] = (total_visits + visits, total_wins + wins)
+
+        if stats is not None:
+            # The workers' trees may be reused, so this counts their visits.
+            stats.nodes += sum(visits for visits, _ in statistics.values())
+            stats.misses += 1
+
+    if not statistics:
+        return board.empty_cells()[0]
+
+    return max(statistics, key=lambda move: statistics[move])
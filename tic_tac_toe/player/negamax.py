@@ -0,0 +1,162 @@
+from enum import IntEnum
+
+from tic_tac_toe.game_type.board import (
+    FULL_MASK,
+    BitBoard,
+    cell_bit,
+    is_winning_mask,
+)
+from tic_tac_toe.game_type.symmetry import canonical_key, inverses, transforms
+from tic_tac_toe.player.base import PlayerSymbol
+
+INFINITY = 100
+
+# Center first, then corners, then edges: the cells that sit on more lines
+# are tried first so the alpha-beta window closes sooner.
+_STATIC_ORDER: tuple[int, ...] = (5, 1, 3, 7, 9, 2, 4, 6, 8)
+_ORDERED: tuple[tuple[int, ...], ...] = tuple(
+    tuple(cell for cell in _STATIC_ORDER if free & cell_bit(cell))
+    for free in range(FULL_MASK + 1)
+)
+
+# The cell mapping of each symmetry and of its inverse, to store moves for
+# the canonical position and read them back.
+_MAP: tuple[tuple[int, ...], ...] = transforms()
+_UNMAP: tuple[tuple[int, ...], ...] = tuple(
+    _MAP[inverse] for inverse in inverses()
+)
+
+
+class Bound(IntEnum):
+    EXACT = 0
+    LOWER = 1
+    UPPER = 2
+
+
+type Entry = tuple[int, Bound, int]
+
+# Shared by every searcher of the process, keyed by the canonical masks of
+# the player to move and its opponent, which also encodes whose turn it is.
+# The moves are stored for the canonical position.
+_transpositions: dict[int, Entry] = {}
+
+
+def searched() -> int:
+    """
+    Get the number of positions searched so far by the process.
+
+    Each searched position leaves an entry in the transposition table.
+
+    Returns:
+        int: The size of the transposition table.
+    """
+    return len(_transpositions)
+
+
+def best_move(board: BitBoard, symbol: PlayerSymbol) -> int:
+    """
+    Get a perfect-play move for a symbol.
+
+    Args:
+        board (BitBoard): The current state of the game board.
+        symbol (PlayerSymbol): The symbol to move.
+
+    Returns:
+        int: The cell number of the best move.
+    """
+    other = PlayerSymbol.O if symbol is PlayerSymbol.X else PlayerSymbol.X
+    _, move = negamax(
+        board.mask(symbol), board.mask(other), -INFINITY, INFINITY
+    )
+
+    return move
+
+
+def evaluate(board: BitBoard, symbol: PlayerSymbol) -> int:
+    """
+    Get the game-theoretic value of a position for the symbol to move.
+
+    Args:
+        board (BitBoard): The current state of the game board.
+        symbol (PlayerSymbol): The symbol to move.
+
+    Returns:
+        int: Positive if the symbol wins, negative if it loses and 0 if it's
+        a draw. Faster wins have a larger absolute value.
+    """
+    other = PlayerSymbol.O if symbol is PlayerSymbol.X else PlayerSymbol.X
+    value, _ = negamax(
+        board.mask(symbol), board.mask(other), -INFINITY, INFINITY
+    )
+
+    return value
+
+
+def negamax(own: int, other: int, alpha: int, beta: int) -> tuple[int, int]:
+    """
+    Search a position with negamax and alpha-beta pruning.
+
+    Args:
+        own (int): The mask of the player to move.
+        other (int): The mask of the opponent.
+        alpha (int): The lower bound of the search window.
+        beta (int): The upper bound of the search window.
+
+    Returns:
+        tuple[int, int]: The value of the position for the player to move and
+        the best cell, or 0 if the position is terminal.
+    """
+    free = ~(own | other) & FULL_MASK
+
+    if is_winning_mask(other):
+        return -(free.bit_count() + 1), 0
+
+    if not free:
+        return 0, 0
+
+    key, transform = canonical_key(own, other)
+    first = 0
+    entry = _transpositions.get(key)
+
+    if entry is not None:
+        value, bound, move = entry
+        move = _UNMAP[transform][move - 1] if move else 0
+        if bound is Bound.EXACT:
+            return value, move
+        if bound is Bound.LOWER:
+            alpha = max(alpha, value)
+        else:
+            beta = min(beta, value)
+        if alpha >= beta:
+            return value, move
+        first = move
+
+    original_alpha = alpha
+    best, best_cell = -INFINITY, 0
+    cells = _ORDERED[free]
+
+    if first:
+        cells = (first, *(cell for cell in cells if cell != first))
+
+    for cell in cells:
+        value = -negamax(other, own | cell_bit(cell), -beta, -alpha)[0]
+
+        if value > best:
+            best, best_cell = value, cell
+
+        if best > alpha:
+            alpha = best
+
+        if alpha >= beta:
+            break
+
+    if best <= original_alpha:
+        bound = Bound.UPPER
+    elif best >= beta:
+        bound = Bound.LOWER
+    else:
+        bound = Bound.EXACT
+
+    _transpositions[key] = (best, bound, _MAP[transform][best_cell - 1])
+
+    return best, best_cell
@@ -0,0 +1,36 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache
+
+
+def worker_count(workers: int | None = None) -> int:
+    """
+    Get the number of worker processes to use.
+
+    Args:
+        workers (int | None): The requested number, or None for the number
+            of CPUs.
+
+    Returns:
+        int: The number of workers, at least 1.
+    """
+    return workers or os.cpu_count() or 1
+
+
+@cache
+def executors(workers: int) -> tuple[ProcessPoolExecutor, ...]:
+    """
+    Get the worker processes shared by every search of the process.
+
+    Each worker is a pool of a single process. A search sends one task to
+    each, so its tasks run side by side instead of two of them running
+    back to back in one process, and the same task of every search lands in
+    the same process, with what it kept from the previous one.
+
+    Args:
+        workers (int): The number of worker processes.
+
+    Returns:
+        tuple[ProcessPoolExecutor, ...]: The workers, created on first use.
+    """
+    return tuple(ProcessPoolExecutor(max_workers=1) for _ in range(workers))
@@ -0,0 +1,229 @@
+from collections import deque
+from collections.abc import Sequence
+from functools import cache
+from typing import NamedTuple
+
+from tic_tac_toe.game_type.board import (
+    FULL_MASK,
+    cell_bit,
+    is_winning_mask,
+    mask_cells,
+)
+from tic_tac_toe.game_type.limited import LimitedMemoryTicTacToe
+from tic_tac_toe.game_type.symmetry import (
+    canonical_cells,
+    inverses,
+    transforms,
+)
+from tic_tac_toe.player.solved import Outcome
+
+# Marks left on the board after a move, once the oldest one is forgotten.
+KEPT_MARKS = LimitedMemoryTicTacToe.MEMORY_LIMIT - 1
+
+# The cells in memory, oldest first. Marks alternate between the players and
+# the last one belongs to the player who just moved.
+type State = tuple[int, ...]
+
+
+class Solution(NamedTuple):
+    outcome: Outcome
+    plies: int
+    move: int
+
+
+def masks(state: State) -> tuple[int, int]:
+    """
+    Split a state in the masks of each player.
+
+    Args:
+        state (State): The cells in memory, oldest first.
+
+    Returns:
+        tuple[int, int]: The mask of the player to move and of its opponent.
+    """
+    own = other = 0
+
+    for index, cell in enumerate(reversed(state)):
+        if index % 2:
+            own |= cell_bit(cell)
+        else:
+            other |= cell_bit(cell)
+
+    return own, other
+
+
+def children(state: State) -> list[tuple[int, State]]:
+    """
+    Get the states reachable with one move, in their canonical version.
+
+    Args:
+        state (State): The cells in memory, oldest first.
+
+    Returns:
+        list[tuple[int, State]]: Each legal cell with the canonical state it
+        leads to.
+    """
+    free = FULL_MASK & ~sum(cell_bit(cell) for cell in state)
+    kept = state[1:] if len(state) == KEPT_MARKS else state
+
+    return [
+        (cell, canonical_cells((*kept, cell))[0]) for cell in mask_cells(free)
+    ]
+
+
+@cache
+def solve() -> dict[State, Solution]:
+    """
+    Solve every reachable limited-memory position by retrograde analysis.
+
+    Terminal positions are propagated backwards: a position is won if any
+    move leads to a lost one, and lost once every move leads to a won one.
+    Positions never resolved that way are draws, since both players can
+    avoid losing forever by repeating positions.
+
+    Only the canonical version of each state under the board symmetries is
+    solved, which makes the table about 8 times smaller.
+
+    The table is built on first use and kept for the rest of the process.
+
+    Returns:
+        dict[State, Solution]: The solution of each canonical state, for
+        the player to move.
+    """
+    moves: dict[State, list[tuple[int, State]]] = {}
+    parents: dict[State, list[State]] = {}
+    outcomes: dict[State, Outcome] = {}
+    plies: dict[State, int] = {}
+    resolved: deque[State] = deque()
+
+    pending: list[State] = [()]
+    parents[()] = []
+
+    while pending:
+        state = pending.pop()
+        _, other = masks(state)
+
+        if is_winning_mask(other):
+            outcomes[state] = Outcome.LOSS
+            plies[state] = 0
+            resolved.append(state)
+            continue
+
+        moves[state] = children(state)
+
+        for _, child in moves[state]:
+            if child not in parents:
+                parents[child] = []
+                pending.append(child)
+            parents[child].append(state)
+
+    remaining = {state: len(options) for state, options in moves.items()}
+
+    while resolved:
+        state = resolved.popleft()
+
+        for parent in parents[state]:
+            if parent in outcomes:
+                continue
+
+            if outcomes[state] is Outcome.LOSS:
+                outcomes[parent] = Outcome.WIN
+            else:
+                remaining[parent] -= 1
+                if remaining[parent]:
+                    continue
+                outcomes[parent] = Outcome.LOSS
+
+            plies[parent] = plies[state] + 1
+            resolved.append(parent)
+
+    table: dict[State, Solution] = {}
+
+    for state in parents:
+        outcome = outcomes.get(state, Outcome.DRAW)
+
+        if state not in moves:
+            table[state] = Solution(outcome, 0, 0)
+            continue
+
+        options = [
+            (outcomes.get(child, Outcome.DRAW), plies.get(child, 0), cell)
+            for cell, child in moves[state]
+        ]
+
+        match outcome:
+            case Outcome.WIN:
+                # Win as fast as possible.
+                _, child_plies, move = min(
+                    option for option in options if option[0] is Outcome.LOSS
+                )
+                table[state] = Solution(outcome, child_plies + 1, move)
+            case Outcome.LOSS:
+                # Lose as late as possible.
+                _, child_plies, move = max(options, key=lambda x: x[1])
+                table[state] = Solution(outcome, child_plies + 1, move)
+            case _:
+                move = next(
+                    cell for child, _, cell in options if child is Outcome.DRAW
+                )
+                table[state] = Solution(outcome, 0, move)
+
+    return table
+
+
+@cache
+def solutions() -> dict[State, Solution]:
+    """
+    Get the solution of every reachable state, canonical or not.
+
+    The solution of each canonical state is copied to its symmetric
+    versions, with the move mapped back, so a lookup needs no transform.
+
+    Returns:
+        dict[State, Solution]: The solution of each state, for the player
+        to move.
+    """
+    table: dict[State, Solution] = {}
+    # The cell mappings that undo each symmetry.
+    undo = [transforms()[inverse] for inverse in inverses()]
+
+    for state, solution in solve().items():
+        for mapping in undo:
+            original = tuple(mapping[cell - 1] for cell in state)
+            if original in table:
+                continue
+
+            if solution.move:
+                move = mapping[solution.move - 1]
+                table[original] = solution._replace(move=move)
+            else:
+                table[original] = solution
+
+    return table
+
+
+def lookup(memory: Sequence[int]) -> Solution:
+    """
+    Get the solution of a limited-memory position.
+
+    Args:
+        memory (Sequence[int]): The cells in memory, oldest first.
+
+    Returns:
+        Solution: The outcome for the player to move, the plies until the game
+        ends with perfect play (0 for draws) and the best move.
+    """
+    return solutions()[tuple(memory)]
+
+
+def adjudicate(memory: Sequence[int]) -> Outcome:
+    """
+    Get the outcome of a limited-memory position with perfect play.
+
+    Args:
+        memory (Sequence[int]): The cells in memory, oldest first.
+
+    Returns:
+        Outcome: The outcome for the player to move.
+    """
+    return lookup(memory).outcome
@@ -0,0 +1,161 @@
+"""
+Solved-game table for classic Tic Tac Toe.
+
+Every position is stored relative to the player to move, indexed by its
+base-3 encoding (0 for empty, 1 for the player to move, 2 for the opponent).
+Each entry is a little-endian 16-bit word: bits 0-8 hold the mask of the best
+moves and bits 9-10 hold the outcome. Positions that can't be reached, or are
+already over, have an entry of 0.
+
+Run ``python -m tic_tac_toe.player.solved`` to regenerate the table.
+"""
+
+import sys
+from array import array
+from enum import IntEnum
+from functools import cache
+from importlib.resources import files
+from pathlib import Path
+
+from tic_tac_toe.game_type.board import (
+    CELLS,
+    FULL_MASK,
+    BitBoard,
+    cell_bit,
+    is_winning_mask,
+    mask_cells,
+)
+from tic_tac_toe.player import negamax
+from tic_tac_toe.player.base import PlayerSymbol
+
+TABLE_FILE = 'solved_classic.bin'
+TABLE_SIZE = 3**CELLS
+
+_MOVES_MASK = FULL_MASK
+_OUTCOME_SHIFT = CELLS
+
+_TERNARY: tuple[int, ...] = tuple(
+    sum(3**bit for bit in range(CELLS) if mask >> bit & 1)
+    for mask in range(FULL_MASK + 1)
+)
+
+
+class Outcome(IntEnum):
+    UNKNOWN = 0
+    LOSS = 1
+    DRAW = 2
+    WIN = 3
+
+
+def index(own: int, other: int) -> int:
+    """
+    Get the table index of a position.
+
+    Args:
+        own (int): The mask of the player to move.
+        other (int): The mask of the opponent.
+
+    Returns:
+        int: The base-3 encoding of the position.
+    """
+    return _TERNARY[own] + 2 * _TERNARY[other]
+
+
+@cache
+def load_table() -> array:
+    """
+    Load the solved table shipped with the package.
+
+    The table is read on first use only, so importing this module is free.
+
+    Returns:
+        array: The table entries.
+    """
+    data = files(__package__).joinpath(TABLE_FILE).read_bytes()
+    table = array('H')
+    table.frombytes(data)
+
+    if sys.byteorder == 'big':
+        table.byteswap()
+
+    return table
+
+
+def lookup(board: BitBoard, symbol: PlayerSymbol) -> tuple[Outcome, int]:
+    """
+    Get the outcome and best moves of a position for the symbol to move.
+
+    Args:
+        board (BitBoard): The current state of the game board.
+        symbol (PlayerSymbol): The symbol to move.
+
+    Returns:
+        tuple[Outcome, int]: The outcome with perfect play and the mask of the
+        moves that achieve it. The outcome is UNKNOWN if the position isn't in
+        the table.
+    """
+    other = PlayerSymbol.O if symbol is PlayerSymbol.X else PlayerSymbol.X
+    entry = load_table()[index(board.mask(symbol), board.mask(other))]
+
+    return Outcome(entry >> _OUTCOME_SHIFT), entry & _MOVES_MASK
+
+
+def generate() -> array:
+    """
+    Solve every reachable position with the alpha-beta search.
+
+    Returns:
+        array: The table entries.
+    """
+    table = array('H', bytes(2 * TABLE_SIZE))
+    pending = [(0, 0)]
+    seen = {(0, 0)}
+
+    while pending:
+        own, other = pending.pop()
+        free = ~(own | other) & FULL_MASK
+
+        if is_winning_mask(other) or not free:
+            continue
+
+        scores = {}
+        for cell in mask_cells(free):
+            child = (other, own | cell_bit(cell))
+            scores[cell] = -negamax.negamax(
+                *child, -negamax.INFINITY, negamax.INFINITY
+            )[0]
+
+            if child not in seen:
+                seen.add(child)
+                pending.append(child)
+
+        best = max(scores.values())
+        moves = sum(
+            cell_bit(cell) for cell, score in scores.items() if score == best
+        )
+
+        if best > 0:
+            outcome = Outcome.WIN
+        elif best < 0:
+            outcome = Outcome.LOSS
+        else:
+            outcome = Outcome.DRAW
+
+        table[index(own, other)] = outcome << _OUTCOME_SHIFT | moves
+
+    return table
+
+
+def main() -> None:
+    table = generate()
+
+    if sys.byteorder == 'big':
+        table.byteswap()
+
+    path = Path(__file__).with_name(TABLE_FILE)
+    path.write_bytes(table.tobytes())
+    print(f'Wrote {path}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+class SearchStats:
+    """
+    Running totals of the searches of an IA.
+
+    The totals are updated once per move, never per searched node, so
+    keeping them costs nothing measurable.
+    """
+
+    __slots__ = ('moves', 'nodes', 'hits', 'misses')
+
+    def __init__(self) -> None:
+        """
+        Initializes a new instance of the SearchStats class.
+        """
+        # The moves chosen.
+        self.moves: int = 0
+        # The positions or playouts searched.
+        self.nodes: int = 0
+        # The moves answered by a table or a reused search tree.
+        self.hits: int = 0
+        # The moves that had to be searched from scratch.
+        self.misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Get the share of moves answered from a cache.
+
+        Returns:
+            float: The hits over the lookups, or 0 if there were none.
+        """
+        lookups = self.hits + self.misses
+
+        return self.hits / lookups if lookups else 0.0
+
+    def snapshot(self) -> tuple[int, int, int, int]:
+        """
+        Get the current totals.
+
+        Returns:
+            tuple[int, int, int, int]: The moves, nodes, hits and misses.
+        """
+        return self.moves, self.nodes, self.hits, self.misses
+
+    def __repr__(self) -> str:
+        return (
+            f'SearchStats(moves={self.moves}, nodes={self.nodes}, '
+            f'hits={self.hits}, misses={self.misses})'
+        )
@@ -0,0 +1,218 @@
+"""
+Lazy registries of game variants and players.
+
+Each entry is a ``module:attribute`` reference, only imported when the
+entry is loaded, so choosing a classic game between humans never imports
+the solvers or the search engines.
+
+Other packages add entries through the ``tic_tac_toe.variants`` and
+``tic_tac_toe.players`` entry point groups, e.g. in their pyproject.toml::
+
+    [project.entry-points.'tic_tac_toe.variants']
+    misere = 'my_package.misere:MisereTicTacToe'
+
+A variant is a BaseTicTacToe subclass. A player is a callable taking the
+symbol of the player and returning a Player, such as a Player subclass.
+The installed entry points are only read when a name isn't built in or
+when every name is listed, and never replace a built-in entry.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+if TYPE_CHECKING:
+    from importlib.metadata import EntryPoint
+
+VARIANTS_GROUP = 'tic_tac_toe.variants'
+PLAYERS_GROUP = 'tic_tac_toe.players'
+
+
+class Plugin(NamedTuple):
+    # The name used to choose the entry.
+    name: str
+    # The ``module:attribute`` reference, or the entry point, to load.
+    target: 'str | EntryPoint'
+    # The label shown in the menus.
+    title: str
+
+
+class Registry:
+    """
+    Named entries of a kind, imported the first time they're loaded.
+    """
+
+    def __init__(
+        self,
+        group: str,
+        builtins: dict[str, tuple[str, str]],
+    ) -> None:
+        """
+        Initializes a new instance of the Registry class.
+
+        Args:
+            group (str): The entry point group of other packages' entries.
+            builtins (dict[str, tuple[str, str]]): The reference and title
+                of each built-in entry, by name.
+        """
+        self.group = group
+        self._plugins: dict[str, Plugin] = {
+            name: Plugin(name, target, title)
+            for name, (target, title) in builtins.items()
+        }
+        self._loaded: dict[str, Any] = {}
+        self._discovered = False
+
+    def register(self, name: str, target: str, title: str = '') -> None:
+        """
+        Add an entry in this process, e.g. from a test or a script.
+
+        Args:
+            name (str): The name used to choose the entry.
+            target (str): The ``module:attribute`` reference to load.
+            title (str): The label shown in the menus. Defaults to the name.
+        """
+        self._plugins[name] = Plugin(name, target, title or name.capitalize())
+        self._loaded.pop(name, None)
+
+    def names(self) -> list[str]:
+        """
+        Get the name of every entry, reading the installed entry points.
+
+        Returns:
+            list[str]: The built-in names first, in their order.
+        """
+        self._discover()
+
+        return list(self._plugins)
+
+    def title(self, name: str) -> str:
+        """
+        Get the label of an entry.
+
+        Args:
+            name (str): The name of the entry.
+
+        Returns:
+            str: The label shown in the menus.
+
+        Raises:
+            ValueError: If there's no entry with that name.
+        """
+        return self._plugin(name).title
+
+    def load(self, name: str) -> Any:
+        """
+        Import an entry, the first time only.
+
+        Args:
+            name (str): The name of the entry.
+
+        Returns:
+            Any: The object the entry refers to.
+
+        Raises:
+            ValueError: If there's no entry with that name.
+        """
+        loaded = self._loaded.get(name)
+
+        if loaded is None:
+            loaded = self._loaded[name] = _resolve(self._plugin(name).target)
+
+        return loaded
+
+    def __contains__(self, name: object) -> bool:
+        if name not in self._plugins:
+            self._discover()
+
+        return name in self._plugins
+
+    def _plugin(self, name: str) -> Plugin:
+        """
+        Find an entry, reading the installed entry points if needed.
+
+        Args:
+            name (str): The name of the entry.
+
+        Returns:
+            Plugin: The entry.
+
+        Raises:
+            ValueError: If there's no entry with that name.
+        """
+        if name not in self:
+            raise ValueError(
+                f'Unknown {self.group} entry {name!r}, expected one of '
+                f'{", ".join(self._plugins)}'
+            )
+
+        return self._plugins[name]
+
+    def _discover(self) -> None:
+        """
+        Add the entries of the installed entry points, once.
+        """
+        if self._discovered:
+            return
+
+        self._discovered = True
+        from importlib.metadata import entry_points
+
+        for entry_point in entry_points(group=self.group):
+            self._plugins.setdefault(
+                entry_point.name,
+                Plugin(
+                    entry_point.name,
+                    entry_point,
+                    entry_point.name.capitalize(),
+                ),
+            )
+
+
+def _resolve(target: 'str | EntryPoint') -> Any:
+    """
+    Import the object an entry refers to.
+
+    Args:
+        target (str | EntryPoint): A ``module:attribute`` reference, where
+            the attribute may be dotted, or an entry point.
+
+    Returns:
+        Any: The object.
+    """
+    if not isinstance(target, str):
+        return target.load()
+
+    module, _, attribute = target.partition(':')
+    loaded: Any = import_module(module)
+
+    for name in filter(None, attribute.split('.')):
+        loaded = getattr(loaded, name)
+
+    return loaded
+
+
+VARIANTS = Registry(
+    VARIANTS_GROUP,
+    {
+        'classic': (
+            'tic_tac_toe.game_type.classic:ClassicTicTacToe',
+            'Classic',
+        ),
+        'limited': (
+            'tic_tac_toe.game_type.limited:LimitedMemoryTicTacToe',
+            'Limited memory',
+        ),
+        'blind': ('tic_tac_toe.game_type.blind:BlindTicTacToe', 'Blind'),
+    },
+)
+
+PLAYERS = Registry(
+    PLAYERS_GROUP,
+    {
+        'human': ('tic_tac_toe.player.human:human', 'Human'),
+        'easy': ('tic_tac_toe.player.ia:easy_ia', 'Easy'),
+        'hard': ('tic_tac_toe.player.ia:hard_ia', 'Hard'),
+        'mcts': ('tic_tac_toe.player.ia:mcts_ia', 'Monte Carlo Tree Search'),
+        'learned': ('tic_tac_toe.player.ia:learned_ia', 'Learned'),
+    },
+)
@@ -0,0 +1,341 @@
+"""
+Compact binary records of finished games.
+
+Each game takes one header byte followed by its moves, two per byte with
+the first move in the high nibble:
+
+- bits 0-1 of the header hold the variant, the ``GameChoice`` value;
+- bits 2-3 hold the ``Outcome``;
+- bit 4 is set when O moved first.
+
+A move nibble is the cell number, ``PASS`` for a turn lost in the blind
+variant, and 0 ends the moves. A classic game fits in at most six bytes.
+"""
+
+import mmap
+from collections.abc import Iterable, Iterator
+from enum import IntEnum
+from pathlib import Path
+from types import TracebackType
+from typing import BinaryIO, NamedTuple, Self
+
+from tic_tac_toe.game_type.base import LOST_TURN, BaseTicTacToe
+from tic_tac_toe.game_type.blind import BlindTicTacToe
+from tic_tac_toe.game_type.board import CLASSIC
+from tic_tac_toe.game_type.limited import LimitedMemoryTicTacToe
+from tic_tac_toe.game_type.symmetry import canonical_cells, transforms
+from tic_tac_toe.player.base import PlayerSymbol
+from tic_tac_toe.setup.game import GameChoice
+
+# Move nibble of a turn lost by an invalid move.
+PASS = 0xF
+# Move nibble that ends the moves of a game.
+END = 0x0
+
+_STARTER_O = 0b1_0000
+
+
+class Outcome(IntEnum):
+    # A tie, or a draw by repetition in the limited variant.
+    DRAW = 0
+    X_WINS = 1
+    O_WINS = 2
+    # The game was stopped before the end.
+    UNFINISHED = 3
+
+
+class GameRecord(NamedTuple):
+    variant: GameChoice
+    outcome: Outcome
+    starter: PlayerSymbol
+    # The cells played, in order, with PASS for the turns lost.
+    cells: tuple[int, ...]
+
+    def moves(self) -> Iterator[tuple[PlayerSymbol, int]]:
+        """
+        Get the moves with the symbol that made each of them.
+
+        Yields:
+            tuple[PlayerSymbol, int]: The symbol and cell of each move,
+            skipping the turns lost.
+        """
+        symbol = self.starter
+
+        for cell in self.cells:
+            if cell != PASS:
+                yield symbol, cell
+
+            symbol = _other(symbol)
+
+    def canonical(self) -> 'GameRecord':
+        """
+        Get the record turned by the board symmetry that gives the smallest
+        sequence of moves, so symmetric games have equal records.
+
+        Returns:
+            GameRecord: The record with its cells moved.
+        """
+        played = tuple(cell for cell in self.cells if cell != PASS)
+        _, transform = canonical_cells(played)
+        mapping = transforms()[transform]
+
+        return self._replace(
+            cells=tuple(
+                cell if cell == PASS else mapping[cell - 1]
+                for cell in self.cells
+            )
+        )
+
+
+def variant_of(game: BaseTicTacToe) -> GameChoice:
+    """
+    Get the variant of a game.
+
+    Args:
+        game (BaseTicTacToe): The game.
+
+    Returns:
+        GameChoice: The variant the game plays.
+    """
+    if isinstance(game, LimitedMemoryTicTacToe):
+        return GameChoice.LIMITED
+    if isinstance(game, BlindTicTacToe):
+        return GameChoice.BLIND
+    return GameChoice.CLASSIC
+
+
+def from_game(game: BaseTicTacToe) -> GameRecord:
+    """
+    Build the record of a game from its move history.
+
+    The turns lost in the blind variant are read from the history, where
+    they're logged like moves.
+
+    Args:
+        game (BaseTicTacToe): The game to record.
+
+    Returns:
+        GameRecord: The record of the game.
+
+    Raises:
+        ValueError: If the game is not played on the classic board.
+    """
+    if game.geometry is not CLASSIC:
+        raise ValueError('Only games on the classic board can be recorded')
+
+    turns = game.turns
+    starter = turns[0].player.symbol if turns else game.current_player.symbol
+
+    if not game.game_over:
+        outcome = Outcome.UNFINISHED
+    elif game.winner is None:
+        outcome = Outcome.DRAW
+    elif game.winner.symbol is PlayerSymbol.X:
+        outcome = Outcome.X_WINS
+    else:
+        outcome = Outcome.O_WINS
+
+    cells = tuple(
+        PASS if move.cell == LOST_TURN else move.cell for move in turns
+    )
+
+    return GameRecord(variant_of(game), outcome, starter, cells)
+
+
+def encode(record: GameRecord) -> bytes:
+    """
+    Encode a game record.
+
+    Args:
+        record (GameRecord): The record to encode.
+
+    Returns:
+        bytes: The header byte and the packed moves.
+    """
+    header = record.variant.value | record.outcome << 2
+    if record.starter is PlayerSymbol.O:
+        header |= _STARTER_O
+
+    nibbles = (*record.cells, END)
+    if len(nibbles) % 2:
+        nibbles += (END,)
+
+    return bytes((header, *(high << 4 | low for high, low in _pairs(nibbles))))
+
+
+def decode(data: bytes | mmap.mmap, offset: int = 0) -> tuple[GameRecord, int]:
+    """
+    Decode the game record at an offset.
+
+    Args:
+        data (bytes | mmap.mmap): The encoded records.
+        offset (int): The position of the header byte.
+
+    Returns:
+        tuple[GameRecord, int]: The record and the offset of the next one.
+
+    Raises:
+        ValueError: If the data ends before the end of the moves.
+    """
+    size = len(data)
+    header = data[offset]
+    offset += 1
+    cells: list[int] = []
+
+    while True:
+        if offset >= size:
+            raise ValueError('Truncated game record')
+
+        byte = data[offset]
+        offset += 1
+        high, low = byte >> 4, byte & 0xF
+
+        if high == END:
+            break
+        cells.append(high)
+
+        if low == END:
+            break
+        cells.append(low)
+
+    record = GameRecord(
+        variant=GameChoice(header & 0b11),
+        outcome=Outcome(header >> 2 & 0b11),
+        starter=PlayerSymbol.O if header & _STARTER_O else PlayerSymbol.X,
+        cells=tuple(cells),
+    )
+
+    return record, offset
+
+
+def _other(symbol: PlayerSymbol) -> PlayerSymbol:
+    """
+    Get the symbol of the other player.
+
+    Args:
+        symbol (PlayerSymbol): A symbol.
+
+    Returns:
+        PlayerSymbol: The other symbol.
+    """
+    return PlayerSymbol.O if symbol is PlayerSymbol.X else PlayerSymbol.X
+
+
+def _pairs(nibbles: tuple[int, ...]) -> Iterator[tuple[int, int]]:
+    """
+    Split an even number of nibbles in pairs.
+
+    Args:
+        nibbles (tuple[int, ...]): The nibbles.
+
+    Returns:
+        Iterator[tuple[int, int]]: The high and low nibble of each byte.
+    """
+    it = iter(nibbles)
+    return zip(it, it, strict=True)
+
+
+class RecordWriter:
+    """
+    Appends encoded games to a file as they finish.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """
+        Initializes a new instance of the RecordWriter class.
+
+        Args:
+            path (str | Path): The file to append to, created if needed.
+        """
+        self.path = Path(path)
+        self._file: BinaryIO = self.path.open('ab')
+        self.games: int = 0
+
+    def write(self, game: BaseTicTacToe) -> None:
+        """
+        Record a game.
+
+        Args:
+            game (BaseTicTacToe): The game to record.
+        """
+        self.write_record(from_game(game))
+
+    def write_record(self, record: GameRecord) -> None:
+        """
+        Record a game from its record.
+
+        Args:
+            record (GameRecord): The record to write.
+        """
+        self._file.write(encode(record))
+        self.games += 1
+
+    def write_encoded(self, data: bytes, games: int) -> None:
+        """
+        Record games already encoded, e.g. by a worker process.
+
+        Args:
+            data (bytes): The encoded records.
+            games (int): The number of games in the data.
+        """
+        self._file.write(data)
+        self.games += games
+
+    def close(self) -> None:
+        """
+        Flush and close the file.
+        """
+        self._file.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+def read(path: str | Path) -> Iterator[GameRecord]:
+    """
+    Iterate over the games of a record file without loading it.
+
+    The file is memory-mapped, so only the pages being read are in memory.
+
+    Args:
+        path (str | Path): The record file.
+
+    Yields:
+        GameRecord: Each game, in the order it was written.
+    """
+    with open(path, 'rb') as file:
+        if not file.seek(0, 2):
+            return
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            offset, size = 0, len(data)
+
+            while offset < size:
+                record, offset = decode(data, offset)
+                yield record
+
+
+def write(path: str | Path, games: Iterable[BaseTicTacToe]) -> int:
+    """
+    Record a number of games in a file.
+
+    Args:
+        path (str | Path): The file to append to.
+        games (Iterable[BaseTicTacToe]): The games to record.
+
+    Returns:
+        int: The number of games written.
+    """
+    with RecordWriter(path) as writer:
+        for game in games:
+            writer.write(game)
+
+    return writer.games
@@ -0,0 +1,448 @@
+"""
+Asyncio server that hosts games between remote players.
+
+Clients talk to the server with UTF-8 lines:
+
+- the client sends ``JOIN <variant>``, with ``classic``, ``limited``,
+  ``blind`` or an installed variant plugin, and gets ``WAIT`` until another
+  client joins the same variant;
+- both clients get ``START <symbol> <variant>``;
+- on its turn a client gets ``TURN <board>``, with the rows split by ``/``
+  and ``-`` for the empty cells, plus ``memory=<cells>`` in the limited
+  variant and ``hidden=<marks>`` in the blind one, and answers
+  ``MOVE <cell>``;
+- a move that can't be made gets ``INVALID``, then the same player gets
+  another turn, except in the blind variant where the turn is lost;
+- a line that is not understood gets ``ERROR <reason>``;
+- at the end both clients get ``END WIN``, ``END LOSS`` or ``END DRAW``.
+
+A client that disconnects or runs out of time loses the game.
+"""
+
+import asyncio
+from collections.abc import Sequence
+from contextlib import suppress
+
+from tic_tac_toe.game_type.base import MoveRequest
+from tic_tac_toe.game_type.blind import BlindBoard
+from tic_tac_toe.game_type.board import BitBoard
+from tic_tac_toe.player.base import BoardOrNone, Player, PlayerSymbol
+from tic_tac_toe.plugins import VARIANTS
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+DEFAULT_MOVE_TIMEOUT = 60.0
+
+
+def format_board(board: BitBoard) -> str:
+    """
+    Write a board as a protocol token.
+
+    Args:
+        board (BitBoard): The board to write.
+
+    Returns:
+        str: The rows of the board split by slashes.
+    """
+    columns = board.geometry.columns
+    cells = ''.join(
+        str(board.owner(cell) or '-')
+        for cell in range(1, board.geometry.cells + 1)
+    )
+
+    return '/'.join(
+        cells[row : row + columns] for row in range(0, len(cells), columns)
+    )
+
+
+def format_request(request: MoveRequest) -> str:
+    """
+    Write the TURN line of a move request.
+
+    Args:
+        request (MoveRequest): What the player to move is shown.
+
+    Returns:
+        str: The line, without the line break.
+    """
+    line = f'TURN {format_board(request.board)}'
+
+    if request.memory is not None:
+        line += f' memory={",".join(map(str, request.memory))}'
+    if isinstance(request.board, BlindBoard):
+        line += f' hidden={request.board.hidden}'
+
+    return line
+
+
+class RemotePlayer(Player):
+    """
+    Player whose moves come from a client connection.
+
+    Its moves are awaited with make_move_async(). The synchronous
+    make_move() only returns a move already received with receive_move().
+    """
+
+    def __init__(
+        self,
+        symbol: PlayerSymbol,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        """
+        Initializes a new instance of the RemotePlayer class.
+
+        Args:
+            symbol (PlayerSymbol): The symbol of the player.
+            reader (asyncio.StreamReader): The stream of the client lines.
+            writer (asyncio.StreamWriter): The stream to the client.
+        """
+        super().__init__(symbol)
+        self.reader = reader
+        self.writer = writer
+        self._next_move: int | None = None
+
+    async def send(self, line: str) -> None:
+        """
+        Send a line to the client.
+
+        Args:
+            line (str): The line, without the line break.
+        """
+        self.writer.write(f'{line}\n'.encode())
+        await self.writer.drain()
+
+    async def receive(self) -> str:
+        """
+        Wait for the next line of the client.
+
+        Returns:
+            str: The line, without surrounding whitespace.
+
+        Raises:
+            ConnectionResetError: If the client disconnected.
+        """
+        line = await self.reader.readline()
+        if not line:
+            raise ConnectionResetError('The client disconnected')
+
+        return line.decode(errors='replace').strip()
+
+    async def receive_move(self, request: MoveRequest) -> int:
+        """
+        Show the board to the client and wait for its move.
+
+        Lines that are not a move are answered with an error and the client
+        is asked again.
+
+        Args:
+            request (MoveRequest): What the player is shown.
+
+        Returns:
+            int: The cell number chosen by the client.
+
+        Raises:
+            ConnectionResetError: If the client disconnected.
+        """
+        await self.send(format_request(request))
+
+        while True:
+            match (await self.receive()).split():
+                case ['MOVE', cell] if cell.isdigit():
+                    self._next_move = int(cell)
+                    return self._next_move
+                case _:
+                    await self.send('ERROR expected MOVE <cell>')
+
+    def make_move(
+        self,
+        board: BoardOrNone = None,
+        hide_move: bool = False,
+        memory: Sequence[int] | None = None,
+    ) -> int:
+        """
+        Get the move received by the last call to receive_move().
+
+        Parameters:
+            board (BoardOrNone): The current state of the game board.
+
+        Returns:
+            int: The cell number chosen by the client.
+
+        Raises:
+            RuntimeError: If no move was received.
+        """
+        if self._next_move is None:
+            raise RuntimeError('No move received from the client')
+
+        move, self._next_move = self._next_move, None
+
+        return move
+
+    async def make_move_async(
+        self,
+        board: BoardOrNone = None,
+        hide_move: bool = False,
+        memory: Sequence[int] | None = None,
+    ) -> int:
+        """
+        Show the board to the client and wait for its move.
+
+        Parameters:
+            board (BoardOrNone): The current state of the game board.
+
+        Returns:
+            int: The cell number chosen by the client.
+
+        Raises:
+            ConnectionResetError: If the client disconnected.
+        """
+        assert board is not None
+        move = await self.receive_move(
+            MoveRequest(
+                board=board,
+                hide_move=hide_move,
+                memory=None if memory is None else tuple(memory),
+            )
+        )
+        self._next_move = None
+
+        return move
+
+    async def close(self) -> None:
+        """
+        Close the connection, ignoring a client already gone.
+        """
+        self.writer.close()
+
+        with suppress(ConnectionError):
+            await self.writer.wait_closed()
+
+
+class GameServer:
+    """
+    Pairs the clients that join the same variant and hosts their games.
+    """
+
+    def __init__(self, move_timeout: float = DEFAULT_MOVE_TIMEOUT) -> None:
+        """
+        Initializes a new instance of the GameServer class.
+
+        Args:
+            move_timeout (float): The seconds a client has for each move.
+        """
+        self.move_timeout = move_timeout
+        self.games_played: int = 0
+        # The client waiting for each variant, the task watching its
+        # connection and the event set once it's done with.
+        self._waiting: dict[
+            str,
+            tuple[RemotePlayer, asyncio.Task, asyncio.Event],
+        ] = {}
+
+    async def start(
+        self,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+    ) -> asyncio.Server:
+        """
+        Start listening for clients.
+
+        Args:
+            host (str): The address to listen on.
+            port (int): The port to listen on, or 0 for any free port.
+
+        Returns:
+            asyncio.Server: The listening server.
+        """
+        return await asyncio.start_server(self.handle, host, port)
+
+    async def handle(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        """
+        Serve a client connection until its game is over.
+
+        Args:
+            reader (asyncio.StreamReader): The stream of the client lines.
+            writer (asyncio.StreamWriter): The stream to the client.
+        """
+        client = RemotePlayer(PlayerSymbol.X, reader, writer)
+
+        try:
+            variant = await self._join(client)
+        except ConnectionError:
+            await client.close()
+            return
+
+        waiting = await self._pop_waiting(variant)
+        if waiting is None:
+            done = asyncio.Event()
+            watch = asyncio.create_task(self._watch(variant, client, done))
+            self._waiting[variant] = (client, watch, done)
+            await done.wait()
+            return
+
+        first, done = waiting
+        second = RemotePlayer(PlayerSymbol.O, reader, writer)
+
+        try:
+            await self.host_game(variant, first, second)
+        finally:
+            done.set()
+
+    async def _watch(
+        self,
+        variant: str,
+        client: RemotePlayer,
+        done: asyncio.Event,
+    ) -> None:
+        """
+        Tell a client to wait, and drop it if it disconnects before a game.
+
+        The task is cancelled once the client is paired, before the game
+        reads its connection.
+
+        Args:
+            variant (str): The name of the variant the client waits for.
+            client (RemotePlayer): The waiting client.
+            done (asyncio.Event): The event to set if the client leaves.
+        """
+        try:
+            await client.send('WAIT')
+            while True:
+                await client.receive()
+                await client.send('ERROR waiting for an opponent')
+        except ConnectionError:
+            if self._waiting.get(variant, (None,))[0] is client:
+                del self._waiting[variant]
+            await client.close()
+            done.set()
+
+    async def _pop_waiting(
+        self,
+        variant: str,
+    ) -> tuple[RemotePlayer, asyncio.Event] | None:
+        """
+        Take the client waiting for a variant, if it's still connected.
+
+        Args:
+            variant (str): The name of the variant to play.
+
+        Returns:
+            tuple[RemotePlayer, asyncio.Event] | None: The client and the
+            event to set once its game is over, or None if no client waits.
+        """
+        waiting = self._waiting.pop(variant, None)
+        if waiting is None:
+            return None
+
+        client, watch, done = waiting
+        watch.cancel()
+        await asyncio.wait((watch,))
+
+        # The end of the stream may have come before the watch could see it.
+        if not watch.cancelled() or client.reader.at_eof():
+            await client.close()
+            done.set()
+            return None
+
+        return client, done
+
+    async def _join(self, client: RemotePlayer) -> str:
+        """
+        Wait for a client to ask for a variant.
+
+        Args:
+            client (RemotePlayer): The new client.
+
+        Returns:
+            str: The name of the variant to play.
+
+        Raises:
+            ConnectionResetError: If the client disconnected.
+        """
+        while True:
+            match (await client.receive()).split():
+                case ['JOIN', name] if name.lower() in VARIANTS:
+                    return name.lower()
+                case _:
+                    pass
+
+            await client.send(
+                f'ERROR expected JOIN {"|".join(VARIANTS.names())}'
+            )
+
+    async def host_game(
+        self,
+        variant: str,
+        player: RemotePlayer,
+        opponent: RemotePlayer,
+    ) -> None:
+        """
+        Play a game between two clients and close their connections.
+
+        Args:
+            variant (str): The name of the variant to play.
+            player (RemotePlayer): The client playing X.
+            opponent (RemotePlayer): The client playing O.
+        """
+        game = VARIANTS.load(variant)(player=player, opponent=opponent)
+        winner = None
+
+        try:
+            for client in (player, opponent):
+                with suppress(ConnectionError):
+                    await client.send(f'START {client.symbol} {variant}')
+
+            while not game.game_over:
+                current = game.current_player
+                assert isinstance(current, RemotePlayer)
+
+                try:
+                    async with asyncio.timeout(self.move_timeout):
+                        move = await game.request_move_async()
+                except (ConnectionError, TimeoutError):
+                    winner = opponent if current is player else player
+                    break
+
+                if not game.step(move):
+                    # A client gone by now forfeits on its next turn.
+                    with suppress(ConnectionError):
+                        await current.send('INVALID')
+            else:
+                winner = game.winner
+
+            for client in (player, opponent):
+                if winner is None:
+                    result = 'DRAW'
+                else:
+                    result = 'WIN' if winner is client else 'LOSS'
+
+                with suppress(ConnectionError):
+                    await client.send(f'END {result}')
+        finally:
+            self.games_played += 1
+            await player.close()
+            await opponent.close()
+
+
+async def serve(
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    move_timeout: float = DEFAULT_MOVE_TIMEOUT,
+) -> None:
+    """
+    Run a game server until it's cancelled.
+
+    Args:
+        host (str): The address to listen on.
+        port (int): The port to listen on.
+        move_timeout (float): The seconds a client has for each move.
+    """
+    server = await GameServer(move_timeout).start(host, port)
+
+    async with server:
+        await server.serve_forever()
@@ -1,12 +1,12 @@
 from enum import Enum
 
 from tic_tac_toe.game_type.base import BaseTicTacToe
-from tic_tac_toe.game_type.blind import BlindTicTacToe
-from tic_tac_toe.game_type.classic import ClassicTicTacToe
-from tic_tac_toe.game_type.limited import LimitedMemoryTicTacToe
+from tic_tac_toe.game_type.board import CLASSIC, Geometry, geometry
 from tic_tac_toe.player.base import Player
+from tic_tac_toe.plugins import VARIANTS
 
 
+# The built-in variants, numbered as in the game records.
 class GameChoice(Enum):
     QUIT = 0
     CLASSIC = 1
@@ -14,6 +14,41 @@ class GameChoice(Enum):
     BLIND = 3
 
 
+class BoardChoice(Enum):
+    QUIT = 0
+    CLASSIC = 1
+    GOMOKU = 2
+    CUSTOM = 3
+
+
+def parse_geometry(spec: str) -> Geometry:
+    """
+    Reads the size of a board from a name or a ``RxCxK`` specification.
+
+    Args:
+        spec (str): ``classic``, ``gomoku``, or the rows, the columns and
+            the marks in a row to win, e.g. ``4x4x3``.
+
+    Returns:
+        Geometry: The size of the board and the marks in a row to win.
+
+    Raises:
+        ValueError: If the specification can't be read or the board is
+            invalid.
+    """
+    match spec.lower().split('x'):
+        case ['classic']:
+            return CLASSIC
+        case ['gomoku']:
+            return geometry(rows=15, columns=15, in_a_row=5)
+        case [rows, columns, in_a_row]:
+            return geometry(
+                rows=int(rows), columns=int(columns), in_a_row=int(in_a_row)
+            )
+        case _:
+            raise ValueError(f'Unknown board: {spec}')
+
+
 class GameSetup:
     def __init__(self, player: Player, opponent: Player) -> None:
         """
@@ -37,31 +72,21 @@ class GameSetup:
             ValueError: If the user enters an invalid choice.
             SystemExit: If the user chooses to quit.
         """
+        variants = VARIANTS.names()
+
         while True:
             try:
                 print('\nWhich kind of play do you want?')
-                print('1. Classic')
-                print('2. Limited memory')
-                print('3. Blind')
+                for number, name in enumerate(variants, start=1):
+                    print(f'{number}. {VARIANTS.title(name)}')
                 print('0. Quit')
 
                 game_choice: int = int(input('Enter your choice: '))
 
                 match game_choice:
-                    case GameChoice.CLASSIC.value:
-                        return ClassicTicTacToe(
-                            player=self.player,
-                            opponent=self.opponent,
-                        )
-                    case GameChoice.LIMITED.value:
-                        return LimitedMemoryTicTacToe(
-                            player=self.player,
-                            opponent=self.opponent,
-                        )
-                    case GameChoice.BLIND.value:
-                        return BlindTicTacToe(
-                            player=self.player,
-                            opponent=self.opponent,
+                    case number if 1 <= number <= len(variants):
+                        return self.create_game(
+                            variants[number - 1], self._choose_geometry()
                         )
                     case GameChoice.QUIT.value:
                         raise SystemExit
@@ -69,4 +94,73 @@ class GameSetup:
                         raise ValueError
 
             except ValueError:
-                print('Invalid input. Please enter a number between 0 and 2.')
+                print(
+                    'Invalid input.',
+                    f'Please enter a number between 0 and {len(variants)}.',
+                )
+
+    def create_game(
+        self,
+        variant: str,
+        geometry: Geometry = CLASSIC,
+    ) -> BaseTicTacToe:
+        """
+        Creates a game without prompting.
+
+        Args:
+            variant (str): The name of the kind of play in the VARIANTS
+                registry, e.g. ``classic``.
+            geometry (Geometry): The size of the board and the marks in a row
+                needed to win.
+
+        Returns:
+            BaseTicTacToe: An instance of the chosen game class.
+
+        Raises:
+            ValueError: If the variant is unknown.
+        """
+        return VARIANTS.load(variant)(
+            player=self.player,
+            opponent=self.opponent,
+            geometry=geometry,
+        )
+
+    def _choose_geometry(self) -> Geometry:
+        """
+        Prompts the user to choose the size of the board.
+
+        Returns:
+            Geometry: The chosen board size and marks in a row to win.
+
+        Raises:
+            SystemExit: If the user chooses to quit.
+            ValueError: If the user enters an invalid choice.
+        """
+        while True:
+            try:
+                print('\nWhich board do you want?')
+                print('1. 3x3, three in a row')
+                print('2. 15x15, five in a row')
+                print('3. Custom')
+                print('0. Quit')
+
+                board_choice: int = int(input('Enter your choice: '))
+
+                match board_choice:
+                    case BoardChoice.CLASSIC.value:
+                        return CLASSIC
+                    case BoardChoice.GOMOKU.value:
+                        return geometry(rows=15, columns=15, in_a_row=5)
+                    case BoardChoice.CUSTOM.value:
+                        return geometry(
+                            rows=int(input('Rows: ')),
+                            columns=int(input('Columns: ')),
+                            in_a_row=int(input('Marks in a row to win: ')),
+                        )
+                    case BoardChoice.QUIT.value:
+                        raise SystemExit
+                    case _:
+                        raise ValueError
+
+            except ValueError:
+                print('Invalid input. Please enter a number between 0 and 3.')
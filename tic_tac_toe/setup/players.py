@@ -1,8 +1,7 @@
 from enum import Enum
 
 from tic_tac_toe.player.base import Player, PlayerOrNone, PlayerSymbol
-from tic_tac_toe.player.human import Human
-from tic_tac_toe.player.ia import IA, IALevel
+from tic_tac_toe.plugins import PLAYERS
 
 
 class SymbolChoice(Enum):
@@ -17,9 +16,25 @@ class OpponentChoice(Enum):
     IA_OPPONENT = 2
 
 
-class IALevelChoice(Enum):
-    QUIT = 0
-    EASY = 1
+HUMAN = 'human'
+
+
+def create_player(symbol: PlayerSymbol, kind: str) -> Player:
+    """
+    Creates a player without prompting.
+
+    Args:
+        symbol (PlayerSymbol): The symbol of the player.
+        kind (str): The name of the player in the PLAYERS registry,
+            ``human`` or an IA level.
+
+    Returns:
+        Player: The new player.
+
+    Raises:
+        ValueError: If the kind is unknown.
+    """
+    return PLAYERS.load(kind)(symbol)
 
 
 class PlayersSetup:
@@ -43,6 +58,33 @@ class PlayersSetup:
 
         return self.player, self.opponent
 
+    def create_players(
+        self,
+        symbol: PlayerSymbol,
+        player: str = HUMAN,
+        opponent: str = 'hard',
+    ) -> tuple[Player, Player]:
+        """
+        Creates the players without prompting.
+
+        Args:
+            symbol (PlayerSymbol): The symbol of the main player.
+            player (str): The kind of the main player, see create_player().
+            opponent (str): The kind of the opponent, see create_player().
+
+        Returns:
+            tuple[Player, Player]: A tuple containing as first element
+            the main player and as second the opponent.
+
+        Raises:
+            ValueError: If a kind is unknown.
+        """
+        other = PlayerSymbol.X if symbol == PlayerSymbol.O else PlayerSymbol.O
+        self.player = create_player(symbol, player)
+        self.opponent = create_player(other, opponent)
+
+        return self.player, self.opponent
+
     def _choose_symbol(self) -> None:
         """
         Prompts the user to choose a symbol.
@@ -62,10 +104,10 @@ class PlayersSetup:
 
                 match symbol_choice:
                     case SymbolChoice.X.value:
-                        self.player = Human(symbol=PlayerSymbol.X)
+                        self.player = create_player(PlayerSymbol.X, HUMAN)
                         break
                     case SymbolChoice.O.value:
-                        self.player = Human(symbol=PlayerSymbol.O)
+                        self.player = create_player(PlayerSymbol.O, HUMAN)
                         break
                     case SymbolChoice.QUIT.value:
                         raise SystemExit
@@ -99,11 +141,11 @@ class PlayersSetup:
 
                 match opponent_choice:
                     case OpponentChoice.HUMAN_OPPONENT.value:
-                        self.opponent = Human(symbol=opponent_symbol)
+                        self.opponent = create_player(opponent_symbol, HUMAN)
                         break
                     case OpponentChoice.IA_OPPONENT.value:
-                        level: IALevel = self._choose_ia_level()
-                        self.opponent = IA(symbol=opponent_symbol, level=level)
+                        level: str = self._choose_ia_level()
+                        self.opponent = create_player(opponent_symbol, level)
                         break
                     case OpponentChoice.QUIT.value:
                         raise SystemExit
@@ -112,36 +154,38 @@ class PlayersSetup:
             except ValueError:
                 print('Invalid input. Please enter a number between 0 and 2.')
 
-    def _choose_ia_level(self) -> IALevel:
+    def _choose_ia_level(self) -> str:
         """
         Prompts the user to choose the level of the IA opponent.
 
+        The levels are the players of the PLAYERS registry, other than the
+        human one.
+
         Returns:
-            IALevel: The chosen level of the IA opponent.
+            str: The name of the chosen level in the registry.
 
         Raises:
             SystemExit: If the user chooses to quit.
             ValueError: If the user enters an invalid choice.
         """
+        levels = [name for name in PLAYERS.names() if name != HUMAN]
+
         while True:
             try:
                 print('\nChoose your IA level')
-                print('1. Easy')
+                for number, name in enumerate(levels, start=1):
+                    print(f'{number}. {PLAYERS.title(name)}')
                 print('0. Quit')
 
-                opponent_choice = int(input('Enter your choice: '))
+                level_choice = int(input('Enter your choice: '))
 
-                match opponent_choice:
-                    case IALevelChoice.EASY.value:
-                        return IALevel.EASY
-                    case IALevelChoice.QUIT.value:
+                match level_choice:
+                    case number if 1 <= number <= len(levels):
+                        return levels[number - 1]
+                    case 0:
                         raise SystemExit
                     case _:
                         raise ValueError
             except ValueError:
-                min_num = min(member.value for member in IALevelChoice)
-                max_num = max(member.value for member in IALevelChoice)
-                message = (
-                    f'Please enter a number between {min_num} and {max_num}.'
-                )
+                message = f'Please enter a number between 0 and {len(levels)}.'
                 print('Invalid input.', message)
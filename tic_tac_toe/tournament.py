@@ -0,0 +1,403 @@
+import argparse
+import os
+import random
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from contextlib import ExitStack
+from itertools import combinations_with_replacement
+from pathlib import Path
+from time import perf_counter_ns
+from typing import NamedTuple
+
+from tic_tac_toe.game_type.base import BaseTicTacToe
+from tic_tac_toe.game_type.blind import BlindTicTacToe
+from tic_tac_toe.game_type.classic import ClassicTicTacToe
+from tic_tac_toe.game_type.limited import LimitedMemoryTicTacToe
+from tic_tac_toe.player.base import PlayerSymbol
+from tic_tac_toe.player.cache import DEFAULT_CAPACITY, PositionCache
+from tic_tac_toe.player.ia import IA, IALevel
+from tic_tac_toe.record import RecordWriter, encode, from_game
+from tic_tac_toe.setup.game import GameChoice
+
+VARIANTS: dict[GameChoice, type[BaseTicTacToe]] = {
+    GameChoice.CLASSIC: ClassicTicTacToe,
+    GameChoice.LIMITED: LimitedMemoryTicTacToe,
+    GameChoice.BLIND: BlindTicTacToe,
+}
+
+DEFAULT_CHUNK_SIZE = 1_000
+
+
+class Pairing(NamedTuple):
+    variant: GameChoice
+    player: IALevel
+    opponent: IALevel
+
+
+class Stats:
+    """
+    Results of a set of games, from the point of view of the player.
+
+    Stats of different chunks of games can be merged in any order.
+    """
+
+    __slots__ = (
+        'wins',
+        'draws',
+        'losses',
+        'lengths',
+        'moves',
+        'move_time',
+        'max_move_time',
+    )
+
+    def __init__(self) -> None:
+        """
+        Initializes a new instance of the Stats class.
+        """
+        self.wins: int = 0
+        self.draws: int = 0
+        self.losses: int = 0
+        self.lengths: Counter[int] = Counter()
+        self.moves: int = 0
+        self.move_time: int = 0
+        self.max_move_time: int = 0
+
+    @property
+    def games(self) -> int:
+        """
+        Get the number of games played.
+
+        Returns:
+            int: The number of games.
+        """
+        return self.wins + self.draws + self.losses
+
+    @property
+    def mean_length(self) -> float:
+        """
+        Get the average number of turns per game.
+
+        Returns:
+            float: The average length, or 0 if no game was played.
+        """
+        total = sum(length * count for length, count in self.lengths.items())
+
+        return total / self.games if self.games else 0.0
+
+    @property
+    def mean_move_time(self) -> float:
+        """
+        Get the average time taken to choose a move.
+
+        Returns:
+            float: The average latency in microseconds, or 0 if no move was
+            made.
+        """
+        return self.move_time / self.moves / 1_000 if self.moves else 0.0
+
+    def merge(self, other: 'Stats') -> None:
+        """
+        Add the results of other games to these stats.
+
+        Args:
+            other (Stats): The stats to add.
+        """
+        self.wins += other.wins
+        self.draws += other.draws
+        self.losses += other.losses
+        self.lengths.update(other.lengths)
+        self.moves += other.moves
+        self.move_time += other.move_time
+        self.max_move_time = max(self.max_move_time, other.max_move_time)
+
+
+def play_chunk(
+    pairing: Pairing,
+    games: int,
+    seed: int,
+    time_budget: float,
+    record: bool = False,
+    cache: PositionCache | None = None,
+) -> tuple[Pairing, Stats, bytes]:
+    """
+    Play a chunk of games of a pairing, timing every move.
+
+    The player uses X and the opponent O. Who starts is random, as in any
+    other game.
+
+    Args:
+        pairing (Pairing): The variant and IA levels to play.
+        games (int): The number of games to play.
+        seed (int): The seed of the random generator.
+        time_budget (float): The seconds a sampling IA may take per move.
+        record (bool): Whether to encode the games played.
+        cache (PositionCache | None): The cache of searched moves shared by
+            the IAs, or None to search every move.
+
+    Returns:
+        tuple[Pairing, Stats, bytes]: The pairing, the results of its games
+        and their records, empty if they are not recorded.
+    """
+    random.seed(seed)
+    game_class = VARIANTS[pairing.variant]
+    player = IA(
+        PlayerSymbol.X,
+        pairing.player,
+        time_budget=time_budget,
+        workers=1,
+        cache=cache,
+    )
+    opponent = IA(
+        PlayerSymbol.O,
+        pairing.opponent,
+        time_budget=time_budget,
+        workers=1,
+        cache=cache,
+    )
+    stats = Stats()
+    records = []
+
+    for _ in range(games):
+        game = game_class(player=player, opponent=opponent)
+        turns = 0
+
+        while not game.game_over:
+            start = perf_counter_ns()
+            move = game.request_move()
+            elapsed = perf_counter_ns() - start
+
+            stats.move_time += elapsed
+            stats.max_move_time = max(stats.max_move_time, elapsed)
+            game.step(move)
+            turns += 1
+
+        stats.moves += turns
+        stats.lengths[turns] += 1
+
+        if game.winner is None:
+            stats.draws += 1
+        elif game.winner is player:
+            stats.wins += 1
+        else:
+            stats.losses += 1
+
+        if record:
+            records.append(encode(from_game(game)))
+
+    return pairing, stats, b''.join(records)
+
+
+def round_robin(
+    levels: Iterable[IALevel],
+    variants: Iterable[GameChoice],
+) -> list[Pairing]:
+    """
+    Get every pairing of IA levels, including mirror matches, per variant.
+
+    Args:
+        levels (Iterable[IALevel]): The IA levels taking part.
+        variants (Iterable[GameChoice]): The variants to play.
+
+    Returns:
+        list[Pairing]: The pairings to play.
+    """
+    levels = list(levels)
+
+    return [
+        Pairing(variant, player, opponent)
+        for variant in variants
+        for player, opponent in combinations_with_replacement(levels, 2)
+    ]
+
+
+def stream(
+    pairings: Iterable[Pairing],
+    games: int,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    workers: int | None = None,
+    seed: int | None = None,
+    time_budget: float = 0.01,
+    record: bool = False,
+    cache: PositionCache | None = None,
+) -> Iterator[tuple[Pairing, Stats, bytes]]:
+    """
+    Play the games of every pairing across worker processes.
+
+    The games are split in chunks and only a few chunks per worker are in
+    flight at a time, so the results of each chunk are yielded as soon as
+    it's done.
+
+    Args:
+        pairings (Iterable[Pairing]): The pairings to play.
+        games (int): The number of games per pairing.
+        chunk_size (int): The number of games per chunk.
+        workers (int | None): The number of worker processes. Defaults to
+            the number of CPUs.
+        seed (int | None): The seed used to derive the seed of each chunk.
+        time_budget (float): The seconds a sampling IA may take per move.
+        record (bool): Whether to encode the games played.
+        cache (PositionCache | None): The cache of searched moves, opened
+            by each worker process.
+
+    Yields:
+        tuple[Pairing, Stats, bytes]: The results and records of each
+        chunk.
+    """
+    rng = random.Random(seed)
+    workers = workers or os.cpu_count() or 1
+    chunks = (
+        (pairing, min(chunk_size, games - start))
+        for pairing in pairings
+        for start in range(0, games, chunk_size)
+    )
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = set()
+
+        for pairing, size in chunks:
+            pending.add(
+                executor.submit(
+                    play_chunk,
+                    pairing,
+                    size,
+                    rng.getrandbits(64),
+                    time_budget,
+                    record,
+                    cache,
+                )
+            )
+
+            if len(pending) >= 2 * workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+
+def run(
+    pairings: Iterable[Pairing],
+    games: int,
+    writer: RecordWriter | None = None,
+    **options,
+) -> dict[Pairing, Stats]:
+    """
+    Play the games of every pairing and merge their results.
+
+    Args:
+        pairings (Iterable[Pairing]): The pairings to play.
+        games (int): The number of games per pairing.
+        writer (RecordWriter | None): Where to record the games, or None
+            to not record them.
+        **options: The options of stream().
+
+    Returns:
+        dict[Pairing, Stats]: The merged results of each pairing.
+    """
+    standings: dict[Pairing, Stats] = {}
+    chunks = stream(pairings, games, record=writer is not None, **options)
+
+    for pairing, stats, records in chunks:
+        standings.setdefault(pairing, Stats()).merge(stats)
+
+        if writer is not None:
+            writer.write_encoded(records, stats.games)
+
+    return standings
+
+
+def print_standings(standings: dict[Pairing, Stats]) -> None:
+    """
+    Print the results of every pairing.
+
+    Args:
+        standings (dict[Pairing, Stats]): The results of each pairing.
+    """
+    print(
+        f'{"variant":<8} {"player":<6} {"opponent":<8} {"games":>9} '
+        f'{"wins":>9} {"draws":>9} {"losses":>9} {"turns":>6} {"us/move":>8}'
+    )
+
+    for pairing, stats in sorted(
+        standings.items(),
+        key=lambda item: (item[0].variant.value, *item[0][1:]),
+    ):
+        print(
+            f'{pairing.variant.name.lower():<8} {pairing.player:<6} '
+            f'{pairing.opponent:<8} {stats.games:>9} {stats.wins:>9} '
+            f'{stats.draws:>9} {stats.losses:>9} '
+            f'{stats.mean_length:>6.2f} {stats.mean_move_time:>8.1f}'
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description='Play a round-robin tournament between IA levels.'
+    )
+    parser.add_argument('--games', type=int, default=1_000)
+    parser.add_argument(
+        '--levels',
+        nargs='+',
+        type=IALevel,
+        default=list(IALevel),
+    )
+    parser.add_argument(
+        '--variants',
+        nargs='+',
+        type=lambda name: GameChoice[name.upper()],
+        default=list(VARIANTS),
+    )
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--time-budget', type=float, default=0.01)
+    parser.add_argument(
+        '--record',
+        type=Path,
+        default=None,
+        help='append the games played to a record file',
+    )
+    parser.add_argument(
+        '--cache',
+        type=Path,
+        default=None,
+        help='look up and store the searched moves in a cache file',
+    )
+    parser.add_argument(
+        '--cache-size',
+        type=int,
+        default=DEFAULT_CAPACITY,
+        help='number of moves kept in the cache file',
+    )
+    args = parser.parse_args()
+
+    with ExitStack() as stack:
+        writer = None
+        if args.record is not None:
+            writer = stack.enter_context(RecordWriter(args.record))
+
+        standings = run(
+            round_robin(args.levels, args.variants),
+            args.games,
+            writer=writer,
+            chunk_size=args.chunk_size,
+            workers=args.workers,
+            seed=args.seed,
+            time_budget=args.time_budget,
+            cache=(
+                None
+                if args.cache is None
+                else PositionCache(args.cache, args.cache_size)
+            ),
+        )
+
+    print_standings(standings)
+
+
+if __name__ == '__main__':
+    main()
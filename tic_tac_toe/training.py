@@ -0,0 +1,429 @@
+"""
+Training of the LEARNED IA level by batched self-play.
+
+Requires NumPy, installed with the ``batch`` extra.
+
+Both sides of every game play with one table of move values, indexed like
+the policies of tic_tac_toe.player.learned. The value of a move is the
+reward if it ends the game, 1 for a win and 0 for a draw, and otherwise
+minus the discounted value of the best move of the opponent in the position
+it leads to. Every game of a batch moves at once, and the values of all
+their moves are updated in one vectorized step per turn.
+
+The table and the number of games it was trained on are checkpointed to
+``<variant>.npz``, with the policy read by the IA, the best move of every
+position met, to ``<variant>.policy``. Training longer gives a stronger
+opponent, so the strength is tuned by the number of games::
+
+    python -m tic_tac_toe.training --variant limited --games 200000
+"""
+
+import argparse
+import os
+from pathlib import Path
+from time import perf_counter
+
+import numpy as np
+
+from tic_tac_toe.batch import LINES, O_MARK, X_MARK
+from tic_tac_toe.game_type.board import CELLS
+from tic_tac_toe.game_type.limited import LimitedMemoryTicTacToe
+from tic_tac_toe.player.learned import (
+    CODES,
+    CONTEXTS,
+    STATES,
+    VARIANTS,
+    directory,
+    policy_path,
+)
+
+DEFAULT_BATCH_SIZE = 4_096
+DEFAULT_LEARNING_RATE = 0.2
+DEFAULT_DISCOUNT = 0.95
+# The share of random moves, lowered linearly down to the final one.
+DEFAULT_EXPLORATION = 0.3
+FINAL_EXPLORATION = 0.02
+# The number of moves after which a game is stopped, as a draw.
+MAX_TURNS = 64
+
+_KEPT_MARKS = LimitedMemoryTicTacToe.MEMORY_LIMIT - 1
+_POWERS = 3 ** np.arange(CELLS, dtype=np.int64)
+
+
+class Learner:
+    """
+    A table of move values, and the self-play games that train it.
+    """
+
+    def __init__(
+        self,
+        variant: str,
+        values: np.ndarray | None = None,
+        visited: np.ndarray | None = None,
+        games: int = 0,
+        seed: int | None = None,
+    ) -> None:
+        """
+        Initializes a new instance of the Learner class.
+
+        Args:
+            variant (str): One of VARIANTS.
+            values (np.ndarray | None): The value of each move of each
+                position, flat. Defaults to an untrained table.
+            visited (np.ndarray | None): Whether each position was met.
+            games (int): The number of games the table was trained on.
+            seed (int | None): The seed of the random moves.
+
+        Raises:
+            ValueError: If the variant can't be learned.
+        """
+        if variant not in VARIANTS:
+            raise ValueError(f'Cannot learn the {variant} variant')
+
+        self.variant = variant
+        self.values = (
+            np.zeros(STATES * CELLS, dtype=np.float32)
+            if values is None
+            else values
+        )
+        self.visited = (
+            np.zeros(STATES, dtype=bool) if visited is None else visited
+        )
+        self.games = games
+        self.rng = np.random.default_rng(seed)
+
+    @classmethod
+    def load(
+        cls,
+        variant: str,
+        folder: Path | None = None,
+        seed: int | None = None,
+    ) -> 'Learner':
+        """
+        Resume from the checkpoint of a variant, if there's one.
+
+        Args:
+            variant (str): One of VARIANTS.
+            folder (Path | None): The directory of the checkpoints. Defaults
+                to the directory of the policies.
+            seed (int | None): The seed of the random moves.
+
+        Returns:
+            Learner: The checkpointed learner, or an untrained one.
+        """
+        path = checkpoint_path(variant, folder)
+
+        if not path.exists():
+            return cls(variant, seed=seed)
+
+        with np.load(path) as checkpoint:
+            return cls(
+                variant,
+                values=checkpoint['values'],
+                visited=checkpoint['visited'],
+                games=int(checkpoint['games']),
+                seed=seed,
+            )
+
+    def train(
+        self,
+        games: int,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        learning_rate: float = DEFAULT_LEARNING_RATE,
+        discount: float = DEFAULT_DISCOUNT,
+        exploration: float = DEFAULT_EXPLORATION,
+        final_exploration: float = FINAL_EXPLORATION,
+    ) -> int:
+        """
+        Play self-play games, updating the values after every turn.
+
+        Args:
+            games (int): The number of games to play.
+            batch_size (int): The number of games played at once.
+            learning_rate (float): How far a value moves toward its target.
+            discount (float): The weight of the value of the next position.
+            exploration (float): The share of random moves of the first
+                batch.
+            final_exploration (float): The share of random moves the
+                exploration is lowered to, linearly, by the last batch.
+
+        Returns:
+            int: The number of moves played.
+        """
+        moves = 0
+
+        for start in range(0, games, batch_size):
+            progress = start / games
+            moves += self._play_batch(
+                min(batch_size, games - start),
+                learning_rate,
+                discount,
+                exploration + (final_exploration - exploration) * progress,
+            )
+
+        return moves
+
+    def policy(self) -> bytes:
+        """
+        Get the best move of every position met in training.
+
+        Returns:
+            bytes: The cell to play in each encoded position, or 0.
+        """
+        codes = np.arange(STATES, dtype=np.int64) % CODES
+        digits = codes[:, None] // _POWERS % 3
+        values = np.where(
+            digits == 0, self.values.reshape(STATES, CELLS), -np.inf
+        )
+        moves = (values.argmax(axis=1) + 1).astype(np.uint8)
+        moves[~self.visited | (digits != 0).all(axis=1)] = 0
+
+        return moves.tobytes()
+
+    def save(self, folder: Path | None = None) -> Path:
+        """
+        Write the checkpoint and the policy of the variant.
+
+        Both files are written to a temporary file first and then renamed,
+        so an IA never reads a partial policy.
+
+        Args:
+            folder (Path | None): The directory of the checkpoints. Defaults
+                to the directory of the policies.
+
+        Returns:
+            Path: The checkpoint file.
+        """
+        path = checkpoint_path(self.variant, folder)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        temporary = path.with_suffix('.tmp.npz')
+        np.savez(
+            temporary,
+            values=self.values,
+            visited=self.visited,
+            games=self.games,
+        )
+        os.replace(temporary, path)
+
+        policy = policy_path(self.variant, folder)
+        temporary = policy.with_suffix('.tmp')
+        temporary.write_bytes(self.policy())
+        os.replace(temporary, policy)
+
+        return path
+
+    def _play_batch(
+        self,
+        games: int,
+        learning_rate: float,
+        discount: float,
+        exploration: float,
+    ) -> int:
+        """
+        Play a batch of games to the end, updating the values every turn.
+
+        Args:
+            games (int): The number of games to play.
+            learning_rate (float): How far a value moves toward its target.
+            discount (float): The weight of the value of the next position.
+            exploration (float): The share of random moves.
+
+        Returns:
+            int: The number of moves played.
+        """
+        rng = self.rng
+        values = self.values.reshape(STATES, CELLS)
+        limited = self.variant == 'limited'
+        blind = self.variant == 'blind'
+
+        boards = np.zeros((games, CELLS), dtype=np.int8)
+        movers = rng.choice(np.array([X_MARK, O_MARK], dtype=np.int8), games)
+        history = np.zeros((games, MAX_TURNS), dtype=np.int8)
+        # The opponent cells each side knows, and the marks placed so far.
+        revealed = np.zeros((games, 2, CELLS), dtype=bool)
+        placed = np.zeros(games, dtype=np.int8)
+        # The last position and move of each game, valued from the next one.
+        last_states = np.full(games, -1, dtype=np.int64)
+        last_moves = np.zeros(games, dtype=np.intp)
+
+        active = np.arange(games)
+        moves = 0
+
+        for turn in range(MAX_TURNS):
+            if not active.size:
+                break
+
+            board = boards[active]
+            mover = movers[active]
+            rows = np.arange(active.size)
+            own = board == mover[:, None]
+            other = board == -mover[:, None]
+            contexts = np.zeros(active.size, dtype=np.int64)
+
+            if blind:
+                sides = (mover == O_MARK).astype(np.intp)
+                known = other & revealed[active, sides]
+                contexts = np.minimum(
+                    other.sum(axis=1) - known.sum(axis=1), CONTEXTS - 1
+                )
+                other = known
+            elif limited and turn >= _KEPT_MARKS:
+                contexts = history[active, turn - _KEPT_MARKS] + np.int64(1)
+
+            states = own @ _POWERS + 2 * (other @ _POWERS) + CODES * contexts
+            free = ~(own | other)
+            scores = np.where(free, values[states], -np.inf)
+            self.visited[states] = True
+
+            # The move of the opponent led here, so it's worth minus the
+            # best move of this position.
+            waiting = last_states[active] >= 0
+            before = last_states[active[waiting]]
+            previous = last_moves[active[waiting]]
+            values[before, previous] += learning_rate * (
+                -discount * scores[waiting].max(axis=1)
+                - values[before, previous]
+            )
+
+            # A random free cell for the exploring games, found like in
+            # tic_tac_toe.batch, and the best one for the others.
+            count = free.cumsum(axis=1, dtype=np.int8)
+            ranks = (rng.random(active.size) * count[:, -1]).astype(np.int8)
+            cells = np.where(
+                rng.random(active.size) < exploration,
+                (count > ranks[:, None]).argmax(axis=1),
+                scores.argmax(axis=1),
+            )
+
+            if limited and turn >= _KEPT_MARKS:
+                board[rows, history[active, turn - _KEPT_MARKS]] = 0
+
+            # Only a blind move can hit a taken cell, which loses the turn
+            # and shows the cell.
+            valid = board[rows, cells] == 0
+            board[rows[valid], cells[valid]] = mover[valid]
+            if blind:
+                lost = ~valid
+                revealed[active[lost], sides[lost], cells[lost]] = True
+                shown = valid & (placed[active] < 2)
+                revealed[active[shown], 0, cells[shown]] = True
+                revealed[active[shown], 1, cells[shown]] = True
+            placed[active] += valid
+            boards[active] = board
+            history[active, turn] = cells
+            moves += active.size
+
+            won = valid & (
+                (board[:, LINES] == mover[:, None, None])
+                .all(axis=2)
+                .any(axis=1)
+            )
+            finished = won | (turn == MAX_TURNS - 1)
+            if not limited:
+                finished |= (board != 0).all(axis=1)
+
+            ended, played = states[finished], cells[finished]
+            values[ended, played] += learning_rate * (
+                won[finished] - values[ended, played]
+            )
+
+            last_states[active] = states
+            last_moves[active] = cells
+            movers[active] = -mover
+            active = active[~finished]
+
+        self.games += games
+
+        return moves
+
+
+def checkpoint_path(variant: str, folder: Path | None = None) -> Path:
+    """
+    Get the checkpoint file of a variant.
+
+    Args:
+        variant (str): One of VARIANTS.
+        folder (Path | None): The directory of the checkpoints. Defaults to
+            the directory of the policies.
+
+    Returns:
+        Path: The checkpoint file.
+    """
+    return (folder or directory()) / f'{variant}.npz'
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description='Train the LEARNED IA level by self-play.'
+    )
+    parser.add_argument('--variant', choices=VARIANTS, default='classic')
+    parser.add_argument(
+        '--games',
+        type=int,
+        default=100_000,
+        help='number of self-play games (default: 100000)',
+    )
+    parser.add_argument(
+        '--checkpoint-every',
+        type=int,
+        default=50_000,
+        metavar='GAMES',
+        help='games between checkpoints (default: 50000)',
+    )
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument(
+        '--learning-rate', type=float, default=DEFAULT_LEARNING_RATE
+    )
+    parser.add_argument('--discount', type=float, default=DEFAULT_DISCOUNT)
+    parser.add_argument(
+        '--exploration', type=float, default=DEFAULT_EXPLORATION
+    )
+    parser.add_argument(
+        '--directory',
+        type=Path,
+        help='where to write the checkpoints (default: $TIC_TAC_TOE_LEARNED '
+        'or ~/.cache/tic_tac_toe/learned)',
+    )
+    parser.add_argument(
+        '--fresh',
+        action='store_true',
+        help='start from an untrained table instead of the checkpoint',
+    )
+    parser.add_argument('--seed', type=int)
+    args = parser.parse_args(argv)
+
+    learner = (
+        Learner(args.variant, seed=args.seed)
+        if args.fresh
+        else Learner.load(args.variant, args.directory, args.seed)
+    )
+    start = perf_counter()
+    moves = 0
+
+    for done in range(0, args.games, args.checkpoint_every):
+        games = min(args.checkpoint_every, args.games - done)
+        # The exploration keeps going down across checkpoints.
+        first, last = (
+            args.exploration
+            + (FINAL_EXPLORATION - args.exploration) * played / args.games
+            for played in (done, done + games)
+        )
+        moves += learner.train(
+            games,
+            batch_size=args.batch_size,
+            learning_rate=args.learning_rate,
+            discount=args.discount,
+            exploration=first,
+            final_exploration=last,
+        )
+        path = learner.save(args.directory)
+        seconds = perf_counter() - start
+        print(
+            f'{learner.games} games, {moves / seconds:,.0f} moves/s, '
+            f'{learner.visited.sum()} positions, saved to {path}'
+        )
+
+
+if __name__ == '__main__':
+    main()